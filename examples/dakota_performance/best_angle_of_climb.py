@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 import numpy.typing as npt
 
@@ -7,9 +9,10 @@ from the_bootstrap_approach.dataplate import DataPlate
 from the_bootstrap_approach.equations import density_altitude, scale_v_speed_by_weight
 from the_bootstrap_approach.mixture import Mixture
 from the_bootstrap_approach.performance import (
-    bootstrap_cruise_performance_table,
+    bootstrap_cruise_performance_search,
     ByKCASRowIndex,
     by_altitude_profile,
+    best_angle_of_climb_row,
     PerformanceProfile,
 )
 
@@ -17,7 +20,11 @@ from the_bootstrap_approach.performance import (
 def best_angle_of_climb(
     dataplate: DataPlate, gross_aircraft_weight: float, isa_diff: float = 0
 ) -> PerformanceProfile:
-    def func(pressure_altitude: float, oat_f: float) -> npt.NDArray[np.float64]:
+    def func(
+        pressure_altitude: float,
+        oat_f: float,
+        hint: Optional[npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         mixture = Mixture.BEST_POWER
 
         # Below 5,000' DA (~85% Power), we need to use a full rich mixture.
@@ -38,22 +45,24 @@ def best_angle_of_climb(
             ias_to_cas(dataplate, 65), 3000, gross_aircraft_weight
         )
 
-        table = bootstrap_cruise_performance_table(
+        return bootstrap_cruise_performance_search(
             dataplate,
             operating_conditions,
+            best_angle_of_climb_row,
             stall_speed,
             100,
-            0.1,
+            # VX is interpolated between grid points, so a coarse step is as
+            # accurate as a fine one.
+            2,
+            # Vx moves only slightly from one altitude to the next.
+            hint=None if hint is None else hint[ByKCASRowIndex.KCAS],
+            window=6,
         )
 
-        aoc = table[:, ByKCASRowIndex.ANGLE_OF_CLIMB]
-        index_of_highest_aoc = aoc.argmax()
-        return table[index_of_highest_aoc]
-
     return PerformanceProfile(
         f"Best Angle of Climb {gross_aircraft_weight} lbf, ISA{isa_diff:+} ℃",
         dataplate,
         gross_aircraft_weight,
         isa_diff,
-        by_altitude_profile(func, isa_diff),
+        by_altitude_profile(func, isa_diff, warm_start=True),
     )
@@ -1,60 +1,21 @@
-from typing import List, Optional
+from typing import Optional
 
-import math
 import numpy as np
 import numpy.typing as npt
 
 from the_bootstrap_approach.airspeed_calibration import ias_to_cas
-from the_bootstrap_approach.conditions import (
-    FullThrottleConditions,
-    PartialThrottleConditions,
-)
 from the_bootstrap_approach.dataplate import DataPlate
-from the_bootstrap_approach.equations import (
-    atmospheric_density,
-    scale_v_speed_by_weight,
-    G,
-    H,
-    relative_atmospheric_density,
-    fts_to_kn,
-)
+from the_bootstrap_approach.equations import scale_v_speed_by_weight
+from the_bootstrap_approach.glide import best_glide_speed
 from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.optimize import optimize_power_setting
 from the_bootstrap_approach.performance import (
     ByKCASRowIndex,
-    bootstrap_cruise_performance_table,
     PerformanceProfile,
     by_altitude_profile,
 )
 
 
-def calculate_best_glide(
-    dataplate: DataPlate,
-    gross_aircraft_weight: float,
-    pressure_altitude: float,
-    oat_f: float,
-) -> float:
-    sigma = relative_atmospheric_density(pressure_altitude, oat_f)
-    rho = atmospheric_density(pressure_altitude, oat_f)
-
-    g = G(
-        rho,
-        dataplate.reference_wing_area,
-        dataplate.parasite_drag_coefficient,
-    )
-
-    h = H(
-        gross_aircraft_weight,
-        rho,
-        dataplate.reference_wing_area,
-        dataplate.airplane_efficiency_factor,
-        dataplate.wing_aspect_ratio,
-    )
-
-    u = h / g
-
-    return fts_to_kn(math.sqrt(sigma) * u ** (1 / 4))
-
-
 def best_range(
     dataplate: DataPlate,
     gross_aircraft_weight: float,
@@ -62,88 +23,61 @@ def best_range(
     mixture: Mixture = Mixture.BEST_POWER,
 ) -> PerformanceProfile:
     def func(
-        pressure_altitude: float, oat_f: float
+        pressure_altitude: float,
+        oat_f: float,
+        hint: Optional[npt.NDArray[np.float64]],
     ) -> Optional[npt.NDArray[np.float64]]:
-        best_range_candidates: List[npt.NDArray[np.float64]] = []
-
         # The Dakota stalls at 65 KIAS at max gross weight (3000 lbf).
         stall_speed = scale_v_speed_by_weight(
             ias_to_cas(dataplate, 65), 3000, gross_aircraft_weight
         )
 
-        best_glide_speed = calculate_best_glide(
+        glide_speed = best_glide_speed(
             dataplate, gross_aircraft_weight, pressure_altitude, oat_f
         )
 
-        # Lycoming's O-540-J performance data shows that between 2400 and 1800
-        # RPM, you can use any MAP setting below 29 inHg (e.g., full throttle).
-        for rpm in range(1800, 2500, 100):
-            full_throttle_conditions = FullThrottleConditions(
-                dataplate, gross_aircraft_weight, pressure_altitude, oat_f, mixture, rpm
-            )
-
-            for power in range(
-                # TODO: The model gets wonky below ~5% brake horsepower.
-                int(dataplate.rated_full_throttle_engine_power * 0.05),
-                int(full_throttle_conditions.power),
-                550,
-            ):
-                partial_throttle_conditions = PartialThrottleConditions(
-                    dataplate,
-                    gross_aircraft_weight,
-                    pressure_altitude,
-                    oat_f,
-                    mixture,
-                    rpm,
-                    power,
+        setting = optimize_power_setting(
+            dataplate,
+            gross_aircraft_weight,
+            pressure_altitude,
+            oat_f,
+            mixture,
+            ByKCASRowIndex.MPG,
+            # Lycoming's O-540-J performance data shows that between 2400 and 1800
+            # RPM, you can use any MAP setting below 29 inHg (e.g., full throttle).
+            rpm_limits=(1800, 2400),
+            # The optimizer handles the model's floor: it never considers less
+            # than 5% of rated power, below which the model is unreliable.
+            minimum_percent_power=5,
+            # Cruise no slower than stall speed. At altitudes past ~12,000', there
+            # isn't enough power to maintain altitude at the airframe's best glide
+            # speed. In a simplified theory in which propeller efficiency and
+            # specific fuel consumption are constant, best range speed is the
+            # speed for best glide. Our calculations improve realism in that
+            # propeller efficiency varies with air speed, and closely following
+            # the engine manual for the Piper Dakota's Lycoming O-540-J3A5D
+            # engine, c is taken to be only piecewise constant.
+            kcas_range=(stall_speed, glide_speed * 1.10),
+            # The best range power setting moves only slightly from one altitude
+            # to the next, so start from the previous one.
+            initial_setting=(
+                None
+                if hint is None
+                else (
+                    hint[ByKCASRowIndex.RPM],
+                    hint[ByKCASRowIndex.PBHP]
+                    / 100
+                    * dataplate.rated_full_throttle_engine_power,
                 )
+            ),
+        )
 
-                table = bootstrap_cruise_performance_table(
-                    dataplate,
-                    partial_throttle_conditions,
-                    # Start at stall speed. At altitudes past ~12,000', there isn't
-                    # enough power to maintain altitude at the airframe's best glide
-                    # speed.
-                    start=stall_speed,
-                    # In a simplified theory in which propeller efficiency and
-                    # specific fuel consumption are constant, best range speed
-                    # is the speed for best glide. Our calculations improve
-                    # realism in that propeller efficiency varies with air
-                    # speed, and closely following the engine manual for the
-                    # Piper Dakota's Lycoming O-540-J3A5D engine, c is taken
-                    # to be only piecewise constant.
-                    stop=best_glide_speed * 1.10,
-                    step=0.1,
-                )
-
-                roc = table[:, ByKCASRowIndex.RATE_OF_CLIMB]
-                # If all the ROCs are less than 0 ft/min, then the airplane
-                # can't sustain level flight in these conditions.
-                if (roc < 0).all():
-                    continue
-                index_of_highest_roc = roc.argmax()
-
-                # VM (maximum level flight speed) occurs the second time the
-                # excess power curve intersects the X-axis.
-                roc_after_peak = roc[index_of_highest_roc:]
-                index_max_level_flight_speed = (
-                    index_of_highest_roc
-                    + np.where(roc_after_peak > 0, roc_after_peak, np.inf).argmin()
-                )
-
-                best_range_candidates.append(table[index_max_level_flight_speed])
-
-        if len(best_range_candidates) > 0:
-            best_range_candidates = np.array(best_range_candidates)
-            mpg = best_range_candidates[:, ByKCASRowIndex.MPG]
-            index_max_mpg = mpg.argmax()
-
-            return best_range_candidates[index_max_mpg]
+        return None if setting is None else setting.row
 
     return PerformanceProfile(
         f"Best Range, {gross_aircraft_weight} lbf, ISA{isa_diff:+} ℃",
         dataplate,
         gross_aircraft_weight,
         isa_diff,
-        by_altitude_profile(func, isa_diff),
+        by_altitude_profile(func, isa_diff, warm_start=True),
     )
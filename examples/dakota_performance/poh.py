@@ -0,0 +1,251 @@
+"""
+Build the performance chart sections of the Dakota POH (see
+examples/dakota_performance_charts), incrementally, e.g.:
+
+    $ python -m examples.dakota_performance.poh
+
+Each section (one profile at one weight and ISA deviation) is rendered to its
+own .tex fragment, which dakota.performance_charts.tex inputs. A manifest
+records the key each fragment was rendered from: a hash of the dataplate, the
+section's parameters, and the source code that renders it. Only sections whose
+key changed are rendered again, in parallel, and only fragments whose content
+changed are rewritten, so that LaTeX tooling sees unchanged files as unchanged.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import examples.dakota_performance
+import the_bootstrap_approach
+from examples.dakota_performance import (
+    best_angle_of_climb,
+    best_rate_of_climb,
+    cruise_climb,
+)
+from examples.dakota_performance.latex import (
+    best_range_tex,
+    climb_profile_tex,
+    sixty_five_percent_power_thence_wot_tex,
+)
+from examples.n51sw_dataplate import N51SW
+
+GROSS_AIRCRAFT_WEIGHTS = (2250, 2500, 2750, 3000)
+ISA_DIFFS = (-20, -10, 0, 10, 20)
+
+# The POH's sections, in order, by name: their titles and renderers, each a
+# function of gross aircraft weight and ISA deviation.
+SECTIONS: Dict[str, Tuple[str, Callable[[float, float], str]]] = {
+    "best_angle_of_climb": (
+        "Best Angle of Climb",
+        lambda w, isa_diff: climb_profile_tex(best_angle_of_climb(N51SW, w, isa_diff)),
+    ),
+    "best_rate_of_climb": (
+        "Best Rate of Climb",
+        lambda w, isa_diff: climb_profile_tex(best_rate_of_climb(N51SW, w, isa_diff)),
+    ),
+    "cruise_climb": (
+        "Cruise Climb",
+        lambda w, isa_diff: climb_profile_tex(cruise_climb(N51SW, w, isa_diff)),
+    ),
+    "best_range": ("Best Range", best_range_tex),
+    "sixty_five_percent_power": (
+        r"65\% Power Thence Full Throttle",
+        sixty_five_percent_power_thence_wot_tex,
+    ),
+}
+
+_MANIFEST = ".manifest.json"
+
+
+class Fragment(NamedTuple):
+    section: str
+    gross_aircraft_weight: float
+    isa_diff: float
+
+    @property
+    def path(self) -> str:
+        """The fragment's path, relative to the output directory."""
+        return os.path.join(
+            self.section, f"{self.gross_aircraft_weight}_isa{self.isa_diff:+}.tex"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest() -> str:
+    # The model and the example profiles are cheap to hash in full, and any
+    # change to them may change any section.
+    digest = hashlib.sha256()
+
+    for package in (the_bootstrap_approach, examples.dakota_performance):
+        directory = os.path.dirname(package.__file__)
+
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as file:
+                    digest.update(name.encode())
+                    digest.update(file.read())
+
+    with open(sys.modules[N51SW.__module__].__file__, "rb") as file:
+        digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def fragment_key(fragment: Fragment) -> str:
+    """The cache key of a fragment's inputs."""
+    return hashlib.sha256(
+        repr((N51SW.digest(), _source_digest(), tuple(fragment))).encode()
+    ).hexdigest()
+
+
+def render(fragment: Fragment) -> str:
+    _, renderer = SECTIONS[fragment.section]
+
+    return renderer(fragment.gross_aircraft_weight, fragment.isa_diff)
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    try:
+        with open(path) as file:
+            if file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file, then rename it into place, so that an
+    # interrupted build never leaves a truncated fragment behind.
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            file.write(content)
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+    return True
+
+
+def _section_tex(name: str, fragments: Sequence[Fragment], directory: str) -> str:
+    title, _ = SECTIONS[name]
+    inputs = "\n".join(
+        f"\\input{{{os.path.join(directory, fragment.path)}}}" for fragment in fragments
+    )
+
+    return f"\\section{{{title}}}\n\n{inputs}\n"
+
+
+def build(
+    output_directory: str,
+    sections: Sequence[str] = tuple(SECTIONS),
+    gross_aircraft_weights: Sequence[float] = GROSS_AIRCRAFT_WEIGHTS,
+    isa_diffs: Sequence[float] = ISA_DIFFS,
+    processes: Optional[int] = None,
+    tex_directory: Optional[str] = None,
+) -> List[str]:
+    """Render each stale fragment of each section, and write each section's
+    .tex file, which inputs its fragments.
+
+    Args:
+        output_directory: Where to write fragments, section files, and the
+            manifest of fragment keys.
+        processes: The number of processes in which to render stale fragments
+            (by default, one per CPU).
+        tex_directory: The output directory's path as LaTeX sees it, i.e.
+            relative to the main document (by default, as given).
+
+    Returns:
+        The paths, relative to ``output_directory``, of the files written.
+    """
+    manifest_path = os.path.join(output_directory, _MANIFEST)
+    try:
+        with open(manifest_path) as file:
+            manifest: Dict[str, str] = json.load(file)
+    except FileNotFoundError:
+        manifest = {}
+
+    fragments = {
+        name: [
+            Fragment(name, gross_aircraft_weight, isa_diff)
+            for gross_aircraft_weight in gross_aircraft_weights
+            for isa_diff in isa_diffs
+        ]
+        for name in sections
+    }
+    keys = {
+        fragment: fragment_key(fragment)
+        for section_fragments in fragments.values()
+        for fragment in section_fragments
+    }
+    stale = [
+        fragment
+        for fragment, key in keys.items()
+        if manifest.get(fragment.path) != key
+        or not os.path.exists(os.path.join(output_directory, fragment.path))
+    ]
+
+    written = []
+
+    if stale:
+        processes = min(processes or os.cpu_count() or 1, len(stale))
+
+        if processes == 1:
+            rendered = map(render, stale)
+        else:
+            executor = ProcessPoolExecutor(processes)
+            rendered = executor.map(render, stale)
+
+        try:
+            for fragment, content in zip(stale, rendered):
+                if _write_if_changed(
+                    os.path.join(output_directory, fragment.path), content
+                ):
+                    written.append(fragment.path)
+
+                manifest[fragment.path] = keys[fragment]
+        finally:
+            if processes > 1:
+                executor.shutdown()
+
+    for name, section_fragments in fragments.items():
+        path = f"{name}.tex"
+        if _write_if_changed(
+            os.path.join(output_directory, path),
+            _section_tex(name, section_fragments, tex_directory or output_directory),
+        ):
+            written.append(path)
+
+    _write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+
+    return written
+
+
+def main() -> int:
+    written = build(
+        os.path.join(
+            os.path.dirname(__file__), "..", "dakota_performance_charts", "sections"
+        ),
+        tex_directory="sections",
+    )
+
+    print(f"Wrote {len(written)} file(s).")
+    for path in written:
+        print(f"  {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
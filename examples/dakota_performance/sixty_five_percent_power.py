@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 import numpy.typing as npt
 
@@ -11,9 +13,10 @@ from the_bootstrap_approach.equations import scale_v_speed_by_weight
 from the_bootstrap_approach.mixture import Mixture
 from the_bootstrap_approach.performance import (
     ByKCASRowIndex,
-    bootstrap_cruise_performance_table,
+    bootstrap_cruise_performance_search,
     PerformanceProfile,
     by_altitude_profile,
+    max_level_flight_speed_row,
 )
 
 
@@ -23,7 +26,11 @@ def sixty_five_percent_power(
     isa_diff: float = 0,
     mixture: Mixture = Mixture.BEST_POWER,
 ) -> PerformanceProfile:
-    def func(pressure_altitude: float, oat_f: float) -> npt.NDArray[np.float64]:
+    def func(
+        pressure_altitude: float,
+        oat_f: float,
+        hint: Optional[npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         rpm = 2200
 
         full_throttle_conditions = FullThrottleConditions(
@@ -50,33 +57,27 @@ def sixty_five_percent_power(
             ias_to_cas(dataplate, 65), 3000, gross_aircraft_weight
         )
 
-        table = bootstrap_cruise_performance_table(
+        return bootstrap_cruise_performance_search(
             dataplate,
             winner,
+            max_level_flight_speed_row,
             stall_speed,
             # We intuit that we shouldn't see more than about 120 KIAS at 65%
             # power.
             130,
-            0.1,
+            # VM is interpolated between grid points, so a coarse step is as
+            # accurate as a fine one.
+            2,
+            # VM moves only slightly from one altitude to the next, though by
+            # as much as ~8 knots per 1,000' approaching the ceiling.
+            hint=None if hint is None else hint[ByKCASRowIndex.KCAS],
+            window=8,
         )
 
-        roc = table[:, ByKCASRowIndex.RATE_OF_CLIMB]
-        index_of_highest_roc = roc.argmax()
-
-        # VM (maximum level flight speed) occurs the second time the excess
-        # power curve intersects the X-axis.
-        roc_after_peak = roc[index_of_highest_roc:]
-        index_max_level_flight_speed = (
-            index_of_highest_roc
-            + np.where(roc_after_peak > 0, roc_after_peak, np.inf).argmin()
-        )
-
-        return table[index_max_level_flight_speed]
-
     return PerformanceProfile(
         f"65% Power Thence Full Throttle, {gross_aircraft_weight} lbf, ISA{isa_diff:+} ℃",  # noqa
         dataplate,
         gross_aircraft_weight,
         isa_diff,
-        by_altitude_profile(func, isa_diff),
+        by_altitude_profile(func, isa_diff, warm_start=True),
     )
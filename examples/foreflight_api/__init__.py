@@ -23,7 +23,7 @@ def create_profile(
     aircraft_uuid: UUID,
     performance_profile_name: str,
     detailed_performance_model: dict[str, Any],
-) -> None:
+) -> bool:
     try:
         response = requests.post(
             url=f"https://plan.foreflight.com/api/1/aircraft/performance/custom/{account_uuid}",  # noqa
@@ -51,9 +51,13 @@ def create_profile(
         )
         print(f"Response HTTP Status Code: {response.status_code}")
         print(f"Response HTTP Response Body: {response.json()}")
+
+        return response.ok
     except requests.exceptions.RequestException as e:
         print(f"HTTP Request failed: {e}")
 
+        return False
+
 
 def get_aircraft(account_uuid: UUID, aircraft_uuid: UUID) -> Optional[dict[str, Any]]:
     try:
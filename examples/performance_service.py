@@ -0,0 +1,50 @@
+"""
+Serve performance queries about N51SW over HTTP, e.g.:
+
+    $ python -m examples.performance_service 8080
+    $ curl -d '{"dataplate": "N51SW", "kind": "best_rate_of_climb",
+        "gross_aircraft_weight": 3000, "isa_diff": 0}' localhost:8080/profile
+"""
+
+import asyncio
+import sys
+
+from examples.dakota_performance.best_angle_of_climb import best_angle_of_climb
+from examples.dakota_performance.best_range import best_range
+from examples.dakota_performance.best_rate_of_climb import best_rate_of_climb
+from examples.dakota_performance.cruise_climb import cruise_climb
+from examples.dakota_performance.sixty_five_percent_power import (
+    sixty_five_percent_power,
+)
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.service import PerformanceService
+
+
+async def serve(port: int) -> None:
+    service = PerformanceService(
+        {"N51SW": N51SW},
+        profiles={
+            "best_angle_of_climb": best_angle_of_climb,
+            "best_range": best_range,
+            "best_rate_of_climb": best_rate_of_climb,
+            "cruise_climb": cruise_climb,
+            "sixty_five_percent_power": sixty_five_percent_power,
+        },
+    )
+    port = await service.start("127.0.0.1", port)
+    print(f"Serving on http://127.0.0.1:{port}/")
+
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main() -> int:
+    asyncio.run(serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8080))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
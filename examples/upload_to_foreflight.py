@@ -2,10 +2,18 @@
 Small CLI to create custom ForeFlight performance profiles using Bootstrap
 Approach data. Requires that you extract cookies from a plan.foreflight.com
 browser session.
+
+Pass --incremental to upload only the profiles whose content changed since the
+last sync, as recorded in a local state file (FOREFLIGHT_SYNC_STATE, by default
+.foreflight_sync.json).
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
+import tempfile
 from typing import Optional, Any
 from uuid import UUID
 
@@ -16,12 +24,17 @@ from examples.dakota_performance import cruise_climb, sixty_five_percent_power
 from examples.dakota_performance.best_range import best_range
 from examples.foreflight_api import get_aircraft, create_profile
 from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.airspeed_calibration import ias_to_cas
 from the_bootstrap_approach.equations import (
     british_standard_temperature,
     fuel_gal_to_lbf,
 )
 from the_bootstrap_approach.mixture import Mixture
-from the_bootstrap_approach.performance import ByAltitudeRowIndex, PerformanceProfile
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    PerformanceProfile,
+    descent_profiles,
+)
 
 
 def search_profiles_for_matching_name(
@@ -40,17 +53,14 @@ def search_profiles_for_matching_name(
     return None
 
 
-def create_foreflight_profile(
-    account_uuid: UUID,
-    aircraft_oid: str,
-    aircraft_uuid: UUID,
+def foreflight_detailed_performance_model(
     performance_profile_name: str,
     climb_profile_name: str,
     climb_profile: npt.NDArray[npt.NDArray[np.float64]],
     cruise_profile: npt.NDArray[npt.NDArray[np.float64]],
     descent_profile_name: str,
-    descent_speed_ias: int,
-) -> None:
+    descent_profile: npt.NDArray[npt.NDArray[np.float64]],
+) -> dict[str, Any]:
     climb_profile_high_index: int = len(climb_profile) - 1
     climb_ceiling: float = climb_profile[climb_profile_high_index][
         ByAltitudeRowIndex.PRESSURE_ALTITUDE
@@ -74,12 +84,13 @@ def create_foreflight_profile(
     for (
         cruise_row,
         climb_row,
-    ) in zip(cruise_profile, climb_profile):
+        descent_row,
+    ) in zip(cruise_profile, climb_profile, descent_profile):
         pressure_altitude = cruise_row[ByAltitudeRowIndex.PRESSURE_ALTITUDE]
 
         if pressure_altitude <= aircraft_ceiling:
             detailed_performance_model["points"][pressure_altitude] = {
-                "descentSpeed_kias": descent_speed_ias,
+                "descentSpeed_kias": descent_row[ByAltitudeRowIndex.KIAS],
                 "fuelFlow_pph": fuel_gal_to_lbf(
                     cruise_row[ByAltitudeRowIndex.GPH],
                     british_standard_temperature(pressure_altitude),
@@ -107,32 +118,140 @@ def create_foreflight_profile(
     detailed_performance_model["descent"] = {
         "highAlt_ft": climb_ceiling,
         "lowAlt_ft": 0,
-        "fuelFlowHighAlt_pph": detailed_performance_model["points"][aircraft_ceiling][
-            "fuelFlow_pph"
-        ],
+        "fuelFlowHighAlt_pph": fuel_gal_to_lbf(
+            descent_profile[aircraft_ceiling_index][ByAltitudeRowIndex.GPH],
+            british_standard_temperature(aircraft_ceiling),
+        ),
         "name": descent_profile_name,
-        "fuelFlowLowAlt_pph": detailed_performance_model["points"][0]["fuelFlow_pph"],
+        "fuelFlowLowAlt_pph": fuel_gal_to_lbf(
+            descent_profile[0][ByAltitudeRowIndex.GPH], british_standard_temperature(0)
+        ),
     }
 
-    aircraft = get_aircraft(account_uuid, aircraft_uuid)
+    return detailed_performance_model
+
+
+def detailed_performance_model_hash(detailed_performance_model: dict[str, Any]) -> str:
+    """Hash a model's content, independent of key order and float types (NumPy
+    floats serialize as their Python equivalents)."""
+    return hashlib.sha256(
+        json.dumps(detailed_performance_model, sort_keys=True, default=float).encode()
+    ).hexdigest()
+
+
+def load_sync_state(path: str) -> dict[str, dict[str, str]]:
+    """Load the last-synced hashes, by aircraft UUID and profile name."""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
 
+
+def save_sync_state(path: str, state: dict[str, dict[str, str]]) -> None:
+    # Write to a temporary file, then rename it into place, so that an
+    # interrupted sync never leaves a truncated state file behind.
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            json.dump(state, file, indent=2, sort_keys=True)
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def create_foreflight_profile(
+    account_uuid: UUID,
+    aircraft_oid: str,
+    aircraft_uuid: UUID,
+    aircraft: dict[str, Any],
+    performance_profile_name: str,
+    detailed_performance_model: dict[str, Any],
+) -> bool:
     metadata_oid = search_profiles_for_matching_name(aircraft, performance_profile_name)
 
-    create_profile(
+    if not create_profile(
         account_uuid,
         metadata_oid,
         aircraft_oid,
         aircraft_uuid,
         performance_profile_name,
         detailed_performance_model,
-    )
+    ):
+        print(f"Failed to upload {performance_profile_name}.\n")
+        return False
 
     print(
         f"Success! {'Updated' if metadata_oid is not None else 'Created'} {performance_profile_name}.\n"  # noqa
     )
+    return True
+
+
+def sync_foreflight_profiles(
+    account_uuid: UUID,
+    aircraft_oid: str,
+    aircraft_uuid: UUID,
+    detailed_performance_models: dict[str, dict[str, Any]],
+    state_path: Optional[str] = None,
+) -> int:
+    """Upload each model (by profile name), fetching the aircraft only once.
+
+    If ``state_path`` is given, skip the models whose hash matches the one
+    recorded there at the last successful upload, as long as the aircraft still
+    has a profile of that name, and record the new hashes as uploads succeed.
+
+    Returns:
+        The number of profiles that failed to upload.
+    """
+    aircraft = get_aircraft(account_uuid, aircraft_uuid)
+
+    state = load_sync_state(state_path) if state_path is not None else {}
+    synced = state.setdefault(str(aircraft_uuid), {})
+    failures = 0
+
+    for name, detailed_performance_model in detailed_performance_models.items():
+        digest = detailed_performance_model_hash(detailed_performance_model)
+
+        if (
+            state_path is not None
+            and synced.get(name) == digest
+            and search_profiles_for_matching_name(aircraft, name) is not None
+        ):
+            print(f"Unchanged, skipping {name}.")
+            continue
+
+        if not create_foreflight_profile(
+            account_uuid,
+            aircraft_oid,
+            aircraft_uuid,
+            aircraft,
+            name,
+            detailed_performance_model,
+        ):
+            failures += 1
+            continue
+
+        if state_path is not None:
+            synced[name] = digest
+            save_sync_state(state_path, state)
+
+    return failures
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="upload only the profiles that changed since the last sync",
+    )
+    args = parser.parse_args()
+
     account_uuid: UUID = UUID(os.getenv("FOREFLIGHT_ACCOUNT_UUID"))
     aircraft_oid: str = os.getenv("FOREFLIGHT_AIRCRAFT_OID")
     aircraft_uuid: UUID = UUID(os.getenv("FOREFLIGHT_AIRCRAFT_UUID"))
@@ -140,6 +259,25 @@ def main() -> int:
     if None in (account_uuid, aircraft_oid, aircraft_uuid):
         raise Exception("You must configure this script via the environment.")
 
+    # Descend at 137 KIAS and 65% power (or full throttle, once 65% power is no
+    # longer available), for every weight and altitude in one pass.
+    descent_profiles_by_weight = dict(
+        zip(
+            (2250, 2500, 2750, 3000),
+            descent_profiles(
+                N51SW,
+                (2250, 2500, 2750, 3000),
+                np.arange(0, 30000, 1000),
+                ias_to_cas(N51SW, 137),
+                Mixture.BEST_POWER,
+                2200,
+                power=N51SW.rated_full_throttle_engine_power * 0.65,
+            ),
+        )
+    )
+
+    detailed_performance_models: dict[str, dict[str, Any]] = {}
+
     for gross_aircraft_weight in (2250, 2500, 2750, 3000):
         climb_profile: PerformanceProfile = cruise_climb(
             N51SW, gross_aircraft_weight, isa_diff=0
@@ -148,16 +286,14 @@ def main() -> int:
             N51SW, gross_aircraft_weight, isa_diff=0, mixture=Mixture.BEST_POWER
         )
 
-        create_foreflight_profile(
-            account_uuid,
-            aircraft_oid,
-            aircraft_uuid,
-            f"65% Power Thence Full Throttle, {gross_aircraft_weight} lbf",
+        name = f"65% Power Thence Full Throttle, {gross_aircraft_weight} lbf"
+        detailed_performance_models[name] = foreflight_detailed_performance_model(
+            name,
             climb_profile.name,
             climb_profile.data,
             cruise_profile.data,
             "137 KIAS Descent at 65% Power",
-            137,
+            descent_profiles_by_weight[gross_aircraft_weight].data,
         )
 
     for gross_aircraft_weight in (2250, 2500, 2750):
@@ -168,19 +304,29 @@ def main() -> int:
             N51SW, gross_aircraft_weight, isa_diff=0, mixture=Mixture.BEST_ECONOMY
         )
 
-        create_foreflight_profile(
-            account_uuid,
-            aircraft_oid,
-            aircraft_uuid,
-            f"Best Range, {gross_aircraft_weight} lbf",
+        name = f"Best Range, {gross_aircraft_weight} lbf"
+        detailed_performance_models[name] = foreflight_detailed_performance_model(
+            name,
             climb_profile.name,
             climb_profile.data,
             cruise_profile.data,
             "137 KIAS Descent at 65% Power",
-            137,
+            descent_profiles_by_weight[gross_aircraft_weight].data,
         )
 
-    return 0
+    failures = sync_foreflight_profiles(
+        account_uuid,
+        aircraft_oid,
+        aircraft_uuid,
+        detailed_performance_models,
+        (
+            os.getenv("FOREFLIGHT_SYNC_STATE", ".foreflight_sync.json")
+            if args.incremental
+            else None
+        ),
+    )
+
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
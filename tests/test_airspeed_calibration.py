@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from examples.n51sw_dataplate import N51SW
 from the_bootstrap_approach.airspeed_calibration import (
     cas_to_ias,
@@ -74,6 +76,18 @@ class TestAirspeedCalibration(unittest.TestCase):
             ias_to_cas(self.dataplate, self.flaps_extended_ias), self.flaps_extended_cas
         )
 
+    def test_complex_step(self):
+        # Complex steps carry the calibration curve's slope.
+        h = 1e-30
+        slope = (
+            cas_to_ias(self.dataplate, self.maneuvering_3000_cas + 0.5)
+            - cas_to_ias(self.dataplate, self.maneuvering_3000_cas)
+        ) / 0.5
+        ias = cas_to_ias(self.dataplate, np.array([self.maneuvering_3000_cas + h * 1j]))
+
+        self.assertEqual(ias.real[0], self.maneuvering_3000_ias)
+        self.assertAlmostEqual(ias.imag[0] / h, slope)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,32 @@
 import unittest
 import math
 
-from the_bootstrap_approach.conditions import PartialThrottleConditions
+import numpy as np
+
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
 from the_bootstrap_approach.dataplate import DataPlate
-from the_bootstrap_approach.equations import british_standard_temperature
+from the_bootstrap_approach.equations import (
+    british_standard_temperature,
+    c_to_f,
+    metric_standard_temperature,
+)
 from the_bootstrap_approach.mixture import Mixture
 from the_bootstrap_approach.performance import (
+    bootstrap_cruise_performance_search,
     bootstrap_cruise_performance_table,
+    bootstrap_scatter_performance_table,
+    by_altitude_profile,
+    best_angle_of_climb_row,
+    best_rate_of_climb_row,
+    ByAltitudeRowIndex,
     ByKCASRowIndex,
+    interpolate_row,
+    labeled,
+    max_level_flight_speed_row,
+    unlabeled,
 )
 
 
@@ -119,6 +138,369 @@ class TestBootstrapCruisePerformanceTable(unittest.TestCase):
             )
         )
 
+    def test_float32(self):
+        table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 60, 180, 0.5, dtype=np.float32
+        )
+
+        self.assertEqual(table.dtype, np.float32)
+        # KIAS is NaN without a calibration curve.
+        np.testing.assert_array_equal(np.isnan(table), np.isnan(self.table))
+        # The documented loss of accuracy against float64.
+        for column, abs_tol in (
+            (ByKCASRowIndex.KTAS, 10**-2),
+            (ByKCASRowIndex.PROPELLER_EFFICIENCY, 10**-5),
+            (ByKCASRowIndex.RATE_OF_CLIMB, 5 * 10**-2),
+            (ByKCASRowIndex.ANGLE_OF_CLIMB, 10**-4),
+            (ByKCASRowIndex.GPH, 10**-3),
+        ):
+            np.testing.assert_allclose(
+                table[:, column], self.table[:, column], rtol=0, atol=abs_tol
+            )
+
+        adaptive_table = bootstrap_cruise_performance_table(
+            self.dataplate,
+            self.operating_conditions,
+            60,
+            180,
+            2,
+            adaptive=True,
+            dtype=np.float32,
+        )
+        self.assertEqual(adaptive_table.dtype, np.float32)
+
+    def test_labeled(self):
+        records = labeled(self.table)
+
+        self.assertEqual(records.shape, (len(self.table),))
+        self.assertEqual(records.dtype.names, tuple(ByKCASRowIndex.__members__))
+        # Named columns are views of the table, not copies.
+        self.assertTrue(np.shares_memory(records["KTAS"], self.table))
+        np.testing.assert_array_equal(
+            records["KTAS"], self.table[:, ByKCASRowIndex.KTAS]
+        )
+
+        table = unlabeled(records[10:20])
+        self.assertTrue(np.shares_memory(table, self.table))
+        np.testing.assert_array_equal(table, self.table[10:20])
+
+        with self.assertRaises(ValueError):
+            labeled(self.table, ByAltitudeRowIndex)
+
+    def test_by_altitude_row_index(self):
+        self.assertEqual(ByAltitudeRowIndex.PRESSURE_ALTITUDE, 0)
+        for member in ByKCASRowIndex:
+            self.assertEqual(ByAltitudeRowIndex[member.name], member + 1)
+
+    def test_adaptive_table(self):
+        adaptive_table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 60, 180, 2, adaptive=True
+        )
+        dense_table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 60, 180, 0.001
+        )
+
+        self.assertLess(len(adaptive_table), len(dense_table) / 100)
+        self.assertTrue(np.all(np.diff(adaptive_table[:, ByKCASRowIndex.KCAS]) > 0))
+
+        # VY and VX are resolved to within the default tolerance of 0.01 knots.
+        for column in (ByKCASRowIndex.RATE_OF_CLIMB, ByKCASRowIndex.ANGLE_OF_CLIMB):
+            self.assertTrue(
+                math.isclose(
+                    adaptive_table[adaptive_table[:, column].argmax()][
+                        ByKCASRowIndex.KCAS
+                    ],
+                    dense_table[dense_table[:, column].argmax()][ByKCASRowIndex.KCAS],
+                    # of 2 significant digits
+                    abs_tol=10**-2,
+                )
+            )
+
+        # So is VM, where the rate of climb crosses zero.
+        for table in (adaptive_table, dense_table):
+            roc = table[:, ByKCASRowIndex.RATE_OF_CLIMB]
+            crossing = np.flatnonzero(np.signbit(roc[:-1]) != np.signbit(roc[1:]))
+            self.assertEqual(len(crossing), 1)
+            self.assertLessEqual(
+                table[crossing[0] + 1][ByKCASRowIndex.KCAS]
+                - table[crossing[0]][ByKCASRowIndex.KCAS],
+                0.01 + 10**-6,
+            )
+
+    def test_sub_grid_interpolation(self):
+        coarse_table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 60, 180, 2
+        )
+        dense_table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 60, 180, 0.001
+        )
+
+        # Interpolating a 2-knot table recovers VY, VX, and VM found by brute
+        # force on a 0.001-knot table.
+        for helper, column in (
+            (best_rate_of_climb_row, ByKCASRowIndex.RATE_OF_CLIMB),
+            (best_angle_of_climb_row, ByKCASRowIndex.ANGLE_OF_CLIMB),
+        ):
+            row = helper(coarse_table)
+            dense_row = dense_table[dense_table[:, column].argmax()]
+
+            self.assertTrue(
+                math.isclose(
+                    row[ByKCASRowIndex.KCAS],
+                    dense_row[ByKCASRowIndex.KCAS],
+                    # of 1 significant digits
+                    abs_tol=10**-1,
+                )
+            )
+            self.assertTrue(
+                math.isclose(
+                    row[column],
+                    dense_row[column],
+                    # of 2 significant digits
+                    abs_tol=10**-2,
+                )
+            )
+
+        row = max_level_flight_speed_row(coarse_table)
+        roc = dense_table[:, ByKCASRowIndex.RATE_OF_CLIMB]
+        dense_row = dense_table[np.flatnonzero(roc > 0)[-1]]
+
+        self.assertEqual(row[ByKCASRowIndex.RATE_OF_CLIMB], 0)
+        for column in (ByKCASRowIndex.KCAS, ByKCASRowIndex.KTAS, ByKCASRowIndex.MPG):
+            self.assertTrue(
+                math.isclose(
+                    row[column],
+                    dense_row[column],
+                    # of 2 significant digits
+                    abs_tol=10**-2,
+                )
+            )
+
+        # The whole row is interpolated, and grid points are left alone.
+        np.testing.assert_allclose(
+            row, interpolate_row(coarse_table, row[ByKCASRowIndex.KCAS]), atol=10**-9
+        )
+        np.testing.assert_allclose(
+            interpolate_row(coarse_table, coarse_table[10][ByKCASRowIndex.KCAS]),
+            coarse_table[10],
+        )
+
+    def test_off_map_rows(self):
+        table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 50, 180, 2
+        )
+        # Stand in for rows off the propeller map, at the low-speed end.
+        off_map = table.copy()
+        off_map[:7, 1:] = np.nan
+
+        for helper, column in (
+            (best_rate_of_climb_row, ByKCASRowIndex.RATE_OF_CLIMB),
+            (best_angle_of_climb_row, ByKCASRowIndex.ANGLE_OF_CLIMB),
+            (max_level_flight_speed_row, ByKCASRowIndex.RATE_OF_CLIMB),
+        ):
+            # The NaN rows are skipped, as if they weren't in the table.
+            np.testing.assert_array_equal(helper(off_map), helper(table[7:]))
+
+            # No parabola is fit through a NaN neighbor of the maximum, which
+            # leaves the maximum on the grid.
+            i = table[:, column].argmax()
+            gap = table.copy()
+            gap[i + 1, 1:] = np.nan
+            if helper is not max_level_flight_speed_row:
+                np.testing.assert_array_equal(helper(gap), table[i])
+
+            self.assertIsNone(helper(np.full_like(table, np.nan)))
+
+    def test_no_level_flight(self):
+        table = bootstrap_cruise_performance_table(
+            self.dataplate, self.operating_conditions, 180, 200, 2
+        )
+
+        self.assertIsNone(max_level_flight_speed_row(table))
+
+    def test_warm_started_search(self):
+        def highest_roc(table):
+            return table[table[:, ByKCASRowIndex.RATE_OF_CLIMB].argmax()]
+
+        cold = bootstrap_cruise_performance_search(
+            self.dataplate, self.operating_conditions, highest_roc, 60, 180, 0.5
+        )
+
+        # A good hint finds the same row from a narrow window, and a bad one
+        # falls back to searching the full range.
+        for hint in (cold[ByKCASRowIndex.KCAS] + 1, 170):
+            warm = bootstrap_cruise_performance_search(
+                self.dataplate,
+                self.operating_conditions,
+                highest_roc,
+                60,
+                180,
+                0.5,
+                hint=hint,
+            )
+
+            self.assertTrue(
+                math.isclose(
+                    warm[ByKCASRowIndex.KCAS],
+                    cold[ByKCASRowIndex.KCAS],
+                    # of 6 significant digits
+                    abs_tol=10**-6,
+                )
+            )
+
+    def test_warm_started_profile(self):
+        hints = []
+
+        def func(pressure_altitude, oat_f, hint):
+            hints.append(hint)
+
+            return bootstrap_cruise_performance_table(
+                self.dataplate,
+                FullThrottleConditions(
+                    self.dataplate,
+                    3100,
+                    pressure_altitude,
+                    oat_f,
+                    Mixture.BEST_POWER,
+                    2400,
+                ),
+                80,
+                81,
+                1,
+            )[0]
+
+        profile = by_altitude_profile(func, warm_start=True)
+
+        # Each altitude receives the row returned for the one below it.
+        self.assertIsNone(hints[0])
+        for hint, row in zip(hints[1:], profile):
+            np.testing.assert_array_equal(hint, row[1:])
+
+    def test_scatter_table(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        weight = rng.uniform(2400, 3100, n)
+        pressure_altitude = rng.uniform(0, 12000, n)
+        oat_f = c_to_f(metric_standard_temperature(pressure_altitude) + 10)
+        engine_rpm = rng.uniform(2000, 2400, n)
+        # Some of it more than full throttle can deliver, or none at all.
+        power = rng.uniform(80, 250, n) * 550
+        power[::10] = np.nan
+        kcas = rng.uniform(70, 140, n)
+        mixture = rng.choice(list(Mixture), n)
+
+        table = bootstrap_scatter_performance_table(
+            self.dataplate,
+            mixture,
+            weight,
+            pressure_altitude,
+            engine_rpm,
+            kcas,
+            power=power,
+            oat_f=oat_f,
+        )
+
+        self.assertEqual(table.shape, (n, len(ByKCASRowIndex)))
+        for i in range(n):
+            full_throttle_conditions = FullThrottleConditions(
+                self.dataplate,
+                weight[i],
+                pressure_altitude[i],
+                oat_f[i],
+                mixture[i],
+                engine_rpm[i],
+            )
+            row = bootstrap_cruise_performance_table(
+                self.dataplate,
+                PartialThrottleConditions(
+                    self.dataplate,
+                    weight[i],
+                    pressure_altitude[i],
+                    oat_f[i],
+                    mixture[i],
+                    engine_rpm[i],
+                    np.fmin(power[i], full_throttle_conditions.power),
+                ),
+                kcas[i],
+                kcas[i] + 1,
+                1,
+            )[0]
+
+            np.testing.assert_allclose(table[i], row, rtol=1e-12, equal_nan=True)
+
+        # Scalars are shared by every point, and temperature may be given as a
+        # deviation from ISA instead.
+        isa = bootstrap_scatter_performance_table(
+            self.dataplate,
+            Mixture.BEST_POWER,
+            3100,
+            pressure_altitude,
+            2400,
+            kcas,
+            isa_diff=10,
+            dtype=np.float32,
+        )
+        full_throttle = bootstrap_scatter_performance_table(
+            self.dataplate,
+            Mixture.BEST_POWER,
+            3100,
+            pressure_altitude,
+            2400,
+            kcas,
+            oat_f=oat_f,
+        )
+
+        self.assertEqual(isa.dtype, np.float32)
+        np.testing.assert_allclose(isa, full_throttle, rtol=1e-4, atol=1e-3)
+
+        with self.assertRaises(ValueError):
+            bootstrap_scatter_performance_table(
+                self.dataplate, ["BEST_POWER"], 3100, 8000, 2400, 100
+            )
+
+    def test_scatter_table_off_chart(self):
+        # A valid point, points below and above the propeller chart's curves,
+        # and one with a NaN input, in one call.
+        rated_power = self.dataplate.rated_full_throttle_engine_power
+        engine_rpm = np.array([2300, 2300, 1000, 2300])
+        power = np.array([0.6, 0.02, 1, 0.6]) * rated_power
+        kcas = np.array([100, 100, 100, np.nan])
+
+        for mode in ("exact", "surface"):
+            table = bootstrap_scatter_performance_table(
+                self.dataplate,
+                Mixture.BEST_POWER,
+                2800,
+                8000,
+                engine_rpm,
+                kcas,
+                power=power,
+                propeller_efficiency_mode=mode,
+            )
+
+            columns = [
+                ByKCASRowIndex.PROPELLER_EFFICIENCY,
+                ByKCASRowIndex.THRUST,
+                ByKCASRowIndex.RATE_OF_CLIMB,
+            ]
+            self.assertFalse(np.isnan(table[0, columns]).any())
+            self.assertTrue(np.isnan(table[1:, columns]).all())
+            # The valid point is unaffected by the others.
+            np.testing.assert_allclose(
+                table[0],
+                bootstrap_scatter_performance_table(
+                    self.dataplate,
+                    Mixture.BEST_POWER,
+                    2800,
+                    8000,
+                    2300,
+                    100,
+                    power=power[0],
+                    propeller_efficiency_mode=mode,
+                ),
+                rtol=1e-12,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
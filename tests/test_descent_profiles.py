@@ -0,0 +1,149 @@
+import unittest
+
+import math
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import PartialThrottleConditions
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+    descent_profiles,
+    time_fuel_distance,
+)
+
+
+class TestDescentProfiles(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+        self.gross_aircraft_weights = (2250, 3000)
+        self.pressure_altitudes = np.arange(0, 12000, 1000)
+
+        pass
+
+    def test_rate_of_descent(self):
+        # At 110 KCAS, 500 ft/min down is achievable from 1000 ft up without
+        # running into either power limit. At sea level, the power it takes falls
+        # below the propeller chart's lowest curve, so the descent is as steep as
+        # the least power on the chart allows.
+        for profile in descent_profiles(
+            self.dataplate,
+            self.gross_aircraft_weights,
+            self.pressure_altitudes,
+            110,
+            Mixture.BEST_POWER,
+            2200,
+            rate_of_descent=500,
+        ):
+            self.assertFalse(np.isnan(profile.data).any())
+            self.assertGreater(profile.data[0, ByAltitudeRowIndex.RATE_OF_CLIMB], -500)
+
+            for row in profile.data[1:]:
+                self.assertTrue(
+                    math.isclose(
+                        row[ByAltitudeRowIndex.RATE_OF_CLIMB],
+                        -500,
+                        # of 1 significant digits
+                        abs_tol=10**-1,
+                    )
+                )
+
+            for total in time_fuel_distance(profile.data):
+                self.assertTrue(np.isfinite(total).all())
+
+    def test_matches_cruise_performance_table(self):
+        # A descent at a fixed power is just one row of a cruise performance
+        # table, evaluated for every altitude and weight at once.
+        power = self.dataplate.rated_full_throttle_engine_power * 0.45
+
+        for profile in descent_profiles(
+            self.dataplate,
+            self.gross_aircraft_weights,
+            self.pressure_altitudes,
+            120,
+            Mixture.BEST_POWER,
+            2200,
+            power=power,
+        ):
+            for row in profile.data:
+                pressure_altitude = row[ByAltitudeRowIndex.PRESSURE_ALTITUDE]
+
+                table = bootstrap_cruise_performance_table(
+                    self.dataplate,
+                    PartialThrottleConditions(
+                        self.dataplate,
+                        profile.gross_aircraft_weight,
+                        pressure_altitude,
+                        c_to_f(metric_standard_temperature(pressure_altitude)),
+                        Mixture.BEST_POWER,
+                        2200,
+                        power,
+                    ),
+                    120,
+                    121,
+                    1,
+                )
+
+                np.testing.assert_allclose(row[1:], table[0])
+                self.assertLess(table[0][ByKCASRowIndex.RATE_OF_CLIMB], 0)
+
+    def test_records(self):
+        profiles = descent_profiles(
+            self.dataplate,
+            self.gross_aircraft_weights,
+            self.pressure_altitudes,
+            120,
+            Mixture.BEST_POWER,
+            2200,
+            rate_of_descent=500,
+        )
+
+        for profile in profiles:
+            self.assertTrue(np.shares_memory(profile.records, profile.data))
+            np.testing.assert_array_equal(
+                profile.records["PRESSURE_ALTITUDE"], self.pressure_altitudes
+            )
+
+        # Labeled profiles concatenate along altitude.
+        records = np.concatenate([profile.records for profile in profiles])
+        self.assertEqual(len(records), 2 * len(self.pressure_altitudes))
+        np.testing.assert_array_equal(
+            records["GPH"][len(self.pressure_altitudes) :],
+            profiles[1].data[:, ByAltitudeRowIndex.GPH],
+        )
+
+    def test_both_targets(self):
+        with self.assertRaises(ValueError):
+            descent_profiles(
+                self.dataplate,
+                self.gross_aircraft_weights,
+                self.pressure_altitudes,
+                110,
+                Mixture.BEST_POWER,
+                2200,
+                rate_of_descent=500,
+                power=100 * 550,
+            )
+
+    def test_time_fuel_distance(self):
+        profile = np.zeros((11, len(ByAltitudeRowIndex)))
+        profile[:, ByAltitudeRowIndex.PRESSURE_ALTITUDE] = np.arange(0, 11000, 1000)
+        profile[:, ByAltitudeRowIndex.RATE_OF_CLIMB] = -500
+        profile[:, ByAltitudeRowIndex.KTAS] = 120
+        profile[:, ByAltitudeRowIndex.GPH] = 9
+
+        minutes, gallons, nautical_miles = time_fuel_distance(profile)
+
+        # 10,000 ft at 500 ft/min takes 20 minutes, burning 3 gal at 9 gph and
+        # covering 40 NM at 120 KTAS.
+        self.assertAlmostEqual(minutes[-1], 20)
+        self.assertAlmostEqual(gallons[-1], 3)
+        self.assertAlmostEqual(nautical_miles[-1], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import math
+import unittest
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import FullThrottleConditions
+from the_bootstrap_approach.envelope import flight_envelope, power_curves
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    best_angle_of_climb_row,
+    best_rate_of_climb_row,
+    bootstrap_cruise_performance_table,
+    max_level_flight_speed_row,
+)
+
+
+class TestFlightEnvelope(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+        self.gross_aircraft_weights = (2250, 3000)
+        self.pressure_altitudes = np.arange(0, 26000, 500)
+        self.curves = power_curves(
+            self.dataplate,
+            self.gross_aircraft_weights,
+            self.pressure_altitudes,
+            np.arange(40, 160, 0.5),
+        )
+        self.envelope = flight_envelope(self.curves)
+
+        pass
+
+    def test_matches_tables(self):
+        for i, gross_aircraft_weight in enumerate(self.gross_aircraft_weights):
+            for j in (0, 10, 20, 30):
+                pressure_altitude = self.pressure_altitudes[j]
+                table = bootstrap_cruise_performance_table(
+                    self.dataplate,
+                    FullThrottleConditions(
+                        self.dataplate,
+                        gross_aircraft_weight,
+                        pressure_altitude,
+                        c_to_f(metric_standard_temperature(pressure_altitude)),
+                        Mixture.BEST_POWER,
+                        2400,
+                    ),
+                    40,
+                    160,
+                    0.5,
+                )
+
+                for expected, actual in (
+                    (
+                        max_level_flight_speed_row(table)[ByKCASRowIndex.KCAS],
+                        self.envelope.maximum_level_flight_kcas[i, j],
+                    ),
+                    (
+                        best_rate_of_climb_row(table)[ByKCASRowIndex.KCAS],
+                        self.envelope.best_rate_of_climb_kcas[i, j],
+                    ),
+                    (
+                        best_rate_of_climb_row(table)[ByKCASRowIndex.RATE_OF_CLIMB],
+                        self.envelope.best_rate_of_climb[i, j],
+                    ),
+                    (
+                        best_angle_of_climb_row(table)[ByKCASRowIndex.KCAS],
+                        self.envelope.best_angle_of_climb_kcas[i, j],
+                    ),
+                ):
+                    self.assertTrue(
+                        math.isclose(
+                            expected,
+                            actual,
+                            # of 6 significant digits
+                            abs_tol=10**-6,
+                        )
+                    )
+
+    def test_ceilings(self):
+        absolute_ceiling = self.envelope.absolute_ceiling
+        service_ceiling = self.envelope.service_ceiling
+
+        # Heavier airplanes have lower ceilings, and the service ceiling (100
+        # ft/min) lies below the absolute ceiling.
+        self.assertGreater(absolute_ceiling[0], absolute_ceiling[1])
+        self.assertTrue((service_ceiling < absolute_ceiling).all())
+
+        # Above the absolute ceiling, there's no level flight.
+        above = self.pressure_altitudes > absolute_ceiling[1]
+        self.assertTrue(
+            np.isnan(self.envelope.maximum_level_flight_kcas[1, above]).all()
+        )
+        self.assertFalse(
+            np.isnan(self.envelope.maximum_level_flight_kcas[1, ~above]).any()
+        )
+
+    def test_stall_speed(self):
+        envelope = flight_envelope(self.curves, stall_kcas=(57, 65.5))
+
+        self.assertTrue((envelope.minimum_level_flight_kcas[0, :10] == 57).all())
+        self.assertTrue((envelope.minimum_level_flight_kcas[1, :10] == 65.5).all())
@@ -18,6 +18,8 @@ from the_bootstrap_approach.equations import (
     british_standard_temperature,
     relative_temperature,
     relative_pressure,
+    tas,
+    cas,
 )
 
 
@@ -148,6 +150,66 @@ class TestEquations(unittest.TestCase):
             1.51,
         )
 
+    def test_tas_cas_arrays(self):
+        sigma = relative_atmospheric_density(
+            np.array([0, 8500]), british_standard_temperature(np.array([0, 8500]))
+        )
+
+        np.testing.assert_allclose(
+            tas(np.array([100, 100]), sigma), [100, 113.67], 1e-4
+        )
+        np.testing.assert_allclose(cas(tas(np.array([100, 100]), sigma), sigma), 100)
+
+    def test_scalar_fast_path(self):
+        # Plain Python scalars never touch NumPy.
+        self.assertIs(type(relative_pressure(8500)), float)
+        self.assertIs(type(tas(100, 0.7739)), float)
+
+    def test_broadcasting(self):
+        sigma = relative_atmospheric_density(
+            np.array([[0], [8500]]), np.array([59, 28.7, 0])
+        )
+
+        self.assertEqual(sigma.shape, (2, 3))
+        self.assertEqual(
+            relative_atmospheric_density(8500, 28.7),
+            sigma[1, 1],
+        )
+        np.testing.assert_array_equal(
+            relative_pressure([0, 8500]), relative_pressure(np.array([0, 8500]))
+        )
+
+    def test_dtype_preservation(self):
+        for dtype in (np.float32, np.float64):
+            pressure_altitude = np.array([0, 8500], dtype=dtype)
+
+            self.assertEqual(relative_pressure(pressure_altitude).dtype, dtype)
+            self.assertEqual(
+                atmospheric_density(
+                    pressure_altitude, british_standard_temperature(pressure_altitude)
+                ).dtype,
+                dtype,
+            )
+            self.assertEqual(type(relative_pressure(dtype(8500))), dtype)
+
+        # Integer inputs still yield floating-point results.
+        self.assertEqual(relative_pressure(np.array([0, 8500])).dtype, np.float64)
+
+    def test_out(self):
+        out = np.empty(2)
+
+        result = relative_pressure(np.array([0, 8500]), out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_allclose(out, [1, 0.7287], atol=10**-4)
+
+        # A scalar can be broadcast into a buffer, too.
+        altitude_power_dropoff_factor(1, 0.12, out=out)
+        np.testing.assert_array_equal(out, [1, 1])
+
+        with self.assertRaises(TypeError):
+            relative_pressure(np.array([0.5, 1.5]), out=np.empty(2, dtype=int))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+import importlib.util
+import os
+import tempfile
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.export import (
+    grid_columns,
+    load_arrow,
+    load_npz,
+    load_parquet,
+    load_profile_npz,
+    save_arrow,
+    save_npz,
+    save_parquet,
+    save_profile_npz,
+    table_columns,
+)
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    descent_profiles,
+)
+from the_bootstrap_approach.sweep import parallel_grid
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        (self.profile,) = descent_profiles(
+            N51SW,
+            (2750,),
+            np.arange(0, 12000, 1000),
+            120,
+            Mixture.BEST_POWER,
+            2200,
+            rate_of_descent=500,
+        )
+
+        pass
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_profile_npz(self):
+        save_profile_npz(self.path("profile.npz"), self.profile)
+
+        columns, metadata = load_npz(self.path("profile.npz"))
+        self.assertEqual(list(columns), [member.name for member in ByAltitudeRowIndex])
+        # Loaded without a copy.
+        self.assertIsInstance(columns["KTAS"], np.memmap)
+        np.testing.assert_array_equal(
+            columns["KTAS"], self.profile.data[:, ByAltitudeRowIndex.KTAS]
+        )
+        self.assertEqual(metadata["name"], self.profile.name)
+        self.assertEqual(metadata["configuration"], N51SW.configuration)
+
+        profile = load_profile_npz(self.path("profile.npz"), N51SW)
+        self.assertEqual(profile.name, self.profile.name)
+        self.assertEqual(profile.gross_aircraft_weight, 2750)
+        np.testing.assert_array_equal(profile.data, self.profile.data)
+
+    def test_grid_npz(self):
+        grid = {
+            "gross_aircraft_weight": [2500, 3000],
+            "pressure_altitude": np.arange(0, 10000, 1000),
+            "engine_rpm": [2300, 2700],
+            "kcas": np.arange(60, 180, 1),
+        }
+        columns = (ByKCASRowIndex.RATE_OF_CLIMB, ByKCASRowIndex.GPH)
+
+        with parallel_grid(N51SW, Mixture.BEST_POWER, grid, columns, processes=1) as r:
+            save_npz(self.path("grid.npz"), *grid_columns(r.data, r.axes, r.columns))
+            data = r.data.copy()
+
+        loaded, metadata = load_npz(self.path("grid.npz"))
+        self.assertEqual(list(loaded), ["RATE_OF_CLIMB", "GPH"])
+        np.testing.assert_array_equal(loaded["GPH"], data[..., 1])
+        self.assertEqual(metadata["axes"]["engine_rpm"], [2300, 2700])
+
+    def test_compressed_npz(self):
+        np.savez_compressed(self.path("compressed.npz"), KCAS=np.arange(10.0))
+
+        with self.assertRaises(ValueError):
+            load_npz(self.path("compressed.npz"))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requires pyarrow")
+    def test_arrow_and_parquet(self):
+        table = self.profile.data[:, 1:]
+
+        for save, load, name in (
+            (save_arrow, load_arrow, "table.arrow"),
+            (save_parquet, load_parquet, "table.parquet"),
+        ):
+            save(self.path(name), table_columns(table), {"name": "descent"})
+            columns, metadata = load(self.path(name))
+
+            self.assertEqual(list(columns), [member.name for member in ByKCASRowIndex])
+            np.testing.assert_array_equal(
+                np.column_stack(list(columns.values())), table
+            )
+            self.assertEqual(metadata, {"name": "descent"})
+
+
+if __name__ == "__main__":
+    unittest.main()
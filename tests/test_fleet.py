@@ -0,0 +1,264 @@
+import copy
+import unittest
+
+import numpy as np
+
+from examples.dakota_performance import sixty_five_percent_power
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.airspeed_calibration import cas_to_ias, ias_to_cas
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.fleet import Fleet, fleet_profiles
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    best_rate_of_climb_row,
+    bootstrap_cruise_performance_table,
+    max_level_flight_speed_row,
+)
+
+
+def variant(**parameters):
+    dataplate = copy.copy(N51SW)
+    dataplate.__dict__.update(parameters)
+
+    return dataplate
+
+
+class TestFleet(unittest.TestCase):
+    def setUp(self):
+        self.dataplates = [
+            N51SW,
+            variant(
+                parasite_drag_coefficient=0.031,
+                airplane_efficiency_factor=0.72,
+                # A shorter calibration curve.
+                asi_calibration_curve=N51SW.asi_calibration_curve[5:20] + 1,
+            ),
+            variant(propeller_diameter=76 / 12, asi_calibration_curve=None),
+        ]
+        self.fleet = Fleet(self.dataplates)
+
+        pass
+
+    def test_airspeed_calibration(self):
+        kcas = np.arange(40, 180, 0.5)
+
+        for dataplate, kias, cas in zip(
+            self.dataplates,
+            cas_to_ias(self.fleet, kcas),
+            ias_to_cas(self.fleet, kcas),
+        ):
+            np.testing.assert_allclose(kias, cas_to_ias(dataplate, kcas), rtol=1e-12)
+            np.testing.assert_allclose(cas, ias_to_cas(dataplate, kcas), rtol=1e-12)
+
+    def test_matches_each_dataplate(self):
+        for conditions in (
+            lambda dataplate: FullThrottleConditions(
+                dataplate, 2750, 6000, 40, Mixture.BEST_POWER, 2400
+            ),
+            lambda dataplate: PartialThrottleConditions(
+                dataplate, 2750, 6000, 40, Mixture.BEST_ECONOMY, 2200, 120 * 550
+            ),
+        ):
+            tables = bootstrap_cruise_performance_table(
+                self.fleet, conditions(self.fleet), 60, 160, 1
+            )
+
+            self.assertEqual(tables.shape, (3, 100, 17))
+
+            for dataplate, table in zip(self.dataplates, tables):
+                np.testing.assert_allclose(
+                    table,
+                    bootstrap_cruise_performance_table(
+                        dataplate, conditions(dataplate), 60, 160, 1
+                    ),
+                    rtol=1e-12,
+                )
+
+    def test_profiles(self):
+        pressure_altitudes = np.arange(0, 30000, 1000)
+
+        for dataplate, profile in zip(
+            self.dataplates,
+            fleet_profiles(
+                self.fleet,
+                3000,
+                pressure_altitudes,
+                np.arange(60, 140, 0.5),
+                Mixture.BEST_POWER,
+                2400,
+                best_rate_of_climb_row,
+            ),
+        ):
+            self.assertIs(profile.dataplate, dataplate)
+            self.assertGreater(len(profile.data), 10)
+
+            for row in profile.data:
+                pressure_altitude = row[ByAltitudeRowIndex.PRESSURE_ALTITUDE]
+                expected = best_rate_of_climb_row(
+                    bootstrap_cruise_performance_table(
+                        dataplate,
+                        FullThrottleConditions(
+                            dataplate,
+                            3000,
+                            pressure_altitude,
+                            c_to_f(metric_standard_temperature(pressure_altitude)),
+                            Mixture.BEST_POWER,
+                            2400,
+                        ),
+                        60,
+                        140,
+                        0.5,
+                    )
+                )
+
+                np.testing.assert_allclose(
+                    row[ByAltitudeRowIndex.KCAS :], expected, rtol=1e-9
+                )
+
+    def test_percent_power_profiles(self):
+        # Each airframe flies at 65% of its own rated power, thence full throttle.
+        dataplates = [N51SW, N51SW.replace(rated_full_throttle_engine_horsepower=260)]
+
+        for dataplate, profile in zip(
+            dataplates,
+            fleet_profiles(
+                Fleet(dataplates),
+                2750,
+                np.arange(0, 30000, 1000),
+                np.arange(60, 180, 0.5),
+                Mixture.BEST_POWER,
+                2200,
+                max_level_flight_speed_row,
+                percent_power=65,
+            ),
+        ):
+            expected = sixty_five_percent_power(dataplate, 2750)
+
+            self.assertEqual(len(profile.data), len(expected.data))
+            # VM is interpolated between different grid points.
+            columns = [
+                ByAltitudeRowIndex.PRESSURE_ALTITUDE,
+                ByAltitudeRowIndex.KCAS,
+                ByAltitudeRowIndex.KTAS,
+                ByAltitudeRowIndex.PBHP,
+                ByAltitudeRowIndex.GPH,
+                ByAltitudeRowIndex.MPG,
+            ]
+            np.testing.assert_allclose(
+                profile.data[:, columns], expected.data[:, columns], rtol=5e-3
+            )
+
+    def test_per_altitude_power(self):
+        # E.g., a best-range setting that changes with altitude.
+        pressure_altitudes = np.arange(0, 10000, 1000)
+        engine_rpm = np.linspace(2400, 2200, len(pressure_altitudes))
+        power = np.linspace(150, 120, len(pressure_altitudes)) * 550
+
+        (profile,) = fleet_profiles(
+            Fleet([N51SW]),
+            3000,
+            pressure_altitudes,
+            np.arange(60, 180, 0.5),
+            Mixture.BEST_POWER,
+            engine_rpm,
+            max_level_flight_speed_row,
+            power=power,
+        )
+
+        self.assertEqual(len(profile.data), len(pressure_altitudes))
+        for row, pressure_altitude, rpm, setting in zip(
+            profile.data, pressure_altitudes, engine_rpm, power
+        ):
+            expected = max_level_flight_speed_row(
+                bootstrap_cruise_performance_table(
+                    N51SW,
+                    PartialThrottleConditions(
+                        N51SW,
+                        3000,
+                        pressure_altitude,
+                        c_to_f(metric_standard_temperature(pressure_altitude)),
+                        Mixture.BEST_POWER,
+                        rpm,
+                        setting,
+                    ),
+                    60,
+                    180,
+                    0.5,
+                )
+            )
+
+            np.testing.assert_allclose(
+                row[ByAltitudeRowIndex.KCAS :], expected, rtol=1e-9, atol=1e-9
+            )
+
+        with self.assertRaises(ValueError):
+            fleet_profiles(
+                Fleet([N51SW]),
+                3000,
+                pressure_altitudes,
+                np.arange(60, 180, 0.5),
+                Mixture.BEST_POWER,
+                2200,
+                max_level_flight_speed_row,
+                power=power,
+                percent_power=65,
+            )
+
+
+class TestConfigurations(unittest.TestCase):
+    def setUp(self):
+        self.configurations = [
+            N51SW,
+            N51SW.with_configuration("Flaps 10°", 0.041),
+            N51SW.with_configuration(
+                "Flaps 25°", 0.052, 0.61, N51SW.asi_calibration_curve[:12]
+            ),
+        ]
+        self.fleet = Fleet(self.configurations)
+
+        pass
+
+    def test_replace(self):
+        self.assertEqual(N51SW.replace().digest(), N51SW.digest())
+        self.assertNotEqual(N51SW.replace(wing_span=36).digest(), N51SW.digest())
+        self.assertEqual(
+            N51SW.replace(wing_span=36).wing_aspect_ratio,
+            36**2 / N51SW.reference_wing_area,
+        )
+
+        with self.assertRaises(TypeError):
+            N51SW.replace(wingspan=36)
+
+    def test_by_configuration(self):
+        conditions = FullThrottleConditions(
+            self.fleet, 2750, 0, 59, Mixture.BEST_POWER, 2400
+        )
+        tables = self.fleet.by_configuration(
+            bootstrap_cruise_performance_table(self.fleet, conditions, 60, 120, 1)
+        )
+
+        self.assertEqual(list(tables), ["Flaps Up", "Flaps 10°", "Flaps 25°"])
+        self.assertEqual(self.fleet.index("Flaps 25°"), 2)
+
+        for configuration in self.configurations:
+            np.testing.assert_allclose(
+                tables[configuration.configuration],
+                bootstrap_cruise_performance_table(
+                    configuration,
+                    FullThrottleConditions(
+                        configuration, 2750, 0, 59, Mixture.BEST_POWER, 2400
+                    ),
+                    60,
+                    120,
+                    1,
+                ),
+                rtol=1e-12,
+            )
+
+        with self.assertRaises(KeyError):
+            self.fleet.index("Flaps 40°")
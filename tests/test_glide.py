@@ -0,0 +1,112 @@
+import unittest
+
+import math
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.equations import british_standard_temperature
+from the_bootstrap_approach.glide import (
+    best_glide_speed,
+    glide_ratio,
+    minimum_power_speed,
+    minimum_sink_speed,
+    sink_rate,
+)
+
+
+class TestGlide(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+        self.gross_aircraft_weight = 2800
+        self.pressure_altitude = 6000
+        self.oat_f = british_standard_temperature(6000)
+
+        # Brute force the power-off glide on a 0.001-knot grid.
+        self.kcas = np.arange(50, 120, 0.001)
+        self.sink_rate = sink_rate(
+            self.dataplate,
+            self.gross_aircraft_weight,
+            self.pressure_altitude,
+            self.oat_f,
+            self.kcas,
+        )
+        self.glide_ratio = glide_ratio(
+            self.dataplate,
+            self.gross_aircraft_weight,
+            self.pressure_altitude,
+            self.oat_f,
+            self.kcas,
+        )
+
+        pass
+
+    def test_best_glide_speed(self):
+        self.assertTrue(
+            math.isclose(
+                best_glide_speed(
+                    self.dataplate,
+                    self.gross_aircraft_weight,
+                    self.pressure_altitude,
+                    self.oat_f,
+                ),
+                self.kcas[self.glide_ratio.argmax()],
+                # of 2 significant digits
+                abs_tol=10**-2,
+            )
+        )
+
+    def test_minimum_sink_speed(self):
+        for func in (minimum_power_speed, minimum_sink_speed):
+            self.assertTrue(
+                math.isclose(
+                    func(
+                        self.dataplate,
+                        self.gross_aircraft_weight,
+                        self.pressure_altitude,
+                        self.oat_f,
+                    ),
+                    self.kcas[self.sink_rate.argmin()],
+                    # of 2 significant digits
+                    abs_tol=10**-2,
+                )
+            )
+
+    def test_maximum_glide_ratio(self):
+        # The maximum glide ratio depends on neither altitude nor weight.
+        ratios = glide_ratio(
+            self.dataplate,
+            np.array([[2250], [3000]]),
+            np.array([0, 8000, 16000]),
+            british_standard_temperature(np.array([0, 8000, 16000])),
+            best_glide_speed(
+                self.dataplate,
+                np.array([[2250], [3000]]),
+                np.array([0, 8000, 16000]),
+                british_standard_temperature(np.array([0, 8000, 16000])),
+            ),
+        )
+
+        self.assertEqual(ratios.shape, (2, 3))
+        np.testing.assert_allclose(ratios, self.glide_ratio.max())
+
+    def test_glide_table(self):
+        weights = np.array([2250, 2500, 2750, 3000])[:, np.newaxis]
+        pressure_altitudes = np.arange(0, 20000, 1000)
+        oat_f = british_standard_temperature(pressure_altitudes)
+
+        table = best_glide_speed(self.dataplate, weights, pressure_altitudes, oat_f)
+
+        self.assertEqual(table.shape, (4, 20))
+        for i, weight in enumerate(weights[:, 0]):
+            for j, pressure_altitude in enumerate(pressure_altitudes):
+                self.assertAlmostEqual(
+                    table[i, j],
+                    best_glide_speed(
+                        self.dataplate, weight, pressure_altitude, oat_f[j]
+                    ),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.optimize import optimize_power_setting
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+    max_level_flight_speed_row,
+)
+
+
+class TestOptimizePowerSetting(unittest.TestCase):
+    def setUp(self):
+        self.pressure_altitude = 8000
+        self.oat_f = c_to_f(metric_standard_temperature(self.pressure_altitude))
+        self.arguments = (N51SW, 3000, self.pressure_altitude, self.oat_f)
+
+        pass
+
+    def grid_search(self, mixture, objective, maximum_power=np.inf):
+        # The best cruise row over RPM in steps of 100 and power in steps of
+        # 2 hp, the way settings were chosen before.
+        best = None
+
+        for engine_rpm in range(1800, 2500, 100):
+            full_throttle = FullThrottleConditions(
+                *self.arguments, mixture, engine_rpm
+            ).power
+            for power in np.arange(20 * 550, min(full_throttle, maximum_power), 1100):
+                row = max_level_flight_speed_row(
+                    bootstrap_cruise_performance_table(
+                        N51SW,
+                        PartialThrottleConditions(
+                            *self.arguments, mixture, engine_rpm, power
+                        ),
+                        40,
+                        200,
+                        1,
+                    )
+                )
+
+                # VM must be within the table (the airplane still climbs at its
+                # fastest speed otherwise).
+                if row is None or row[ByKCASRowIndex.RATE_OF_CLIMB] > 0:
+                    continue
+
+                if best is None or row[objective] > best[objective]:
+                    best = row
+
+        return best
+
+    def test_best_range(self):
+        setting = optimize_power_setting(
+            *self.arguments, Mixture.BEST_ECONOMY, ByKCASRowIndex.MPG
+        )
+
+        self.assertTrue(setting.converged)
+        self.assertLess(setting.evaluations, 100)
+        self.assertTrue(1800 < setting.engine_rpm < 2400)
+        # At least as good as a grid search, and not by much.
+        best = self.grid_search(Mixture.BEST_ECONOMY, ByKCASRowIndex.MPG)
+        self.assertGreaterEqual(
+            setting.row[ByKCASRowIndex.MPG], best[ByKCASRowIndex.MPG]
+        )
+        self.assertLess(
+            setting.row[ByKCASRowIndex.MPG], best[ByKCASRowIndex.MPG] * 1.01
+        )
+        # VM: the airplane neither climbs nor descends.
+        self.assertAlmostEqual(setting.row[ByKCASRowIndex.RATE_OF_CLIMB], 0)
+
+        # The setting's row is the cruise row at that setting.
+        row = max_level_flight_speed_row(
+            bootstrap_cruise_performance_table(
+                N51SW,
+                PartialThrottleConditions(
+                    *self.arguments,
+                    Mixture.BEST_ECONOMY,
+                    setting.engine_rpm,
+                    setting.power,
+                ),
+                40,
+                200,
+                0.01,
+            )
+        )
+        np.testing.assert_allclose(setting.row, row, rtol=1e-6, atol=1e-5)
+
+    def test_fuel_flow_cap(self):
+        setting = optimize_power_setting(
+            *self.arguments,
+            Mixture.BEST_POWER,
+            ByKCASRowIndex.KTAS,
+            maximum_gph=10,
+        )
+
+        self.assertTrue(setting.converged)
+        self.assertAlmostEqual(setting.row[ByKCASRowIndex.GPH], 10)
+        # Faster than any setting of the grid on 10 GPH or less (fuel flow is
+        # proportional to power).
+        best = self.grid_search(
+            Mixture.BEST_POWER, ByKCASRowIndex.KTAS, setting.power * (1 + 1e-9)
+        )
+        self.assertGreaterEqual(
+            setting.row[ByKCASRowIndex.KTAS], best[ByKCASRowIndex.KTAS]
+        )
+
+    def test_limits(self):
+        setting = optimize_power_setting(
+            *self.arguments,
+            Mixture.BEST_POWER,
+            ByKCASRowIndex.KTAS,
+            maximum_percent_power=75,
+        )
+
+        # The fastest setting is the most power at the most RPM.
+        self.assertTrue(setting.converged)
+        self.assertEqual(setting.engine_rpm, 2400)
+        self.assertAlmostEqual(
+            setting.power, 0.75 * N51SW.rated_full_throttle_engine_power
+        )
+        self.assertGreater(setting.gradient[0], 0)
+        self.assertGreater(setting.gradient[1], 0)
+
+        # Minimizing fuel flow is minimizing power; above the absolute ceiling,
+        # there's no level flight at all.
+        self.assertIsNone(
+            optimize_power_setting(
+                N51SW, 3000, 30000, c_to_f(-44.4), Mixture.BEST_POWER
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            optimize_power_setting(*self.arguments, Mixture.BEST_POWER, maximum_gph=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import os
+import tempfile
+from unittest import mock
+
+from examples.dakota_performance import poh
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.arguments = dict(
+            sections=("best_rate_of_climb", "sixty_five_percent_power"),
+            gross_aircraft_weights=(2250, 3000),
+            isa_diffs=(0,),
+            processes=1,
+        )
+
+        self.rendered = []
+        render = poh.render
+
+        def spy(fragment):
+            self.rendered.append(fragment)
+            return render(fragment)
+
+        patch = mock.patch.object(poh, "render", spy)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        pass
+
+    def build(self):
+        self.rendered.clear()
+        return poh.build(self.directory, **self.arguments)
+
+    def modification_times(self):
+        return {
+            os.path.join(root, name): os.stat(os.path.join(root, name)).st_mtime_ns
+            for root, _, names in os.walk(self.directory)
+            for name in names
+        }
+
+    def test_unchanged(self):
+        self.assertEqual(len(self.build()), 6)
+        self.assertEqual(len(self.rendered), 4)
+        modification_times = self.modification_times()
+
+        # A second build with the same inputs renders and writes nothing.
+        self.assertEqual(self.build(), [])
+        self.assertEqual(self.rendered, [])
+        self.assertEqual(self.modification_times(), modification_times)
+
+        # Nor, if every fragment is stale but renders to the same content, does
+        # it rewrite any of them.
+        with mock.patch.object(poh, "fragment_key", lambda fragment: "stale"):
+            self.assertEqual(self.build(), [])
+        self.assertEqual(len(self.rendered), 4)
+
+    def test_changed_fragment(self):
+        self.build()
+        modification_times = self.modification_times()
+
+        fragment = poh.Fragment("sixty_five_percent_power", 3000, 0)
+        fragment_key = poh.fragment_key
+        renderer = poh.SECTIONS[fragment.section][1]
+
+        # Change that fragment's inputs (say, a parameter of its section), so
+        # that its key and its content change.
+        with mock.patch.object(
+            poh,
+            "fragment_key",
+            lambda other: fragment_key(other) + ("*" if other == fragment else ""),
+        ), mock.patch.dict(
+            poh.SECTIONS,
+            {
+                fragment.section: (
+                    poh.SECTIONS[fragment.section][0],
+                    lambda w, isa_diff: renderer(w, isa_diff) + "%\n",
+                )
+            },
+        ):
+            self.assertEqual(self.build(), [fragment.path])
+
+        self.assertEqual(self.rendered, [fragment])
+        path = os.path.join(self.directory, fragment.path)
+        with open(path) as file:
+            self.assertTrue(file.read().endswith("%\n"))
+        # Every other fragment, and the section files, are untouched.
+        modification_times.pop(path)
+        modification_times.pop(os.path.join(self.directory, ".manifest.json"))
+        for name, time in modification_times.items():
+            self.assertEqual(os.stat(name).st_mtime_ns, time, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import unittest
+
+import timeit
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+)
+from the_bootstrap_approach.point import PointEvaluator
+
+
+class TestPointEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+        self.gross_aircraft_weight = 2800
+        self.pressure_altitude = 8000
+        self.oat_f = 30
+        self.engine_rpm = 2500
+
+        pass
+
+    def test_full_throttle(self):
+        for mixture in Mixture:
+            evaluator = PointEvaluator(self.dataplate, mixture)
+            table = bootstrap_cruise_performance_table(
+                self.dataplate,
+                FullThrottleConditions(
+                    self.dataplate,
+                    self.gross_aircraft_weight,
+                    self.pressure_altitude,
+                    self.oat_f,
+                    mixture,
+                    self.engine_rpm,
+                ),
+                70,
+                150,
+                5,
+            )
+
+            for row in table:
+                np.testing.assert_allclose(
+                    evaluator.evaluate(
+                        self.gross_aircraft_weight,
+                        self.pressure_altitude,
+                        self.oat_f,
+                        self.engine_rpm,
+                        row[0],
+                    ),
+                    row,
+                    rtol=1e-12,
+                )
+
+    def test_partial_throttle(self):
+        evaluator = PointEvaluator(self.dataplate, Mixture.BEST_ECONOMY)
+        power = self.dataplate.rated_full_throttle_engine_power * 0.55
+        table = bootstrap_cruise_performance_table(
+            self.dataplate,
+            PartialThrottleConditions(
+                self.dataplate,
+                self.gross_aircraft_weight,
+                self.pressure_altitude,
+                self.oat_f,
+                Mixture.BEST_ECONOMY,
+                2300,
+                power,
+            ),
+            70,
+            150,
+            5,
+        )
+
+        for row in table:
+            np.testing.assert_allclose(
+                evaluator.evaluate(
+                    self.gross_aircraft_weight,
+                    self.pressure_altitude,
+                    self.oat_f,
+                    2300,
+                    row[0],
+                    power,
+                ),
+                row,
+                rtol=1e-12,
+            )
+
+    def test_off_chart(self):
+        # Below the chart's lowest curve, and above its highest, η (and so the
+        # row) is NaN, as in a cruise performance table.
+        evaluator = PointEvaluator(self.dataplate, Mixture.BEST_ECONOMY)
+
+        for engine_rpm, percent_power in ((2300, 1), (1000, 100)):
+            power = (
+                self.dataplate.rated_full_throttle_engine_power * percent_power / 100
+            )
+            table = bootstrap_cruise_performance_table(
+                self.dataplate,
+                PartialThrottleConditions(
+                    self.dataplate,
+                    self.gross_aircraft_weight,
+                    self.pressure_altitude,
+                    self.oat_f,
+                    Mixture.BEST_ECONOMY,
+                    engine_rpm,
+                    power,
+                ),
+                100,
+                101,
+                1,
+            )
+            row = evaluator.evaluate(
+                self.gross_aircraft_weight,
+                self.pressure_altitude,
+                self.oat_f,
+                engine_rpm,
+                100,
+                power,
+            )
+
+            self.assertTrue(np.isnan(row[ByKCASRowIndex.PROPELLER_EFFICIENCY]))
+            np.testing.assert_allclose(row, table[0], rtol=1e-12)
+
+    def test_kias(self):
+        evaluator = PointEvaluator(self.dataplate, Mixture.BEST_POWER)
+
+        np.testing.assert_allclose(
+            evaluator.evaluate_kias(
+                self.gross_aircraft_weight,
+                self.pressure_altitude,
+                self.oat_f,
+                self.engine_rpm,
+                100,
+            ),
+            evaluator.evaluate(
+                self.gross_aircraft_weight,
+                self.pressure_altitude,
+                self.oat_f,
+                self.engine_rpm,
+                evaluator.ias_to_cas(100),
+            ),
+        )
+        # Outside the calibration curve, like ias_to_cas.
+        self.assertTrue(np.isnan(evaluator.ias_to_cas(500)))
+
+    def test_benchmark(self):
+        evaluator = PointEvaluator(self.dataplate, Mixture.BEST_POWER)
+        number = 10000
+
+        seconds = min(
+            timeit.repeat(
+                lambda: evaluator.evaluate(
+                    self.gross_aircraft_weight,
+                    self.pressure_altitude,
+                    self.oat_f,
+                    self.engine_rpm,
+                    100.0,
+                ),
+                number=number,
+                repeat=3,
+            )
+        )
+
+        # The target is 10 µs per point; leave headroom for slow CI machines and
+        # coverage tracing.
+        self.assertLess(seconds / number, 50 * 10**-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
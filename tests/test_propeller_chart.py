@@ -1,6 +1,13 @@
+import json
 import math
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import FullThrottleConditions
 from the_bootstrap_approach.equations import (
     sdef_t,
     propeller_advance_ratio,
@@ -9,7 +16,22 @@ from the_bootstrap_approach.equations import (
     atmospheric_density,
     british_standard_temperature,
 )
-from the_bootstrap_approach.propeller_chart import propeller_efficiency
+from the_bootstrap_approach.fleet import Fleet
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+)
+from the_bootstrap_approach.point import PointEvaluator
+from the_bootstrap_approach.propeller_chart import (
+    LOWRY_PROPELLER_MAP,
+    SURFACE_RESOLUTION,
+    PropellerMap,
+    load_propeller_map,
+    propeller_chart,
+    propeller_efficiency,
+    propeller_efficiency_surface_error,
+)
 
 
 class TestPropellerChart(unittest.TestCase):
@@ -60,6 +82,273 @@ class TestPropellerChart(unittest.TestCase):
             )
         )
 
+    def test_float32(self):
+        advance_ratio = propeller_advance_ratio(
+            np.array([100, 150, 200], dtype=np.float32), 2300 / 60, 6.83
+        )
+        power_coefficient = propeller_power_coefficient(
+            np.float32(0.65 * 235 * 550), 0.002048, 2300 / 60, 6.83
+        )
+
+        eta = propeller_efficiency(
+            sdef_t(0.688),
+            advance_ratio,
+            power_coefficient,
+            power_adjustment_factor_x(195.9),
+        )
+
+        self.assertEqual(eta.dtype, np.float32)
+        np.testing.assert_allclose(
+            eta,
+            propeller_efficiency(
+                sdef_t(0.688),
+                advance_ratio.astype(np.float64),
+                np.float64(power_coefficient),
+                power_adjustment_factor_x(195.9),
+            ),
+            rtol=10**-6,
+        )
+
+
+class TestPropellerEfficiencySurface(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.advance_ratio = rng.uniform(0.1, 2.5, 10000)
+        # Some power coefficients fall below the chart's lowest curve, i.e. off
+        # the surface.
+        self.power_coefficient = rng.uniform(0.01, 0.15, 10000)
+
+        pass
+
+    def efficiency(self, mode, **kwargs):
+        return propeller_efficiency(
+            sdef_t(0.688),
+            self.advance_ratio,
+            self.power_coefficient,
+            power_adjustment_factor_x(195.9),
+            mode=mode,
+            **kwargs,
+        )
+
+    def test_matches_exact(self):
+        error = propeller_efficiency_surface_error()
+
+        self.assertEqual(error.resolution, SURFACE_RESOLUTION)
+        self.assertLess(error.max_abs_error, 10**-5)
+        self.assertLess(error.rms_error, error.max_abs_error)
+
+        np.testing.assert_allclose(
+            self.efficiency("surface"),
+            self.efficiency("exact"),
+            rtol=0,
+            atol=error.max_abs_error,
+        )
+
+    def test_error_falls_with_resolution(self):
+        self.assertLess(
+            propeller_efficiency_surface_error(4 * SURFACE_RESOLUTION).max_abs_error,
+            propeller_efficiency_surface_error(SURFACE_RESOLUTION).max_abs_error / 8,
+        )
+
+    def test_off_surface(self):
+        # Far past the surface's range of J/C_P^(1/3), η is evaluated exactly.
+        sdef = sdef_t(0.688)
+        x = power_adjustment_factor_x(195.9)
+
+        self.assertEqual(
+            propeller_efficiency(sdef, 6.0, 0.05, x, mode="surface"),
+            propeller_efficiency(sdef, 6.0, 0.05, x),
+        )
+
+        # Off the chart's curves, like off a table map, η is NaN either way.
+        for mode in ("exact", "surface"):
+            self.assertTrue(
+                np.isnan(propeller_efficiency(sdef, 1.0, 0.01, x, mode=mode))
+            )
+            self.assertTrue(
+                np.isnan(propeller_efficiency(sdef, 1.0, 1.0, x, mode=mode))
+            )
+
+    def test_float32(self):
+        expected = self.efficiency("exact")
+        self.advance_ratio = self.advance_ratio.astype(np.float32)
+        self.power_coefficient = self.power_coefficient.astype(np.float32)
+
+        eta = self.efficiency("surface")
+
+        self.assertEqual(eta.dtype, np.float32)
+        # Like the exact chart in float32, to about six significant digits.
+        np.testing.assert_allclose(eta, expected, rtol=10**-4, atol=10**-6)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.efficiency("bicubic")
+
+
+class TestPropellerMap(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        # A table of N51SW's propeller, from Dr. Lowry's chart, at its curves'
+        # power coefficients (short of the last, where the chart ends).
+        self.x = power_adjustment_factor_x(N51SW.total_activity_factor)
+        self.power_coefficients = (
+            np.array([0.15, 0.25, 0.40, 0.60, 0.80, 1.00, 1.20, 1.39]) * self.x
+        )
+        self.advance_ratios = np.arange(0.2, 3.0, 0.01)
+        self.table = propeller_efficiency(
+            1, self.advance_ratios, self.power_coefficients[:, np.newaxis], self.x
+        )
+        self.table_map = PropellerMap(
+            self.power_coefficients,
+            advance_ratios=self.advance_ratios,
+            table=self.table,
+            name="N51SW",
+        )
+
+        pass
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_load_coefficients(self):
+        with open(self.path("lowry.json"), "w") as file:
+            json.dump(
+                {
+                    "curves": list(propeller_chart.keys()),
+                    "coefficients": list(propeller_chart.values()),
+                },
+                file,
+            )
+
+        with open(self.path("lowry.csv"), "w") as file:
+            file.write("curve," + ",".join(f"c{i}" for i in range(7)) + "\n")
+            for curve, coefficients in propeller_chart.items():
+                file.write(",".join(map(repr, [curve] + coefficients)) + "\n")
+
+        for path in (self.path("lowry.json"), self.path("lowry.csv")):
+            propeller_map = load_propeller_map(path)
+
+            self.assertEqual(propeller_map.name, "lowry")
+            self.assertEqual(propeller_map.kind, "coefficients")
+            self.assertEqual(propeller_map.digest(), LOWRY_PROPELLER_MAP.digest())
+            self.assertTrue(propeller_map.coefficients.flags.c_contiguous)
+
+    def test_load_table(self):
+        with open(self.path("table.json"), "w") as file:
+            json.dump(
+                {
+                    "name": "N51SW",
+                    "curves": self.power_coefficients.tolist(),
+                    "advance_ratios": self.advance_ratios.tolist(),
+                    "table": self.table.tolist(),
+                },
+                file,
+            )
+
+        with open(self.path("table.csv"), "w") as file:
+            # In no particular order.
+            file.write("curve,advance_ratio,efficiency\n")
+            for j, advance_ratio in reversed(list(enumerate(self.advance_ratios))):
+                for i, curve in enumerate(self.power_coefficients):
+                    file.write(
+                        ",".join(
+                            repr(float(value))
+                            for value in (curve, advance_ratio, self.table[i, j])
+                        )
+                        + "\n"
+                    )
+
+        for path in (self.path("table.json"), self.path("table.csv")):
+            propeller_map = load_propeller_map(path, name="N51SW")
+
+            self.assertEqual(propeller_map.kind, "table")
+            self.assertEqual(propeller_map.digest(), self.table_map.digest())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PropellerMap([0.25, 0.15], coefficients=[[0, 1], [0, 1]])
+        with self.assertRaises(ValueError):
+            PropellerMap([0.15, 0.25], coefficients=[[0, 1]])
+        with self.assertRaises(ValueError):
+            PropellerMap([0.15, 0.25], advance_ratios=[0, 1], table=[[0.5], [0.6]])
+        with self.assertRaises(ValueError):
+            PropellerMap([0.15, 0.25], coefficients=[[0, math.nan], [0, 1]])
+
+        # A table missing a point.
+        with open(self.path("missing.csv"), "w") as file:
+            file.write(
+                "curve,advance_ratio,efficiency\n0.1,0,0.5\n0.1,1,0.6\n0.2,0,0.5\n"
+            )
+
+        with self.assertRaises(ValueError):
+            load_propeller_map(self.path("missing.csv"))
+
+    def test_table(self):
+        sdef = sdef_t(N51SW.z_ratio)
+
+        # Exact at the table's points, and NaN off it.
+        np.testing.assert_allclose(
+            propeller_efficiency(
+                sdef,
+                self.advance_ratios,
+                self.power_coefficients[:, np.newaxis],
+                self.x,
+                propeller_map=self.table_map,
+            ),
+            sdef * self.table,
+            rtol=1e-12,
+        )
+        self.assertTrue(
+            np.isnan(
+                propeller_efficiency(
+                    sdef,
+                    [0.1, 1.0, 3.5],
+                    [0.2 * self.x, self.power_coefficients[-1] * 1.01, 0.5],
+                    self.x,
+                    propeller_map=self.table_map,
+                )
+            ).all()
+        )
+
+    def test_dataplate(self):
+        dataplate = N51SW.replace(propeller_map=self.table_map)
+
+        self.assertIs(N51SW.propeller_map, LOWRY_PROPELLER_MAP)
+        self.assertNotEqual(dataplate.digest(), N51SW.digest())
+
+        tables = [
+            bootstrap_cruise_performance_table(
+                dataplate,
+                FullThrottleConditions(
+                    dataplate, 2750, 6000, 40, Mixture.BEST_POWER, 2400
+                ),
+                60,
+                160,
+                1,
+            )
+            for dataplate in (N51SW, dataplate)
+        ]
+
+        # Bilinear interpolation in J and C_P differs a little from the chart's.
+        np.testing.assert_allclose(
+            tables[1][:, ByKCASRowIndex.PROPELLER_EFFICIENCY],
+            tables[0][:, ByKCASRowIndex.PROPELLER_EFFICIENCY],
+            atol=0.02,
+        )
+
+        evaluator = PointEvaluator(dataplate, Mixture.BEST_POWER)
+        for row in tables[1][::10]:
+            np.testing.assert_allclose(
+                evaluator.evaluate(2750, 6000, 40, 2400, row[ByKCASRowIndex.KCAS]),
+                row,
+                rtol=1e-9,
+            )
+
+        with self.assertRaises(ValueError):
+            Fleet([N51SW, dataplate])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.equations import power_adjustment_factor_x, sdef_t
+from the_bootstrap_approach.fleet import Fleet, fleet_profiles
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    best_rate_of_climb_row,
+    max_level_flight_speed_row,
+)
+from the_bootstrap_approach.propeller_chart import propeller_efficiency
+from the_bootstrap_approach.sensitivity import profile_sensitivities
+
+PARAMETERS = (
+    "parasite_drag_coefficient",
+    "airplane_efficiency_factor",
+    "blade_activity_factor",
+    "engine_power_altitude_dropoff_parameter",
+)
+
+
+class TestProfileSensitivities(unittest.TestCase):
+    def setUp(self):
+        self.arguments = (
+            3000,
+            np.arange(0, 30000, 1000),
+            np.arange(60, 120, 0.5),
+            Mixture.BEST_POWER,
+            2400,
+        )
+
+        pass
+
+    def test_matches_finite_differences(self):
+        for select, power in (
+            (best_rate_of_climb_row, None),
+            (max_level_flight_speed_row, 130 * 550),
+        ):
+            sensitivities = profile_sensitivities(
+                N51SW, PARAMETERS, *self.arguments, select, power=power
+            )
+
+            for name, derivatives in zip(PARAMETERS, sensitivities.derivatives):
+                value = getattr(N51SW, name)
+                h = value * 1e-5
+                profiles = fleet_profiles(
+                    Fleet(
+                        [
+                            N51SW.replace(**{name: value + h}),
+                            N51SW.replace(**{name: value - h}),
+                        ]
+                    ),
+                    *self.arguments,
+                    select,
+                    power=power,
+                )
+                length = min(len(profile.data) for profile in profiles)
+
+                self.assertGreater(length, 5)
+                np.testing.assert_allclose(
+                    derivatives[:length],
+                    (profiles[0].data[:length] - profiles[1].data[:length]) / (2 * h),
+                    rtol=1e-5,
+                    # Columns that don't depend on the parameter (e.g., RPM).
+                    atol=1e-6 * np.abs(derivatives).max(),
+                )
+
+    def test_ceilings(self):
+        sensitivities = profile_sensitivities(
+            N51SW, PARAMETERS, *self.arguments, best_rate_of_climb_row
+        )
+
+        self.assertTrue(15000 < sensitivities.service_ceiling < 20000)
+        self.assertLess(sensitivities.service_ceiling, sensitivities.absolute_ceiling)
+        # Drag lowers the ceiling, and power (a smaller C) raises it.
+        self.assertLess(sensitivities.absolute_ceiling_derivatives[0], 0)
+        self.assertLess(sensitivities.absolute_ceiling_derivatives[3], 0)
+
+        for i, name in enumerate(PARAMETERS):
+            value = getattr(N51SW, name)
+            h = value * 1e-5
+            ceilings = [
+                profile_sensitivities(
+                    N51SW.replace(**{name: value + sign * h}),
+                    (name,),
+                    *self.arguments,
+                    best_rate_of_climb_row,
+                ).absolute_ceiling
+                for sign in (1, -1)
+            ]
+
+            np.testing.assert_allclose(
+                sensitivities.absolute_ceiling_derivatives[i],
+                (ceilings[0] - ceilings[1]) / (2 * h),
+                rtol=1e-5,
+            )
+
+    def test_per_percent(self):
+        sensitivities = profile_sensitivities(
+            N51SW, PARAMETERS[:1], *self.arguments, best_rate_of_climb_row
+        )
+        per_percent = sensitivities.per_percent()
+
+        np.testing.assert_allclose(
+            per_percent,
+            sensitivities.derivatives * N51SW.parasite_drag_coefficient / 100,
+        )
+        # More drag, less climb.
+        self.assertTrue((per_percent[0, :, ByAltitudeRowIndex.RATE_OF_CLIMB] < 0).all())
+
+        with self.assertRaises(ValueError):
+            profile_sensitivities(N51SW, (), *self.arguments, best_rate_of_climb_row)
+
+    def test_propeller_efficiency(self):
+        # Complex steps go through the propeller chart, too.
+        x = power_adjustment_factor_x(N51SW.total_activity_factor)
+        h = 1e-30
+
+        for mode in ("exact", "surface"):
+            eta = propeller_efficiency(
+                sdef_t(N51SW.z_ratio), 0.8, np.array([0.06 + h * 1j]), x, mode=mode
+            )
+            slope = (
+                propeller_efficiency(sdef_t(N51SW.z_ratio), 0.8, 0.06 + 1e-7, x)
+                - propeller_efficiency(sdef_t(N51SW.z_ratio), 0.8, 0.06 - 1e-7, x)
+            ) / 2e-7
+
+            np.testing.assert_allclose(eta.imag / h, slope, rtol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
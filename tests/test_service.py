@@ -0,0 +1,338 @@
+import unittest
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+    descent_profiles,
+    time_fuel_distance,
+)
+from the_bootstrap_approach.service import PerformanceService
+
+
+def climb_profile(dataplate, gross_aircraft_weight, mixture, top_of_climb):
+    # A full-throttle climb at a constant 90 KCAS.
+    (profile,) = descent_profiles(
+        dataplate,
+        (gross_aircraft_weight,),
+        np.arange(0, top_of_climb + 1, 1000),
+        90,
+        mixture,
+        dataplate.rated_full_throttle_engine_rpm,
+        power=dataplate.rated_full_throttle_engine_power,
+    )
+
+    return profile
+
+
+async def request(port, path, query, method="POST"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(query).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ")[1]), json.loads(content)
+
+
+class TestPerformanceService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = PerformanceService(
+            {"N51SW": N51SW},
+            profiles={"climb": climb_profile},
+            executor=ThreadPoolExecutor(2),
+        )
+        self.port = await self.service.start()
+        self.point = {
+            "dataplate": "N51SW",
+            "mixture": "BEST_POWER",
+            "gross_aircraft_weight": 2800,
+            "pressure_altitude": 8000,
+            "engine_rpm": 2500,
+            "kcas": 110,
+        }
+
+        pass
+
+    async def asyncTearDown(self):
+        await self.service.close()
+        self.service._executor.shutdown()
+
+    async def test_point(self):
+        status, row = await request(self.port, "/point", self.point)
+
+        self.assertEqual(status, 200)
+        table = bootstrap_cruise_performance_table(
+            N51SW,
+            FullThrottleConditions(
+                N51SW,
+                2800,
+                8000,
+                c_to_f(metric_standard_temperature(8000)),
+                Mixture.BEST_POWER,
+                2500,
+            ),
+            110,
+            111,
+            1,
+        )
+        np.testing.assert_allclose(list(row.values()), table[0])
+        self.assertEqual(list(row), list(ByKCASRowIndex.__members__))
+
+    async def test_batching(self):
+        queries = [
+            dict(self.point, kcas=kcas, power=power * 550, mixture=mixture)
+            for kcas in range(70, 150, 10)
+            for power in (100, 150)
+            for mixture in ("BEST_POWER", "BEST_ECONOMY")
+        ]
+
+        batches = []
+        evaluate_points = self.service._evaluate_points
+
+        def spy(dataplate, mixture, queries):
+            batches.append(len(queries))
+            return evaluate_points(dataplate, mixture, queries)
+
+        self.service._evaluate_points = spy
+        rows = await asyncio.gather(*(self.service.point(query) for query in queries))
+
+        # One vectorized batch per mixture.
+        self.assertEqual(batches, [16, 16])
+        for query, row in zip(queries, rows):
+            table = bootstrap_cruise_performance_table(
+                N51SW,
+                PartialThrottleConditions(
+                    N51SW,
+                    2800,
+                    8000,
+                    c_to_f(metric_standard_temperature(8000)),
+                    Mixture[query["mixture"]],
+                    2500,
+                    query["power"],
+                ),
+                query["kcas"],
+                query["kcas"] + 1,
+                1,
+            )
+            # At 100 hp, 2500 RPM is off the propeller chart, and JSON's nulls
+            # stand in for the NaN rows.
+            np.testing.assert_allclose(
+                np.array(list(row.values()), dtype=float), table[0]
+            )
+            self.assertEqual(
+                row["PROPELLER_EFFICIENCY"] is None, query["power"] == 100 * 550
+            )
+
+    async def test_bad_query_in_batch(self):
+        evaluate_points = self.service._evaluate_points
+        batches = []
+
+        def spy(dataplate, mixture, queries):
+            batches.append(len(queries))
+            # Stands in for a query the model can't evaluate.
+            if any(query["kcas"] == 999 for query in queries):
+                raise IndexError("index 8 is out of bounds")
+            return evaluate_points(dataplate, mixture, queries)
+
+        self.service._evaluate_points = spy
+        # Long enough for both requests to arrive in one batch.
+        self.service.batch_delay = 0.1
+
+        # A bad query fails on its own, not along with the good one batched with
+        # it, whether it's caught up front or only when it's evaluated.
+        for bad, error, expected_batches in (
+            (dict(self.point, kcas=999), "out of bounds", [2, 1, 1]),
+            (dict(self.point, power="full"), "power", [1]),
+        ):
+            batches.clear()
+            (status, row), (bad_status, response) = await asyncio.gather(
+                request(self.port, "/point", self.point),
+                request(self.port, "/point", bad),
+            )
+
+            self.assertEqual(status, 200)
+            self.assertEqual(row["KCAS"], 110)
+            self.assertEqual(bad_status, 400)
+            self.assertIn(error, response["error"])
+            self.assertEqual(batches, expected_batches)
+
+    async def test_profile(self):
+        query = {
+            "dataplate": "N51SW",
+            "kind": "descent",
+            "gross_aircraft_weight": 2750,
+            "pressure_altitudes": list(range(0, 12000, 1000)),
+            "kcas": 110,
+            "mixture": "BEST_POWER",
+            "engine_rpm": 2200,
+            "rate_of_descent": 500,
+        }
+
+        status, profile = await request(self.port, "/profile", query)
+
+        self.assertEqual(status, 200)
+        # At sea level, the least power on the propeller chart descends slower.
+        rate_of_climb = profile["data"]["RATE_OF_CLIMB"]
+        self.assertGreater(rate_of_climb[0], -500)
+        np.testing.assert_allclose(rate_of_climb[1:], -500, atol=0.1)
+
+        # Concurrent and repeated queries share one build.
+        profiles = await asyncio.gather(
+            *(self.service.profile(query) for _ in range(3))
+        )
+        self.assertIs(profiles[0], profiles[1])
+        self.assertIs(await self.service.profile(query), profiles[0])
+        self.assertEqual(len(self.service._cache), 1)
+
+        # In-process, parameters may be a Mixture and arrays, too.
+        self.assertIs(
+            await self.service.profile(
+                dict(
+                    query,
+                    mixture=Mixture.BEST_POWER,
+                    pressure_altitudes=np.arange(0, 12000, 1000),
+                )
+            ),
+            profiles[0],
+        )
+
+    async def test_cache_eviction(self):
+        self.service.cache_size = 2
+
+        for top_of_climb in (4000, 5000, 6000):
+            await self.service.profile(
+                {
+                    "dataplate": "N51SW",
+                    "kind": "climb",
+                    "gross_aircraft_weight": 3000,
+                    "mixture": "FULL_RICH",
+                    "top_of_climb": top_of_climb,
+                }
+            )
+
+        self.assertEqual(len(self.service._cache), 2)
+
+    async def test_trip(self):
+        climb = {
+            "kind": "climb",
+            "gross_aircraft_weight": 3000,
+            "mixture": "FULL_RICH",
+            "top_of_climb": 10000,
+        }
+        descent = {
+            "kind": "descent",
+            "gross_aircraft_weight": 3000,
+            "pressure_altitudes": list(range(0, 11000, 1000)),
+            "kcas": 120,
+            "mixture": "BEST_POWER",
+            "engine_rpm": 2200,
+            "rate_of_descent": 500,
+        }
+        cruise = dict(self.point, power=120 * 550)
+        del cruise["dataplate"], cruise["pressure_altitude"]
+
+        status, trip = await request(
+            self.port,
+            "/trip",
+            {
+                "dataplate": "N51SW",
+                "distance": 300,
+                "cruise_altitude": 8000,
+                "climb": climb,
+                "cruise": cruise,
+                "descent": descent,
+            },
+        )
+
+        self.assertEqual(status, 200)
+
+        climb_profile = await self.service.profile(dict(climb, dataplate="N51SW"))
+        minutes, _, nautical_miles = time_fuel_distance(climb_profile.data)
+        self.assertAlmostEqual(trip["climb"]["minutes"], minutes[8])
+        self.assertAlmostEqual(trip["climb"]["nautical_miles"], nautical_miles[8])
+        # 10,000' to sea level at 500 ft/min takes 16 minutes.
+        self.assertAlmostEqual(trip["descent"]["minutes"], 16, delta=10**-3)
+        self.assertAlmostEqual(trip["total"]["nautical_miles"], 300)
+        self.assertAlmostEqual(
+            trip["total"]["gallons"],
+            sum(trip[leg]["gallons"] for leg in ("climb", "cruise", "descent")),
+        )
+
+        # Too short to climb to 8,000'.
+        status, _ = await request(
+            self.port,
+            "/trip",
+            {
+                "dataplate": "N51SW",
+                "distance": 10,
+                "cruise_altitude": 8000,
+                "climb": climb,
+                "cruise": cruise,
+                "descent": descent,
+            },
+        )
+        self.assertEqual(status, 400)
+
+    async def test_errors(self):
+        status, response = await request(
+            self.port, "/point", dict(self.point, dataplate="N4697K")
+        )
+        self.assertEqual(status, 400)
+        self.assertIn("N4697K", response["error"])
+
+        status, _ = await request(self.port, "/point", {"dataplate": "N51SW"})
+        self.assertEqual(status, 400)
+        status, _ = await request(self.port, "/profile", {"dataplate": "N51SW"})
+        self.assertEqual(status, 400)
+        status, _ = await request(self.port, "/point", self.point, method="GET")
+        self.assertEqual(status, 405)
+        status, _ = await request(self.port, "/", {})
+        self.assertEqual(status, 404)
+
+
+class TestPerformanceServiceProcessPool(unittest.IsolatedAsyncioTestCase):
+    async def test_profile(self):
+        service = PerformanceService(
+            {"N51SW": N51SW}, profiles={"climb": climb_profile}
+        )
+
+        try:
+            profile = await service.profile(
+                {
+                    "dataplate": "N51SW",
+                    "kind": "climb",
+                    "gross_aircraft_weight": 3000,
+                    "mixture": "FULL_RICH",
+                    "top_of_climb": 10000,
+                }
+            )
+        finally:
+            await service.close()
+
+        self.assertEqual(len(profile.data), 11)
+        self.assertTrue(np.all(profile.data[:, ByAltitudeRowIndex.RATE_OF_CLIMB] > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+
+import os
+import tempfile
+import time
+from unittest import mock
+
+from the_bootstrap_approach.equations import density_altitude
+from the_bootstrap_approach.study import Study, merge
+
+
+class TestStudy(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.units = [
+            {"pressure_altitude": pressure_altitude, "oat_f": oat_f}
+            for pressure_altitude in (0, 5000, 10000)
+            for oat_f in (0, 59)
+        ]
+        self.calls = []
+
+        pass
+
+    def func(self, pressure_altitude, oat_f):
+        self.calls.append((pressure_altitude, oat_f))
+        return density_altitude(pressure_altitude, oat_f)
+
+    def test_run(self):
+        study = Study(self.directory.name, self.func, self.units)
+
+        self.assertEqual(study.run(), 6)
+        self.assertEqual(study.pending(), [])
+        self.assertEqual(
+            sorted(result for _, result in study.results()),
+            sorted(density_altitude(**unit) for unit in self.units),
+        )
+        # Nothing but the results is left behind.
+        self.assertEqual(len(os.listdir(self.directory.name)), 6)
+
+    def test_resume(self):
+        study = Study(self.directory.name, self.func, self.units)
+        self.assertEqual(study.run(max_units=2), 2)
+
+        # A new process (e.g., after a crash) picks up where the first left off.
+        study = Study(self.directory.name, self.func, self.units)
+        self.assertEqual(len(study.pending()), 4)
+        self.assertEqual(study.run(), 4)
+        self.assertEqual(len(self.calls), 6)
+
+    def test_failure_releases_unit(self):
+        def func(pressure_altitude, oat_f):
+            if pressure_altitude == 5000:
+                raise RuntimeError
+
+            return density_altitude(pressure_altitude, oat_f)
+
+        with self.assertRaises(RuntimeError):
+            Study(self.directory.name, func, self.units).run()
+
+        study = Study(self.directory.name, self.func, self.units)
+        self.assertEqual(study.run(), 4)
+
+    def test_locks(self):
+        study = Study(self.directory.name, self.func, self.units, lock_timeout=60)
+
+        # Another process is working on the first unit...
+        self.assertTrue(study._claim(self.units[0]))
+        # ...and one was killed while working on the second, long ago.
+        self.assertTrue(study._claim(self.units[1]))
+        stale = time.time() - 120
+        os.utime(study._path(self.units[1], ".lock"), (stale, stale))
+
+        self.assertEqual(study.run(), 5)
+        self.assertEqual(study.pending(), [self.units[0]])
+
+    def test_lock_broken_meanwhile(self):
+        study = Study(self.directory.name, self.func, self.units, lock_timeout=60)
+        other = Study(self.directory.name, self.func, self.units, lock_timeout=60)
+        unit = self.units[0]
+        path = study._path(unit, ".lock")
+
+        self.assertTrue(other._claim(unit))
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+
+        stat = os.stat
+        racing = [True]
+
+        def racing_stat(name, *args, **kwargs):
+            result = stat(name, *args, **kwargs)
+            if name == path and racing:
+                racing.clear()
+                # Having seen the stale lock, we're beaten to breaking it by
+                # another process, which claims the unit afresh.
+                os.unlink(path)
+                other._claim(unit)
+            return result
+
+        with mock.patch("os.stat", racing_stat):
+            self.assertFalse(study._claim(unit))
+
+        # The other process's fresh lock is back in place.
+        self.assertLess(time.time() - os.stat(path).st_mtime, 60)
+        self.assertEqual(os.listdir(self.directory.name), [os.path.basename(path)])
+
+    def test_long_unit_keeps_its_lock(self):
+        study = Study(self.directory.name, None, self.units[:1], lock_timeout=0.2)
+        claims = []
+
+        def func(pressure_altitude, oat_f):
+            time.sleep(0.5)
+            # Well past lock_timeout, another process finds the unit claimed.
+            claims.append(study._claim(self.units[0]))
+            return density_altitude(pressure_altitude, oat_f)
+
+        study.func = func
+        self.assertEqual(study.run(), 1)
+        self.assertEqual(claims, [False])
+
+    def test_run_parallel(self):
+        study = Study(self.directory.name, density_altitude, self.units)
+
+        self.assertEqual(study.run_parallel(processes=2), 6)
+        self.assertEqual(study.pending(), [])
+
+    def test_merge(self):
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            # Two machines each finish half of the study.
+            Study(a, self.func, self.units[:3]).run()
+            Study(b, self.func, self.units[2:]).run()
+
+            self.assertEqual(merge(self.directory.name, a, b), 6)
+            self.assertEqual(merge(self.directory.name, a, b), 0)
+
+        study = Study(self.directory.name, self.func, self.units)
+        self.assertEqual(study.pending(), [])
+        self.assertEqual(len(list(study.results())), 6)
+
+    def test_key(self):
+        self.assertEqual(
+            Study.key({"isa_diff": -30, "dataplate": "N51SW"}),
+            "dataplate=%27N51SW%27,isa_diff=-30",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
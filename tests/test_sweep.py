@@ -0,0 +1,278 @@
+import unittest
+
+import tracemalloc
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.conditions import FullThrottleConditions
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    bootstrap_cruise_performance_table,
+)
+from the_bootstrap_approach.sweep import (
+    ArgMax,
+    ArgMin,
+    Ceiling,
+    parallel_grid,
+    sweep,
+)
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+        self.mixture = Mixture.BEST_POWER
+        self.grid = {
+            "gross_aircraft_weight": [2500, 3000],
+            "pressure_altitude": np.arange(0, 24000, 2000),
+            "isa_diff": [-10, 0, 10],
+            "engine_rpm": [2300, 2700],
+            "kcas": np.arange(60, 180, 1),
+        }
+
+        pass
+
+    def table(self, gross_aircraft_weight, pressure_altitude, isa_diff, engine_rpm):
+        return bootstrap_cruise_performance_table(
+            self.dataplate,
+            FullThrottleConditions(
+                self.dataplate,
+                gross_aircraft_weight,
+                pressure_altitude,
+                c_to_f(metric_standard_temperature(pressure_altitude) + isa_diff),
+                self.mixture,
+                engine_rpm,
+            ),
+            60,
+            180,
+            1,
+        )
+
+    def test_argmax(self):
+        (vy,) = sweep(
+            self.dataplate,
+            self.mixture,
+            self.grid,
+            [
+                ArgMax(
+                    ByKCASRowIndex.RATE_OF_CLIMB,
+                    by=("gross_aircraft_weight", "pressure_altitude"),
+                )
+            ],
+            # Many small chunks.
+            memory_budget=2**16,
+        )
+
+        self.assertEqual(vy.rows.shape, (2, 12, len(ByKCASRowIndex)))
+
+        for i, weight in enumerate(self.grid["gross_aircraft_weight"]):
+            for j, pressure_altitude in enumerate(self.grid["pressure_altitude"]):
+                best = max(
+                    (
+                        self.table(weight, pressure_altitude, isa_diff, rpm)
+                        for isa_diff in self.grid["isa_diff"]
+                        for rpm in self.grid["engine_rpm"]
+                    ),
+                    key=lambda table: table[:, ByKCASRowIndex.RATE_OF_CLIMB].max(),
+                )
+
+                np.testing.assert_allclose(
+                    vy.rows[i, j],
+                    best[best[:, ByKCASRowIndex.RATE_OF_CLIMB].argmax()],
+                )
+                self.assertEqual(
+                    vy.coordinates["kcas"][i, j], vy.rows[i, j, ByKCASRowIndex.KCAS]
+                )
+
+    def test_chunking(self):
+        reducers = [
+            ArgMax(ByKCASRowIndex.MPG, by=("pressure_altitude",)),
+            ArgMin(ByKCASRowIndex.FUEL_FLOW_PER_KNOT, by=("gross_aircraft_weight",)),
+            Ceiling(by=("isa_diff",)),
+        ]
+
+        small = sweep(
+            self.dataplate, self.mixture, self.grid, reducers, memory_budget=2**14
+        )
+        large = sweep(self.dataplate, self.mixture, self.grid, reducers)
+
+        for a, b in zip(small[:2], large[:2]):
+            np.testing.assert_array_equal(a.rows, b.rows)
+        np.testing.assert_array_equal(small[2], large[2])
+
+    def test_where(self):
+        def level_flight(columns):
+            return columns[ByKCASRowIndex.RATE_OF_CLIMB] >= 0
+
+        best_mpg, no_mpg = sweep(
+            self.dataplate,
+            self.mixture,
+            dict(self.grid, power=[100 * 550]),
+            [
+                ArgMax(
+                    ByKCASRowIndex.MPG, by=("pressure_altitude",), where=level_flight
+                ),
+                ArgMax(
+                    ByKCASRowIndex.MPG,
+                    where=lambda columns: columns[ByKCASRowIndex.RATE_OF_CLIMB] > 10**4,
+                ),
+            ],
+        )
+
+        # At sea level, 100 hp is off the propeller chart at every RPM, and NaN
+        # rows never count as level flight. Everywhere else, the best row flies.
+        rate_of_climb = best_mpg.rows[..., ByKCASRowIndex.RATE_OF_CLIMB]
+        self.assertTrue(np.isnan(best_mpg.rows[0]).all())
+        self.assertTrue(np.isnan(best_mpg.coordinates["kcas"][0]))
+        self.assertTrue(np.all(rate_of_climb[1:] >= 0))
+        self.assertTrue(np.isnan(no_mpg.rows).all())
+        self.assertTrue(np.isnan(no_mpg.coordinates["kcas"]))
+
+    def test_power_limited_to_full_throttle(self):
+        (row,) = sweep(
+            self.dataplate,
+            self.mixture,
+            {
+                "gross_aircraft_weight": 3000,
+                "pressure_altitude": 10000,
+                "engine_rpm": 2500,
+                "power": 10**6,
+                "kcas": 100,
+            },
+            [ArgMax(ByKCASRowIndex.RATE_OF_CLIMB)],
+        )
+
+        np.testing.assert_allclose(row.rows, self.table(3000, 10000, 0, 2500)[100 - 60])
+
+    def test_ceiling(self):
+        (ceiling,) = sweep(
+            self.dataplate,
+            self.mixture,
+            dict(self.grid, pressure_altitude=np.arange(0, 30000, 250)),
+            [Ceiling(by=("isa_diff", "gross_aircraft_weight"), rate_of_climb=100)],
+        )
+
+        self.assertEqual(ceiling.shape, (3, 2))
+
+        for i, isa_diff in enumerate(self.grid["isa_diff"]):
+            for j, weight in enumerate(self.grid["gross_aircraft_weight"]):
+                # The best rate of climb at the interpolated ceiling is 100 ft/min,
+                # to within the grids' resolution.
+                best_roc = max(
+                    self.table(weight, ceiling[i, j], isa_diff, rpm)[
+                        :, ByKCASRowIndex.RATE_OF_CLIMB
+                    ].max()
+                    for rpm in self.grid["engine_rpm"]
+                )
+                self.assertAlmostEqual(best_roc, 100, delta=1)
+
+        # Hotter days and heavier airplanes have lower ceilings.
+        self.assertTrue(np.all(np.diff(ceiling, axis=0) < 0))
+        self.assertTrue(np.all(np.diff(ceiling, axis=1) < 0))
+
+        # The grid's altitudes don't reach the ceiling.
+        (ceiling,) = sweep(self.dataplate, self.mixture, self.grid, [Ceiling()])
+        self.assertTrue(np.isnan(ceiling))
+
+    def test_float32(self):
+        reducer = ArgMax(ByKCASRowIndex.RATE_OF_CLIMB, by=("pressure_altitude",))
+
+        (single,) = sweep(
+            self.dataplate, self.mixture, self.grid, [reducer], dtype=np.float32
+        )
+        (double,) = sweep(self.dataplate, self.mixture, self.grid, [reducer])
+
+        self.assertEqual(single.rows.dtype, np.float32)
+        np.testing.assert_allclose(
+            single.rows[..., ByKCASRowIndex.RATE_OF_CLIMB],
+            double.rows[..., ByKCASRowIndex.RATE_OF_CLIMB],
+            atol=5 * 10**-2,
+        )
+
+    def test_memory_budget(self):
+        # The grid would take many times the budget at once. Its grid indices are
+        # the same size in float32 as in float64.
+        grid = dict(self.grid, kcas=np.arange(60, 180, 0.25))
+        reducers = [
+            ArgMax(ByKCASRowIndex.MPG, by=("pressure_altitude",)),
+            Ceiling(by=("isa_diff",)),
+        ]
+        memory_budget = 2**21
+        # Warm the caches, which would otherwise count against the first chunk.
+        sweep(self.dataplate, self.mixture, self.grid, reducers, dtype=np.float32)
+
+        for dtype in (np.float64, np.float32):
+            tracemalloc.start()
+            try:
+                sweep(
+                    self.dataplate,
+                    self.mixture,
+                    grid,
+                    reducers,
+                    memory_budget=memory_budget,
+                    dtype=dtype,
+                )
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            self.assertLess(peak, memory_budget)
+
+    def test_invalid_grids(self):
+        reducers = [ArgMax(ByKCASRowIndex.MPG)]
+
+        with self.assertRaises(ValueError):
+            sweep(self.dataplate, self.mixture, dict(self.grid, rpm=[2500]), reducers)
+        with self.assertRaises(ValueError):
+            sweep(self.dataplate, self.mixture, dict(self.grid, oat_f=[59]), reducers)
+        with self.assertRaises(ValueError):
+            sweep(
+                self.dataplate,
+                self.mixture,
+                {k: v for k, v in self.grid.items() if k != "kcas"},
+                reducers,
+            )
+        with self.assertRaises(ValueError):
+            sweep(
+                self.dataplate,
+                self.mixture,
+                self.grid,
+                [ArgMax(ByKCASRowIndex.MPG, by=("power",))],
+            )
+
+    def test_parallel_grid(self):
+        with parallel_grid(
+            self.dataplate, self.mixture, self.grid, processes=1
+        ) as serial, parallel_grid(
+            self.dataplate,
+            self.mixture,
+            self.grid,
+            columns=(ByKCASRowIndex.RATE_OF_CLIMB, ByKCASRowIndex.GPH),
+            partition="gross_aircraft_weight",
+            processes=2,
+            memory_budget=2**16,
+        ) as parallel:
+            self.assertEqual(serial.data.shape, (2, 12, 3, 2, 120, 17))
+            self.assertEqual(parallel.data.shape, (2, 12, 3, 2, 120, 2))
+
+            np.testing.assert_array_equal(
+                parallel.data,
+                serial.data[..., [ByKCASRowIndex.RATE_OF_CLIMB, ByKCASRowIndex.GPH]],
+            )
+            np.testing.assert_allclose(
+                serial.data[1, 4, 2, 0], self.table(3000, 8000, 10, 2300)
+            )
+
+        # The shared memory is freed on exit.
+        self.assertIsNone(serial.data)
+
+    def test_parallel_grid_partition(self):
+        with self.assertRaises(ValueError):
+            parallel_grid(self.dataplate, self.mixture, self.grid, partition="power")
+
+
+if __name__ == "__main__":
+    unittest.main()
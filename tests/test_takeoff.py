@@ -0,0 +1,137 @@
+import math
+import time
+import unittest
+
+import numpy as np
+
+from examples.n51sw_dataplate import N51SW
+from the_bootstrap_approach.equations import c_to_f
+from the_bootstrap_approach.takeoff import landing_distances, takeoff_distances
+
+
+class TestTakeoffDistances(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+
+        pass
+
+    def test_converges(self):
+        coarse = takeoff_distances(self.dataplate, 0, 59, 3000, 60, 70)
+        fine = takeoff_distances(self.dataplate, 0, 59, 3000, 60, 70, steps=1024)
+
+        for distance in ("ground_roll", "air_distance", "total"):
+            self.assertTrue(
+                math.isclose(
+                    getattr(coarse, distance),
+                    getattr(fine, distance),
+                    # of 0 significant digits
+                    abs_tol=10**-0,
+                )
+            )
+
+    def test_trends(self):
+        def total(**case):
+            arguments = dict(pressure_altitude=0, oat_f=59, gross_aircraft_weight=2750)
+            arguments.update(case)
+
+            return takeoff_distances(
+                self.dataplate, rotation_kcas=60, obstacle_kcas=70, **arguments
+            ).total
+
+        baseline = total()
+
+        self.assertGreater(total(pressure_altitude=5000), baseline)
+        self.assertGreater(total(oat_f=95), baseline)
+        self.assertGreater(total(gross_aircraft_weight=3000), baseline)
+        self.assertGreater(total(runway_slope=0.02), baseline)
+        self.assertGreater(total(headwind=-5), baseline)
+        self.assertLess(total(headwind=10), baseline)
+
+    def test_vectorized(self):
+        pressure_altitude, oat_f, gross_aircraft_weight, headwind = np.meshgrid(
+            np.arange(0, 8000, 2000),
+            c_to_f(np.arange(-20, 40, 20)),
+            (2250, 3000),
+            (-5, 0, 10),
+            indexing="ij",
+        )
+        distances = takeoff_distances(
+            self.dataplate,
+            pressure_altitude,
+            oat_f,
+            gross_aircraft_weight,
+            60,
+            70,
+            headwind,
+        )
+
+        self.assertEqual(distances.total.shape, pressure_altitude.shape)
+
+        for index in np.ndindex(pressure_altitude.shape):
+            self.assertTrue(
+                math.isclose(
+                    distances.total[index],
+                    takeoff_distances(
+                        self.dataplate,
+                        pressure_altitude[index],
+                        oat_f[index],
+                        gross_aircraft_weight[index],
+                        60,
+                        70,
+                        headwind[index],
+                    ).total,
+                    rel_tol=1e-12,
+                )
+            )
+
+    def test_chart_benchmark(self):
+        # A full takeoff chart: altitude, temperature, weight, wind, and slope.
+        cases = np.meshgrid(
+            np.arange(0, 8000, 1000),
+            c_to_f(np.arange(-20, 45, 5)),
+            (2250, 2500, 2750, 3000),
+            (-5, 0, 5, 10, 15),
+            (-0.01, 0, 0.01),
+            indexing="ij",
+        )
+
+        start = time.perf_counter()
+        distances = takeoff_distances(self.dataplate, *cases[:3], 60, 70, *cases[3:])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(distances.total.size, 6240)
+        self.assertFalse(np.isnan(distances.total).any())
+        self.assertLess(elapsed, 1)
+
+
+class TestLandingDistances(unittest.TestCase):
+    def setUp(self):
+        self.dataplate = N51SW
+
+        pass
+
+    def test_trends(self):
+        baseline = landing_distances(self.dataplate, 0, 59, 3000, 60)
+
+        self.assertTrue(
+            math.isclose(
+                baseline.air_distance,
+                50 / math.tan(math.radians(3)),
+                # of 6 significant digits
+                abs_tol=10**-6,
+            )
+        )
+        self.assertLess(
+            landing_distances(self.dataplate, 0, 59, 3000, 60, headwind=10).total,
+            baseline.total,
+        )
+        self.assertGreater(
+            landing_distances(self.dataplate, 5000, 59, 3000, 60).ground_roll,
+            baseline.ground_roll,
+        )
+        self.assertGreater(
+            landing_distances(
+                self.dataplate, 0, 59, 3000, 60, runway_slope=-0.02
+            ).ground_roll,
+            baseline.ground_roll,
+        )
@@ -0,0 +1,182 @@
+import unittest
+
+import contextlib
+import copy
+import io
+import os
+import sys
+import tempfile
+import types
+from unittest import mock
+from uuid import UUID
+
+import numpy as np
+
+# The ForeFlight API needs session cookies from the environment. Stand in for it,
+# so that each test can swap in its own session.
+foreflight_api = types.ModuleType("examples.foreflight_api")
+foreflight_api.get_aircraft = foreflight_api.create_profile = None
+
+with mock.patch.dict(sys.modules, {"examples.foreflight_api": foreflight_api}):
+    from examples import upload_to_foreflight
+
+
+class Session:
+    """A ForeFlight account with one aircraft, recording uploads."""
+
+    def __init__(self):
+        self.profiles = {}
+        self.uploads = []
+        self.failing = set()
+
+    def get_aircraft(self, account_uuid, aircraft_uuid):
+        return {"profiles": copy.deepcopy(self.profiles)}
+
+    def create_profile(
+        self,
+        account_uuid,
+        metadata_oid,
+        aircraft_oid,
+        aircraft_uuid,
+        performance_profile_name,
+        detailed_performance_model,
+    ):
+        self.uploads.append(performance_profile_name)
+        if performance_profile_name in self.failing:
+            return False
+
+        self.profiles[metadata_oid or performance_profile_name] = {
+            "type": "Detailed",
+            "performanceProfileName": performance_profile_name,
+            "metadataOid": metadata_oid or performance_profile_name,
+        }
+        return True
+
+
+def model(name, fuel_flow):
+    return {
+        "cruise": {"name": name},
+        "points": {1000.0: {"fuelFlow_pph": np.float64(fuel_flow)}},
+    }
+
+
+class TestForeFlightSync(unittest.TestCase):
+    def setUp(self):
+        self.session = Session()
+        for name in ("get_aircraft", "create_profile"):
+            patch = mock.patch.object(
+                upload_to_foreflight, name, getattr(self.session, name)
+            )
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.state_path = os.path.join(directory.name, "state.json")
+        self.aircraft_uuid = UUID(int=1)
+        self.models = {
+            "Best Range": model("Best Range", 60.0),
+            "65% Power": model("65% Power", 75.0),
+        }
+
+        pass
+
+    def sync(self, models, state_path=None):
+        self.session.uploads.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return upload_to_foreflight.sync_foreflight_profiles(
+                UUID(int=0),
+                "aircraft-oid",
+                self.aircraft_uuid,
+                models,
+                state_path,
+            )
+
+    def test_unchanged_profiles_are_skipped(self):
+        self.assertEqual(self.sync(self.models, self.state_path), 0)
+        self.assertEqual(self.session.uploads, ["Best Range", "65% Power"])
+
+        self.assertEqual(self.sync(self.models, self.state_path), 0)
+        self.assertEqual(self.session.uploads, [])
+
+        # Without a state file, everything is uploaded every time.
+        self.sync(self.models)
+        self.assertEqual(self.session.uploads, ["Best Range", "65% Power"])
+
+    def test_changed_profiles_are_uploaded(self):
+        self.sync(self.models, self.state_path)
+
+        self.sync(
+            dict(self.models, **{"65% Power": model("65% Power", 76.0)}),
+            self.state_path,
+        )
+        self.assertEqual(self.session.uploads, ["65% Power"])
+
+        # So is one that's gone missing from the aircraft.
+        del self.session.profiles["Best Range"]
+        self.sync(self.models, self.state_path)
+        self.assertIn("Best Range", self.session.uploads)
+
+    def test_failed_upload_is_not_recorded(self):
+        self.session.failing.add("65% Power")
+
+        self.assertEqual(self.sync(self.models, self.state_path), 1)
+        state = upload_to_foreflight.load_sync_state(self.state_path)
+        self.assertEqual(list(state[str(self.aircraft_uuid)]), ["Best Range"])
+
+        # The next sync tries again.
+        self.session.failing.clear()
+        self.assertEqual(self.sync(self.models, self.state_path), 0)
+        self.assertEqual(self.session.uploads, ["65% Power"])
+
+        # A changed profile that fails to upload keeps its old hash.
+        self.session.failing.add("65% Power")
+        self.sync(
+            dict(self.models, **{"65% Power": model("65% Power", 76.0)}),
+            self.state_path,
+        )
+        state = upload_to_foreflight.load_sync_state(self.state_path)
+        self.assertEqual(
+            state[str(self.aircraft_uuid)]["65% Power"],
+            upload_to_foreflight.detailed_performance_model_hash(
+                self.models["65% Power"]
+            ),
+        )
+
+    def test_state_round_trips(self):
+        self.assertEqual(upload_to_foreflight.load_sync_state(self.state_path), {})
+
+        state = {str(self.aircraft_uuid): {"Best Range": "0" * 64}}
+        upload_to_foreflight.save_sync_state(self.state_path, state)
+        upload_to_foreflight.save_sync_state(self.state_path, state)
+
+        self.assertEqual(upload_to_foreflight.load_sync_state(self.state_path), state)
+        # No temporary files are left behind.
+        self.assertEqual(os.listdir(self.directory), ["state.json"])
+
+    def test_hash(self):
+        # Independent of key order and of NumPy float types.
+        self.assertEqual(
+            upload_to_foreflight.detailed_performance_model_hash(
+                model("Best Range", 60.0)
+            ),
+            upload_to_foreflight.detailed_performance_model_hash(
+                {
+                    "points": {1000.0: {"fuelFlow_pph": 60.0}},
+                    "cruise": {"name": "Best Range"},
+                }
+            ),
+        )
+        self.assertNotEqual(
+            upload_to_foreflight.detailed_performance_model_hash(
+                model("Best Range", 60.0)
+            ),
+            upload_to_foreflight.detailed_performance_model_hash(
+                model("Best Range", 60.1)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
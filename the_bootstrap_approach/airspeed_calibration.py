@@ -19,22 +19,98 @@ def check_strictly_increasing(
     return coordinate_sequence
 
 
+def _astype_like(
+    result: Union[float, npt.NDArray[np.floating]],
+    like: Union[float, npt.NDArray[np.floating]],
+) -> Union[float, npt.NDArray[np.floating]]:
+    # np.interp always computes in float64; keep the precision of the input,
+    # like the equations do.
+    if isinstance(like, np.ndarray) and like.dtype.kind == "f":
+        return result.astype(like.dtype, copy=False)
+
+    return result
+
+
+def _interp(
+    x: Union[float, complex, npt.NDArray[np.inexact]],
+    xp: npt.NDArray[np.floating],
+    fp: npt.NDArray[np.floating],
+) -> Union[float, npt.NDArray[np.inexact]]:
+    # np.interp, with NaN outside the curve. Complex values (complex steps, as
+    # in sensitivity) carry the slope of their segment in their imaginary parts.
+    if np.iscomplexobj(x):
+        real = np.real(x)
+        i = np.clip(np.searchsorted(xp, real, side="right") - 1, 0, len(xp) - 2)
+        slope = (np.diff(fp) / np.diff(xp))[i]
+
+        return _interp(real, xp, fp) + 1j * np.imag(x) * slope
+
+    return np.interp(x, xp, fp, left=np.nan, right=np.nan)
+
+
+def _interp_padded(
+    x: Union[float, npt.NDArray[np.floating]],
+    xp: npt.NDArray[np.floating],
+    fp: npt.NDArray[np.floating],
+) -> npt.NDArray[np.floating]:
+    """Like ``np.interp`` with NaN outside the curve, but for a stack of curves
+    (e.g., a ``Fleet``'s), each padded with trailing NaNs to a common length
+    along the last axis. The other axes of the curves broadcast against ``x``."""
+    x = np.asarray(x)[..., np.newaxis]
+    lengths = np.sum(~np.isnan(xp), axis=-1, keepdims=True)
+
+    # The index of the segment each value falls in. NaN padding never compares
+    # true, so it's never counted.
+    i = np.clip(
+        np.sum(xp <= x, axis=-1, keepdims=True) - 1, 0, np.maximum(lengths - 2, 0)
+    )
+    shape = np.broadcast_shapes(xp.shape[:-1], i.shape[:-1]) + xp.shape[-1:]
+    xp = np.broadcast_to(xp, shape)
+    fp = np.broadcast_to(fp, shape)
+    j = np.minimum(i + 1, shape[-1] - 1)
+
+    x0 = np.take_along_axis(xp, i, axis=-1)
+    x1 = np.take_along_axis(xp, j, axis=-1)
+    y0 = np.take_along_axis(fp, i, axis=-1)
+    y1 = np.take_along_axis(fp, j, axis=-1)
+    last = np.take_along_axis(xp, np.maximum(lengths - 1, 0), axis=-1)
+
+    with np.errstate(invalid="ignore"):
+        result = np.where(
+            (xp[..., :1] <= x) & (x <= last),
+            y0 + (x - x0) * (y1 - y0) / (x1 - x0),
+            np.nan,
+        )
+
+    return result[..., 0]
+
+
 def cas_to_ias(
     dataplate: DataPlate, cas: Union[float, npt.NDArray[np.floating]]
 ) -> Union[float, npt.NDArray[np.floating]]:
     """Convert calibrated airspeed to indicated airspeed, using the dataplate's
     calibration curve."""
-    if dataplate.asi_calibration_curve is not None:
+    if dataplate.asi_calibration_curve is None:
+        # Treat the calibration curve as an optional attribute. If the dataplate
+        # doesn't have a calibration curve, we simply return NaN.
+        return cas * np.nan
+    elif dataplate.asi_calibration_curve.ndim > 2:
+        # A stack of padded curves, e.g. a fleet's.
+        return _astype_like(
+            _interp_padded(
+                cas,
+                dataplate.asi_calibration_curve[..., 0],
+                dataplate.asi_calibration_curve[..., 1],
+            ),
+            cas,
+        )
+    else:
         x = check_strictly_increasing(dataplate.asi_calibration_curve[:, 0])
         y = check_strictly_increasing(dataplate.asi_calibration_curve[:, 1])
 
         # Return NaN if we are trying to determine indicated airspeed outside
         # the bounds of the calibration curve.
-        return np.interp(cas, x, y, left=np.nan, right=np.nan)
-    else:
-        # Treat the calibration curve as an optional attribute. If the dataplate
-        # doesn't have a calibration curve, we simply return NaN.
-        return cas * np.nan
+        return _astype_like(_interp(cas, x, y), cas)
 
 
 def ias_to_cas(
@@ -42,10 +118,19 @@ def ias_to_cas(
 ) -> Union[float, npt.NDArray[np.floating]]:
     """Convert indicated airspeed to calibrated airspeed, using the dataplate's
     calibration curve."""
-    if dataplate.asi_calibration_curve is not None:
+    if dataplate.asi_calibration_curve is None:
+        return ias * np.nan
+    elif dataplate.asi_calibration_curve.ndim > 2:
+        return _astype_like(
+            _interp_padded(
+                ias,
+                dataplate.asi_calibration_curve[..., 1],
+                dataplate.asi_calibration_curve[..., 0],
+            ),
+            ias,
+        )
+    else:
         x = check_strictly_increasing(dataplate.asi_calibration_curve[:, 0])
         y = check_strictly_increasing(dataplate.asi_calibration_curve[:, 1])
 
-        return np.interp(ias, y, x, left=np.nan, right=np.nan)
-    else:
-        return ias * np.nan
+        return _astype_like(_interp(ias, y, x), ias)
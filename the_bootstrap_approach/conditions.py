@@ -1,6 +1,10 @@
+import copy
 import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+import numpy.typing as npt
+
 from the_bootstrap_approach.dataplate import DataPlate
 from the_bootstrap_approach.equations import (
     G,
@@ -12,7 +16,28 @@ from the_bootstrap_approach.equations import (
 from the_bootstrap_approach.mixture import Mixture
 
 
+def leaning_effect_on_shaft_power_output(mixture: Mixture):
+    """Factor by which leaning the mixture changes shaft power output
+    (approximated from the O-540 operator's manual)."""
+    if mixture == Mixture.BEST_ECONOMY:
+        return 0.93
+    elif mixture == Mixture.BEST_POWER:
+        return 1
+    elif mixture == Mixture.FULL_RICH:
+        return 0.9681
+
+
 class Conditions(ABC):
+    # Attributes that astype() casts.
+    _values = (
+        "gross_aircraft_weight",
+        "pressure_altitude",
+        "oat_f",
+        "engine_rpm",
+        "g",
+        "h",
+    )
+
     def __init__(
         self,
         dataplate: DataPlate,
@@ -41,6 +66,16 @@ class Conditions(ABC):
             self.dataplate.wing_aspect_ratio,
         )
 
+    def astype(self, dtype: npt.DTypeLike) -> "Conditions":
+        """Copy these conditions with every value cast to ``dtype``, so that the
+        equations evaluate them at that precision (e.g., ``np.float32``)."""
+        conditions = copy.copy(self)
+
+        for name in self._values:
+            setattr(conditions, name, np.asarray(getattr(self, name), dtype=dtype))
+
+        return conditions
+
     @property
     def relative_atmospheric_density(self):
         return relative_atmospheric_density(self.pressure_altitude, self.oat_f)
@@ -71,12 +106,7 @@ class Conditions(ABC):
 
     @property
     def leaning_effect_on_shaft_power_output(self):
-        if self.mixture == Mixture.BEST_ECONOMY:
-            return 0.93
-        elif self.mixture == Mixture.BEST_POWER:
-            return 1
-        elif self.mixture == Mixture.FULL_RICH:
-            return 0.9681
+        return leaning_effect_on_shaft_power_output(self.mixture)
 
 
 class FullThrottleConditions(Conditions):
@@ -118,6 +148,8 @@ class FullThrottleConditions(Conditions):
 
 
 class PartialThrottleConditions(Conditions):
+    _values = Conditions._values + ("_power",)
+
     def __init__(
         self,
         dataplate: DataPlate,
@@ -1,3 +1,4 @@
+import hashlib
 from typing import Optional
 
 import numpy as np
@@ -5,6 +6,11 @@ import numpy.typing as npt
 
 from the_bootstrap_approach.equations import engine_torque
 from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.propeller_chart import LOWRY_PROPELLER_MAP, PropellerMap
+
+# Marks with_configuration parameters that weren't given (None being a valid
+# calibration curve).
+_UNCHANGED = object()
 
 
 class DataPlate:
@@ -23,6 +29,7 @@ class DataPlate:
         blade_activity_factor,
         z_ratio,
         asi_calibration_curve: Optional[npt.NDArray[npt.NDArray[np.float64]]] = None,
+        propeller_map: Optional[PropellerMap] = None,
     ):
         # Airplane configuration. e.g., flaps/gear position.
         self.configuration = configuration
@@ -38,6 +45,9 @@ class DataPlate:
         self.airplane_efficiency_factor = airplane_efficiency_factor
         # P_0, rated MSL shaft power at rated RPM.
         self.rated_full_throttle_engine_horsepower = 235
+        self._rated_full_throttle_engine_horsepower = (
+            rated_full_throttle_engine_horsepower
+        )
         # P_0, rated MSL power (ft-lbf/sec)
         self.rated_full_throttle_engine_power = (
             rated_full_throttle_engine_horsepower * 550
@@ -70,6 +80,10 @@ class DataPlate:
         # 2D-array containing indicated airspeed as a function of calibrated airspeed,
         # IAS(CAS).
         self.asi_calibration_curve = asi_calibration_curve
+        # The propeller's efficiency map, by default Dr. Lowry's chart.
+        self.propeller_map = (
+            LOWRY_PROPELLER_MAP if propeller_map is None else propeller_map
+        )
 
     def bsfc(self, mixture: Mixture):
         if mixture == Mixture.BEST_POWER:
@@ -78,3 +92,93 @@ class DataPlate:
             return self._bsfc[1]
         elif mixture == Mixture.FULL_RICH:
             return self._bsfc[2]
+
+    def replace(self, **changes) -> "DataPlate":
+        """Copy this dataplate with some of its constructor's parameters
+        changed, e.g. ``N51SW.replace(parasite_drag_coefficient=0.04)``, and every
+        derived parameter recomputed."""
+        parameters = dict(
+            configuration=self.configuration,
+            reference_wing_area=self.reference_wing_area,
+            wing_span=self.wing_span,
+            parasite_drag_coefficient=self.parasite_drag_coefficient,
+            airplane_efficiency_factor=self.airplane_efficiency_factor,
+            rated_full_throttle_engine_horsepower=(
+                self._rated_full_throttle_engine_horsepower
+            ),
+            rated_full_throttle_engine_rpm=self.rated_full_throttle_engine_rpm,
+            engine_power_altitude_dropoff_parameter=(
+                self.engine_power_altitude_dropoff_parameter
+            ),
+            bsfc=self._bsfc,
+            propeller_diameter=self.propeller_diameter,
+            blade_activity_factor=self.blade_activity_factor,
+            z_ratio=self.z_ratio,
+            asi_calibration_curve=self.asi_calibration_curve,
+            propeller_map=self.propeller_map,
+        )
+
+        unknown = changes.keys() - parameters.keys()
+        if unknown:
+            raise TypeError(f"Unknown dataplate parameters: {sorted(unknown)}.")
+
+        parameters.update(changes)
+
+        return DataPlate(**parameters)
+
+    def with_configuration(
+        self,
+        configuration,
+        parasite_drag_coefficient,
+        airplane_efficiency_factor=_UNCHANGED,
+        asi_calibration_curve=_UNCHANGED,
+    ) -> "DataPlate":
+        """Copy this dataplate for another flaps/gear configuration, e.g.
+        ``N51SW.with_configuration("Flaps 25°", 0.052, 0.61)``.
+
+        The airplane efficiency factor and calibration curve are kept unless
+        given, since they may not depend on the configuration.
+        """
+        changes = dict(
+            configuration=configuration,
+            parasite_drag_coefficient=parasite_drag_coefficient,
+        )
+        if airplane_efficiency_factor is not _UNCHANGED:
+            changes["airplane_efficiency_factor"] = airplane_efficiency_factor
+        if asi_calibration_curve is not _UNCHANGED:
+            changes["asi_calibration_curve"] = asi_calibration_curve
+
+        return self.replace(**changes)
+
+    def digest(self) -> str:
+        """A hash of the dataplate's parameters, e.g. to key caches of results
+        computed from it."""
+        parameters = hashlib.sha256(
+            repr(
+                (
+                    self.configuration,
+                    self.reference_wing_area,
+                    self.wing_span,
+                    self.parasite_drag_coefficient,
+                    self.airplane_efficiency_factor,
+                    self.rated_full_throttle_engine_power,
+                    self.rated_full_throttle_engine_rpm,
+                    self.engine_power_altitude_dropoff_parameter,
+                    tuple(self._bsfc),
+                    self.propeller_diameter,
+                    self.blade_activity_factor,
+                    self.z_ratio,
+                )
+            ).encode()
+        )
+
+        if self.asi_calibration_curve is not None:
+            parameters.update(
+                np.ascontiguousarray(self.asi_calibration_curve, dtype=float).tobytes()
+            )
+
+        # Dataplates with the default map hash as they did before maps existed.
+        if self.propeller_map.digest() != LOWRY_PROPELLER_MAP.digest():
+            parameters.update(self.propeller_map.digest().encode())
+
+        return parameters.hexdigest()
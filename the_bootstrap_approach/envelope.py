@@ -0,0 +1,234 @@
+"""Power curves and the flight envelope, on dense grids.
+
+``power_curves`` evaluates power required, power available, and excess power
+over a whole weight × pressure altitude × KCAS grid in one pass, and
+``flight_envelope`` finds the envelope's boundaries in it (VM and Vm, the
+maximum and minimum level flight speeds, VX, VY, and the ceilings) by
+vectorized zero-crossing detection, without a loop over altitudes or speeds.
+Every result is an array, ready to plot, e.g.::
+
+    curves = power_curves(N51SW, (2250, 3000), np.arange(0, 25000, 100),
+                          np.arange(30, 140, 0.1))
+    envelope = flight_envelope(curves)
+    plt.plot(envelope.maximum_level_flight_kcas[0], envelope.pressure_altitude)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.conditions import FullThrottleConditions
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.equations import (
+    c_to_f,
+    kn_to_fts,
+    metric_standard_temperature,
+    power_adjustment_factor_x,
+    power_available,
+    power_required,
+    propeller_advance_ratio,
+    propeller_power_coefficient,
+    sdef_t,
+    tas,
+)
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.propeller_chart import propeller_efficiency
+
+
+@dataclass(frozen=True)
+class PowerCurves:
+    """Full-throttle power curves, in ft-lbf/s, and rates of climb, in ft/min,
+    each of shape (weights, pressure altitudes, KCAS)."""
+
+    gross_aircraft_weight: npt.NDArray[np.float64]
+    pressure_altitude: npt.NDArray[np.float64]
+    kcas: npt.NDArray[np.float64]
+    ktas: npt.NDArray[np.float64]
+    power_required: npt.NDArray[np.float64]
+    power_available: npt.NDArray[np.float64]
+    excess_power: npt.NDArray[np.float64]
+    rate_of_climb: npt.NDArray[np.float64]
+    angle_of_climb: npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class FlightEnvelope:
+    """The envelope's boundaries in KCAS, each of shape (weights, pressure
+    altitudes), and its ceilings in feet, of shape (weights,).
+
+    Speeds are NaN at altitudes where the airplane can't sustain level flight,
+    and ceilings where the grid's altitudes don't bracket them.
+    """
+
+    gross_aircraft_weight: npt.NDArray[np.float64]
+    pressure_altitude: npt.NDArray[np.float64]
+    minimum_level_flight_kcas: npt.NDArray[np.float64]
+    maximum_level_flight_kcas: npt.NDArray[np.float64]
+    best_angle_of_climb_kcas: npt.NDArray[np.float64]
+    best_rate_of_climb_kcas: npt.NDArray[np.float64]
+    best_rate_of_climb: npt.NDArray[np.float64]
+    absolute_ceiling: npt.NDArray[np.float64]
+    service_ceiling: npt.NDArray[np.float64]
+
+
+def power_curves(
+    dataplate: DataPlate,
+    gross_aircraft_weights: npt.ArrayLike,
+    pressure_altitudes: npt.ArrayLike,
+    kcas: npt.ArrayLike,
+    mixture: Mixture = Mixture.BEST_POWER,
+    engine_rpm: float = 2400,
+    isa_diff: float = 0,
+) -> PowerCurves:
+    """Evaluate the full-throttle power curves at every weight, pressure
+    altitude, and KCAS of a grid."""
+    gross_aircraft_weight = np.asarray(gross_aircraft_weights, dtype=float)
+    pressure_altitude = np.asarray(pressure_altitudes, dtype=float)
+    kcas = np.asarray(kcas, dtype=float)
+
+    # Weights, altitudes, and speeds run along the first, second, and third axes.
+    weight = gross_aircraft_weight[:, np.newaxis, np.newaxis]
+    altitude = pressure_altitude[:, np.newaxis]
+    conditions = FullThrottleConditions(
+        dataplate,
+        weight,
+        altitude,
+        c_to_f(metric_standard_temperature(altitude) + isa_diff),
+        mixture,
+        engine_rpm,
+    )
+
+    ktas = tas(kcas, conditions.relative_atmospheric_density)
+    vt = kn_to_fts(ktas)
+
+    # Power available doesn't depend on weight, so it's only evaluated once per
+    # altitude and speed.
+    pav = power_available(
+        propeller_efficiency(
+            sdef_t(dataplate.z_ratio),
+            propeller_advance_ratio(
+                vt, conditions.propeller_rps, dataplate.propeller_diameter
+            ),
+            propeller_power_coefficient(
+                conditions.power,
+                conditions.atmospheric_density,
+                conditions.propeller_rps,
+                dataplate.propeller_diameter,
+            ),
+            power_adjustment_factor_x(dataplate.total_activity_factor),
+            propeller_map=dataplate.propeller_map,
+        ),
+        conditions.power,
+    )
+    pre = power_required(conditions.g, conditions.h, vt)
+    pxs = pav - pre
+
+    with np.errstate(invalid="ignore"):
+        aoc = np.degrees(np.arcsin(pxs / vt / weight))
+
+    shape = pre.shape
+
+    return PowerCurves(
+        gross_aircraft_weight,
+        pressure_altitude,
+        kcas,
+        np.broadcast_to(ktas, shape),
+        pre,
+        np.broadcast_to(pav, shape),
+        pxs,
+        60 * pxs / weight,
+        aoc,
+    )
+
+
+def _crossing(x: np.ndarray, y: np.ndarray, i: np.ndarray, level: float = 0):
+    # Where y crosses level between x[i] and x[i + 1] (along y's last axis), by
+    # linear interpolation.
+    i = np.clip(i, 0, len(x) - 2)[..., np.newaxis]
+    y0 = np.take_along_axis(y, i, -1)[..., 0]
+    y1 = np.take_along_axis(y, i + 1, -1)[..., 0]
+    x0 = x[i[..., 0]]
+    x1 = x[i[..., 0] + 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return x0 + (level - y0) / (y1 - y0) * (x1 - x0)
+
+
+def _parabolic_maximum(x: np.ndarray, y: np.ndarray):
+    # The maximum of y along its last axis, refined by a parabola through the
+    # greatest grid point and its neighbors, as in _parabolic_maximum_row.
+    i = np.nanargmax(np.where(np.isnan(y).all(-1, keepdims=True), 0, y), axis=-1)
+    k = np.clip(i, 1, len(x) - 2)[..., np.newaxis]
+
+    y0, y1, y2 = (np.take_along_axis(y, k + j, -1)[..., 0] for j in (-1, 0, 1))
+    x0, x1, x2 = (x[k[..., 0] + j] for j in (-1, 0, 1))
+    yi = np.take_along_axis(y, i[..., np.newaxis], -1)[..., 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d0 = (y1 - y0) / (x1 - x0)
+        d1 = (y2 - y1) / (x2 - x1)
+        a = (d1 - d0) / (x2 - x0)
+        vertex = (x0 + x1) / 2 - d0 / (2 * a)
+        peak = y0 + d0 * (vertex - x0) + a * (vertex - x0) * (vertex - x1)
+
+    refined = (a < 0) & (x[0] <= vertex) & (vertex <= x[-1])
+
+    return np.where(refined, vertex, x[i]), np.where(refined, peak, yi)
+
+
+def _ceiling(pressure_altitude: np.ndarray, best_rate_of_climb: np.ndarray, level):
+    climbs = best_rate_of_climb >= level
+    # The last altitude at which the airplane still climbs, before the first at
+    # which it doesn't.
+    stops = np.argmin(climbs, axis=-1)
+    bracketed = climbs[..., 0] & ~climbs.all(axis=-1)
+
+    return np.where(
+        bracketed,
+        _crossing(pressure_altitude, best_rate_of_climb, stops - 1, level),
+        np.nan,
+    )
+
+
+def flight_envelope(
+    curves: PowerCurves, stall_kcas: Optional[npt.ArrayLike] = None
+) -> FlightEnvelope:
+    """Find the flight envelope's boundaries in a grid of power curves.
+
+    VM and Vm are where the rate of climb crosses zero on either side of VY. If
+    the airplane still climbs at the grid's slowest (or fastest) speed, that
+    speed bounds the envelope instead. In practice, Vm seldom occurs, because
+    the power-on stall speed is usually much higher: if given, ``stall_kcas``
+    (per weight) bounds the minimum speed from below.
+    """
+    kcas = curves.kcas
+    roc = curves.rate_of_climb
+    climbs = roc > 0
+    any_climb = climbs.any(axis=-1)
+
+    first = np.argmax(climbs, axis=-1)
+    minimum = np.where(first == 0, kcas[0], _crossing(kcas, roc, first - 1))
+
+    last = len(kcas) - 1 - np.argmax(climbs[..., ::-1], axis=-1)
+    maximum = np.where(last == len(kcas) - 1, kcas[-1], _crossing(kcas, roc, last))
+
+    if stall_kcas is not None:
+        stall_kcas = np.asarray(stall_kcas, dtype=float)
+        minimum = np.maximum(minimum, stall_kcas.reshape(stall_kcas.shape + (1,)))
+
+    vx, _ = _parabolic_maximum(kcas, curves.angle_of_climb)
+    vy, best_rate_of_climb = _parabolic_maximum(kcas, roc)
+
+    return FlightEnvelope(
+        curves.gross_aircraft_weight,
+        curves.pressure_altitude,
+        np.where(any_climb, minimum, np.nan),
+        np.where(any_climb, maximum, np.nan),
+        np.where(any_climb, vx, np.nan),
+        np.where(any_climb, vy, np.nan),
+        best_rate_of_climb,
+        _ceiling(curves.pressure_altitude, best_rate_of_climb, 0),
+        _ceiling(curves.pressure_altitude, best_rate_of_climb, 100),
+    )
@@ -1,6 +1,70 @@
-import math
+"""The bootstrap equations.
+
+Every equation here behaves like a NumPy ufunc: arguments may be scalars or
+arrays of any broadcast-compatible shapes, float32 and float64 inputs yield
+results of the same precision, and the result can be written to a caller's
+buffer with the keyword-only ``out`` argument. When every argument is a plain
+Python (or NumPy float64) scalar, the equation skips NumPy altogether, which is
+much faster for single values.
+"""
 
+import functools
+import math
 
+import numpy as np
+
+# Types that take the scalar fast path. np.float64 subclasses float.
+_SCALAR_TYPES = (int, float)
+
+
+def _equation(func):
+    """Give ``func``, written only with arithmetic operators, ufunc semantics."""
+
+    @functools.wraps(func)
+    def wrapper(*args, out=None, **kwargs):
+        if out is None:
+            for arg in args:
+                if not isinstance(arg, _SCALAR_TYPES):
+                    break
+            else:
+                for value in kwargs.values():
+                    if not isinstance(value, _SCALAR_TYPES):
+                        break
+                else:
+                    return func(*args, **kwargs)
+
+        # Leave Python scalars alone, so that NumPy treats them as "weak" and
+        # doesn't promote float32 arrays to float64.
+        result = np.asarray(
+            func(
+                *(
+                    arg if isinstance(arg, _SCALAR_TYPES) else np.asarray(arg)
+                    for arg in args
+                ),
+                **{
+                    key: (
+                        value if isinstance(value, _SCALAR_TYPES) else np.asarray(value)
+                    )
+                    for key, value in kwargs.items()
+                },
+            )
+        )
+
+        # e.g., integer altitudes still yield floating-point results.
+        if result.dtype.kind not in "fc":
+            result = result.astype(np.float64)
+
+        if out is not None:
+            np.copyto(out, result, casting="same_kind")
+            return out
+
+        # Like a ufunc, return a scalar rather than a 0-d array.
+        return result[()]
+
+    return wrapper
+
+
+@_equation
 def engine_torque(power, propeller_rps):
     """Engine torque :math:`M` depends on the following formula:
 
@@ -16,22 +80,26 @@ def engine_torque(power, propeller_rps):
     return power / (2 * math.pi * propeller_rps)
 
 
+@_equation
 def engine_power(torque, propeller_rps):
     return 2 * math.pi * propeller_rps * torque
 
 
+@_equation
 def relative_temperature(oat_f):
     # Temperature ratio is temperature in absolute Fahrenheit (Rankine) units (°R =
     # °F + 459.7) divided by MSL standard temperature [1, p. 7].
     return (oat_f + 459.7) / 518.7
 
 
+@_equation
 def relative_pressure(pressure_altitude):
     # Pressure ratio is temperature in absolute Fahrenheit (Rankine) units (°R =
     # °F + 459.7) divided by MSL standard temperature [1, p. 7].
     return (1 - pressure_altitude / 145457) ** 5.25635
 
 
+@_equation
 def relative_atmospheric_density(pressure_altitude, oat_f):
     """Calculate relative atmospheric density with :math:`h_p` and OAT°F.
 
@@ -47,6 +115,7 @@ def relative_atmospheric_density(pressure_altitude, oat_f):
     return relative_pressure(pressure_altitude) / relative_temperature(oat_f)
 
 
+@_equation
 def atmospheric_density(pressure_altitude, oat_f):
     """Calculate atmospheric density ρ with :math:`h_p` and OAT°F.
 
@@ -61,6 +130,7 @@ def atmospheric_density(pressure_altitude, oat_f):
     return relative_atmospheric_density(pressure_altitude, oat_f) * 0.002377
 
 
+@_equation
 def altitude_power_dropoff_factor(
     relative_atmospheric_density, altitude_engine_power_dropoff_parameter=0.12
 ):
@@ -80,16 +150,19 @@ def altitude_power_dropoff_factor(
     )
 
 
+@_equation
 def c_to_f(c):
     """Convert Celsius to Fahrenheit."""
     return c * (9 / 5) + 32
 
 
+@_equation
 def f_to_c(f):
     """Convert Fahrenheit to Celsius."""
     return (f - 32) * 5 / 9
 
 
+@_equation
 def british_standard_temperature(altitude):
     """Get standard temperature :math:`T_S(h)` at altitude :math:`h` above mean
     sea level.
@@ -104,6 +177,7 @@ def british_standard_temperature(altitude):
     return 59 - 0.003566 * altitude
 
 
+@_equation
 def metric_standard_temperature(altitude):
     """Get standard temperature :math:`T_S(h)` at altitude :math:`h` above mean
     sea level.
@@ -118,6 +192,7 @@ def metric_standard_temperature(altitude):
     return 15 - 0.001981 * altitude
 
 
+@_equation
 def density_altitude(pressure_altitude, oat_f):
     """Get density altitude :math:`h_ρ` with :math:`h_p` and OAT°F.
 
@@ -133,6 +208,7 @@ def density_altitude(pressure_altitude, oat_f):
     )
 
 
+@_equation
 def bootstrap_power_setting_parameter(
     engine_torque, altitude_power_dropoff_factor, base_engine_torque
 ):
@@ -150,6 +226,7 @@ def bootstrap_power_setting_parameter(
     return engine_torque / (altitude_power_dropoff_factor * base_engine_torque)
 
 
+@_equation
 def sdef_t(z_ratio):
     """Slowdown efficiency factor for the tractor propeller :math:`{SDEF}_T` was
     adapted from the 1936 graphs made by Walter Stuart Diehl from British and
@@ -164,6 +241,7 @@ def sdef_t(z_ratio):
     return 1.05263 - 0.00722 * z_ratio - 0.16462 * z_ratio**2 - 0.18341 * z_ratio**3
 
 
+@_equation
 def propeller_advance_ratio(air_speed, propeller_rps, propeller_diameter):
     """Propeller advance ratio :math:`J` depends on the following formula:
 
@@ -180,6 +258,7 @@ def propeller_advance_ratio(air_speed, propeller_rps, propeller_diameter):
     return air_speed / (propeller_rps * propeller_diameter)
 
 
+@_equation
 def propeller_power_coefficient(
     power, atmospheric_density, propeller_rps, propeller_diameter
 ):
@@ -199,6 +278,7 @@ def propeller_power_coefficient(
     return power / (atmospheric_density * (propeller_rps**3) * (propeller_diameter**5))
 
 
+@_equation
 def power_adjustment_factor_x(total_activity_factor):
     """Power adjustment factor :math:`X` for your propeller depends on its TAF
     according to the (curve-fit) formula:
@@ -215,11 +295,13 @@ def power_adjustment_factor_x(total_activity_factor):
     return 0.001515 * total_activity_factor - 0.088
 
 
+@_equation
 def G(atmospheric_density, reference_wing_area, parasite_drag_coefficient):
     """Calculate composite bootstrap parameter :math:`G`."""
     return 0.5 * atmospheric_density * reference_wing_area * parasite_drag_coefficient
 
 
+@_equation
 def H(
     gross_aircraft_weight,
     atmospheric_density,
@@ -237,6 +319,7 @@ def H(
     )
 
 
+@_equation
 def power_required(g, h, air_speed):
     """Determine power required :math:`P_{re}` to overcome the total drag force
     at air speed :math:`V`."""
@@ -244,26 +327,65 @@ def power_required(g, h, air_speed):
     return g * air_speed**3 + h / air_speed
 
 
+@_equation
+def best_glide_speed(g, h):
+    """Determine best glide speed, the speed for minimum drag.
+
+    :math:`V_{BG} = (H/G)^\\frac{1}{4}`
+
+    Args:
+        g: :math:`G`, composite bootstrap parameter.
+        h: :math:`H`, composite bootstrap parameter.
+
+    Returns:
+        :math:`V_{BG}`, best glide speed (true airspeed) in ft/sec.
+    """
+    return (h / g) ** (1 / 4)
+
+
+@_equation
+def minimum_power_speed(g, h):
+    """Determine the speed for minimum power required, which is also the speed
+    for minimum sink in a power-off glide.
+
+    :math:`V_{MP} = (H/3G)^\\frac{1}{4}`
+
+    Args:
+        g: :math:`G`, composite bootstrap parameter.
+        h: :math:`H`, composite bootstrap parameter.
+
+    Returns:
+        :math:`V_{MP}`, minimum power speed (true airspeed) in ft/sec.
+    """
+    return (h / (3 * g)) ** (1 / 4)
+
+
+@_equation
 def power_available(eta, power):
     return eta * power
 
 
+@_equation
 def tas(cas, relative_atmospheric_density):
-    return cas / math.sqrt(relative_atmospheric_density)
+    return cas / relative_atmospheric_density**0.5
 
 
+@_equation
 def cas(tas, relative_atmospheric_density):
-    return math.sqrt(relative_atmospheric_density) * tas
+    return relative_atmospheric_density**0.5 * tas
 
 
+@_equation
 def kn_to_fts(kn):
     return kn * (6076.115 / 3600)
 
 
+@_equation
 def fts_to_kn(fts):
     return fts * (3600 / 6076.115)
 
 
+@_equation
 def fuel_gal_to_lbf(fuel_gal, oat_f):
     """Convert gallons per hour of AvGas to pounds per hour, considering
     temperature variation."""
@@ -273,6 +395,7 @@ def fuel_gal_to_lbf(fuel_gal, oat_f):
     return fuel_gal * fuel_lbf_per_gal
 
 
+@_equation
 def fuel_lbf_to_gal(fuel_lbf, oat_f):
     """Convert pounds per hour of AvGas to gallons per hour per, considering
     temperature variation."""
@@ -282,16 +405,19 @@ def fuel_lbf_to_gal(fuel_lbf, oat_f):
     return fuel_lbf / fuel_lbf_per_gal
 
 
+@_equation
 def ft_lbfs_to_hp(ft_lbfs):
     return ft_lbfs / 550
 
 
+@_equation
 def scale_v_speed_by_weight(speed_at_old_weight, old_weight, new_weight):
     return speed_at_old_weight + speed_at_old_weight / (2 * new_weight) * (
         new_weight - old_weight
     )
 
 
+@_equation
 def lift_coefficient(
     gross_aircraft_weight, atmospheric_density, air_speed, reference_wing_area
 ):
@@ -0,0 +1,219 @@
+"""Columnar binary export of performance tables, profiles, and grids.
+
+Every exporter here writes one array per column, named after the
+``ByKCASRowIndex``/``ByAltitudeRowIndex`` members, alongside JSON metadata:
+
+- ``.npz`` archives (uncompressed), which ``load_npz`` memory-maps, so loading
+  even a million-row sweep is nearly instantaneous and copies nothing.
+- Arrow IPC and Parquet files, if pyarrow is installed (``pip install
+  the-bootstrap-approach[arrow]``). Arrow IPC files are memory-mapped on load,
+  too.
+"""
+
+import json
+import struct
+import zipfile
+from enum import IntEnum
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    PerformanceProfile,
+)
+
+# The archive member holding the metadata, as a JSON string.
+_METADATA = "__metadata__"
+
+
+def table_columns(
+    table: np.ndarray, index: Type[IntEnum] = ByKCASRowIndex
+) -> Dict[str, np.ndarray]:
+    """Name the columns (the last axis) of a table, profile, or grid, without
+    copying them."""
+    return {member.name: table[..., member] for member in index}
+
+
+def profile_columns(profile: PerformanceProfile) -> Dict[str, np.ndarray]:
+    return table_columns(profile.data, ByAltitudeRowIndex)
+
+
+def profile_metadata(profile: PerformanceProfile) -> Dict[str, Any]:
+    return {
+        "name": profile.name,
+        "configuration": profile.dataplate.configuration,
+        "gross_aircraft_weight": float(profile.gross_aircraft_weight),
+        "isa_diff": float(profile.isa_diff),
+    }
+
+
+def grid_columns(
+    data: np.ndarray,
+    axes: Mapping[str, np.ndarray],
+    columns: Sequence[ByKCASRowIndex] = tuple(ByKCASRowIndex),
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Name the columns of a grid (e.g., a ``SharedGrid``'s ``data``), and record
+    its axes as metadata."""
+    return (
+        {column.name: data[..., i] for i, column in enumerate(columns)},
+        {"axes": {name: np.asarray(axis).tolist() for name, axis in axes.items()}},
+    )
+
+
+def save_npz(
+    file: str,
+    columns: Mapping[str, npt.ArrayLike],
+    metadata: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Save named columns to an uncompressed ``.npz`` archive."""
+    np.savez(
+        file,
+        **{name: np.ascontiguousarray(column) for name, column in columns.items()},
+        **{_METADATA: np.array(json.dumps(dict(metadata or {})))},
+    )
+
+
+def load_npz(file: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Load the columns and metadata that ``save_npz`` saved.
+
+    ``np.load`` reads each member of an archive into memory. Since ``save_npz``
+    stores members uncompressed, each column can instead be memory-mapped
+    straight from the archive, so nothing is read until it's used.
+    """
+    columns = {}
+    metadata = {}
+
+    with open(file, "rb") as f, zipfile.ZipFile(f) as archive:
+        for info in archive.infolist():
+            name = info.filename[: -len(".npy")]
+
+            if name == _METADATA:
+                with archive.open(info) as member:
+                    metadata = json.loads(str(np.lib.format.read_array(member)))
+                continue
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{name!r} is compressed, so it can't be mapped.")
+
+            # The member's data follows its local file header, whose file name
+            # and extra field lengths may differ from the central directory's.
+            f.seek(info.header_offset)
+            header = f.read(zipfile.sizeFileHeader)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + len(header) + name_length + extra_length)
+
+            if np.lib.format.read_magic(f) == (1, 0):
+                header = np.lib.format.read_array_header_1_0(f)
+            else:
+                header = np.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+
+            columns[name] = np.memmap(
+                file,
+                dtype=dtype,
+                mode="r",
+                offset=f.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+
+    return columns, metadata
+
+
+def save_profile_npz(file: str, profile: PerformanceProfile) -> None:
+    save_npz(file, profile_columns(profile), profile_metadata(profile))
+
+
+def load_profile_npz(file: str, dataplate: DataPlate) -> PerformanceProfile:
+    """Load a profile that ``save_profile_npz`` saved, for ``dataplate``."""
+    columns, metadata = load_npz(file)
+
+    return PerformanceProfile(
+        metadata["name"],
+        dataplate,
+        metadata["gross_aircraft_weight"],
+        metadata["isa_diff"],
+        np.column_stack([columns[member.name] for member in ByAltitudeRowIndex]),
+    )
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow and Parquet export require pyarrow: "
+            "pip install the-bootstrap-approach[arrow]"
+        ) from None
+
+    return pyarrow
+
+
+def _arrow_table(
+    columns: Mapping[str, npt.ArrayLike], metadata: Optional[Mapping[str, Any]]
+):
+    pa = _pyarrow()
+
+    # Arrow columns are one-dimensional, so grids are flattened (in C order).
+    return pa.table(
+        {name: np.ravel(column) for name, column in columns.items()},
+        metadata={_METADATA: json.dumps(dict(metadata or {}))},
+    )
+
+
+def save_arrow(
+    file: str,
+    columns: Mapping[str, npt.ArrayLike],
+    metadata: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Save named columns to an (uncompressed) Arrow IPC file."""
+    pa = _pyarrow()
+
+    table = _arrow_table(columns, metadata)
+    with pa.OSFile(file, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _arrow_columns(table) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    columns = {}
+
+    for name in table.column_names:
+        column = table[name]
+
+        # A single chunk without nulls converts to NumPy without a copy.
+        if column.num_chunks == 1:
+            columns[name] = column.chunk(0).to_numpy()
+        else:
+            columns[name] = column.to_numpy()
+
+    return columns, json.loads(table.schema.metadata[_METADATA.encode()])
+
+
+def load_arrow(file: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Load the columns and metadata that ``save_arrow`` saved, memory-mapped."""
+    pa = _pyarrow()
+
+    return _arrow_columns(pa.ipc.open_file(pa.memory_map(file, "r")).read_all())
+
+
+def save_parquet(
+    file: str,
+    columns: Mapping[str, npt.ArrayLike],
+    metadata: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Save named columns to a Parquet file."""
+    _pyarrow()
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(_arrow_table(columns, metadata), file)
+
+
+def load_parquet(file: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    _pyarrow()
+    import pyarrow.parquet
+
+    return _arrow_columns(pyarrow.parquet.read_table(file))
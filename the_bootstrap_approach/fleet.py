@@ -0,0 +1,291 @@
+"""Evaluate many aircraft at once.
+
+A ``Fleet`` stacks the parameters of many ``DataPlate``s into arrays, one
+element per aircraft along the first axis, and stands in for a dataplate
+anywhere the bootstrap equations are evaluated, e.g.::
+
+    fleet = Fleet([N51SW, N4321X, ...])
+    conditions = FullThrottleConditions(fleet, 3000, 8000, 30, mixture, 2400)
+    tables = bootstrap_cruise_performance_table(fleet, conditions, 60, 160, 1)
+
+``tables[i]`` is aircraft ``i``'s table. Every aircraft is computed in a single
+vectorized pass, so a whole fleet takes about as long as one aircraft does.
+
+``fleet_profiles`` builds by-altitude profiles the same way, with settings that
+may differ by aircraft or by altitude, e.g. each aircraft at 65% of its own
+rated power::
+
+    profiles = fleet_profiles(
+        fleet,
+        3000,
+        np.arange(0, 20000, 1000),
+        np.arange(60, 180, 0.5),
+        mixture,
+        2200,
+        max_level_flight_speed_row,
+        percent_power=65,
+    )
+
+The "aircraft" may just as well be one airframe's flaps/gear configurations,
+whose parasite drag, efficiency factor, and calibration differ::
+
+    fleet = Fleet(
+        [
+            N51SW,
+            N51SW.with_configuration("Flaps 10°", 0.041),
+            N51SW.with_configuration("Flaps 25°", 0.052, 0.61),
+        ]
+    )
+    tables = fleet.by_configuration(
+        bootstrap_cruise_performance_table(fleet, conditions, 60, 160, 1)
+    )
+
+so that ``tables["Flaps 25°"]`` is that configuration's table.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.airspeed_calibration import check_strictly_increasing
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    PerformanceProfile,
+    _bootstrap_performance_table,
+)
+
+# The numeric DataPlate attributes that a Fleet stacks.
+_PARAMETERS = (
+    "reference_wing_area",
+    "wing_span",
+    "wing_aspect_ratio",
+    "parasite_drag_coefficient",
+    "airplane_efficiency_factor",
+    "rated_full_throttle_engine_horsepower",
+    "rated_full_throttle_engine_power",
+    "rated_full_throttle_engine_rpm",
+    "rated_full_throttle_propeller_rps",
+    "rated_full_throttle_engine_torque",
+    "engine_power_altitude_dropoff_parameter",
+    "propeller_diameter",
+    "blade_activity_factor",
+    "total_activity_factor",
+    "z_ratio",
+)
+
+
+class Fleet:
+    """The parameters of many dataplates, as arrays (a struct of arrays).
+
+    Each parameter has shape ``(len(dataplates),) + (1,) * axes``, so that it
+    broadcasts against the ``axes`` trailing axes of the operating conditions
+    and speeds it's evaluated with (e.g., ``axes=1`` for a table's KCAS axis, or
+    ``axes=2`` for altitudes by KCAS), and every result gains a leading aircraft
+    axis.
+
+    Calibration curves of different lengths are padded with NaNs to the longest
+    one. An aircraft without a calibration curve gets an all-NaN curve, so its
+    KIAS are NaN, as they'd be for its dataplate. Every aircraft must share one
+    propeller map.
+    """
+
+    def __init__(self, dataplates: Sequence[DataPlate], axes: int = 1):
+        if len(dataplates) == 0:
+            raise ValueError("A fleet needs at least one dataplate.")
+
+        self.dataplates = tuple(dataplates)
+        self.axes = axes
+        shape = (len(self.dataplates),) + (1,) * axes
+
+        propeller_maps = {
+            dataplate.propeller_map.digest(): dataplate.propeller_map
+            for dataplate in self.dataplates
+        }
+        if len(propeller_maps) != 1:
+            raise ValueError("A fleet's dataplates must share a propeller map.")
+        (self.propeller_map,) = propeller_maps.values()
+
+        self.configuration = np.array(
+            [dataplate.configuration for dataplate in self.dataplates], dtype=object
+        )
+
+        for name in _PARAMETERS:
+            values = [getattr(dataplate, name) for dataplate in self.dataplates]
+            # Floating point, unless a parameter is complex (see ``sensitivity``).
+            setattr(
+                self,
+                name,
+                np.array(values, dtype=np.result_type(float, *values)).reshape(shape),
+            )
+
+        curves = [
+            (
+                np.empty((0, 2))
+                if dataplate.asi_calibration_curve is None
+                else np.asarray(dataplate.asi_calibration_curve, dtype=float)
+            )
+            for dataplate in self.dataplates
+        ]
+        self.asi_calibration_curve = np.full(
+            (len(curves), max(1, max(len(curve) for curve in curves)), 2), np.nan
+        )
+        for curve, padded in zip(curves, self.asi_calibration_curve):
+            check_strictly_increasing(curve[:, 0])
+            check_strictly_increasing(curve[:, 1])
+            padded[: len(curve)] = curve
+        self.asi_calibration_curve = self.asi_calibration_curve.reshape(
+            shape + self.asi_calibration_curve.shape[1:]
+        )
+
+    def __len__(self) -> int:
+        return len(self.dataplates)
+
+    def __getitem__(self, i: int) -> DataPlate:
+        return self.dataplates[i]
+
+    def index(self, configuration) -> int:
+        """The position of the (only) dataplate with ``configuration``."""
+        (positions,) = np.nonzero(self.configuration == configuration)
+
+        if len(positions) != 1:
+            raise KeyError(
+                f"Expected one {configuration!r} configuration, "
+                f"found {len(positions)}."
+            )
+
+        return int(positions[0])
+
+    def by_configuration(self, results: Sequence[Any]) -> Dict[Any, Any]:
+        """Index per-aircraft results (e.g., tables or profiles, in fleet order)
+        by configuration."""
+        if len(set(self.configuration)) != len(self):
+            raise ValueError("The fleet's configurations aren't unique.")
+
+        return dict(zip(self.configuration, results))
+
+    def with_axes(self, axes: int) -> "Fleet":
+        """The same fleet, broadcasting against ``axes`` trailing axes."""
+        return Fleet(self.dataplates, axes)
+
+    def bsfc(self, mixture: Mixture) -> npt.NDArray[np.float64]:
+        return np.array(
+            [dataplate.bsfc(mixture) for dataplate in self.dataplates], dtype=float
+        ).reshape(self.reference_wing_area.shape)
+
+    def digest(self) -> str:
+        return hashlib.sha256(
+            "".join(dataplate.digest() for dataplate in self.dataplates).encode()
+        ).hexdigest()
+
+
+def fleet_profiles(
+    fleet: Fleet,
+    gross_aircraft_weight: float,
+    pressure_altitudes: npt.ArrayLike,
+    kcas: npt.ArrayLike,
+    mixture: Mixture,
+    engine_rpm: npt.ArrayLike,
+    select: Callable[[np.ndarray], Optional[npt.NDArray[np.float64]]],
+    power: Optional[npt.ArrayLike] = None,
+    percent_power: Optional[npt.ArrayLike] = None,
+    isa_diff: float = 0,
+    name: str = "Fleet",
+) -> List[PerformanceProfile]:
+    """Build a by-altitude profile for every aircraft in the fleet.
+
+    A table over ``kcas`` is evaluated for every aircraft at every pressure
+    altitude in one pass, at full throttle or, if given, at ``power`` (or
+    ``percent_power`` of each aircraft's own rated power), capped at full
+    throttle. Then ``select`` picks each table's row (e.g.,
+    ``best_rate_of_climb_row``). As with ``by_altitude_profile``, each profile
+    ends below the first altitude where there's no row, or where the aircraft
+    can't sustain level flight.
+
+    ``engine_rpm``, ``power``, and ``percent_power`` broadcast against the
+    fleet's (aircraft, altitude) axes, so that each may be one setting for the
+    whole fleet, one per altitude (e.g., the best-range setting at each
+    altitude), or one per aircraft (with shape ``(len(fleet), 1)``).
+
+    Returns:
+        One ``PerformanceProfile`` per aircraft, in fleet order.
+    """
+    if power is not None and percent_power is not None:
+        raise ValueError("Specify either a power or a percent power, not both.")
+
+    fleet = fleet.with_axes(2)
+
+    pressure_altitude = np.asarray(pressure_altitudes, dtype=float)[:, np.newaxis]
+    kcas = np.asarray(kcas, dtype=float)
+    oat_f = c_to_f(metric_standard_temperature(pressure_altitude) + isa_diff)
+
+    def by_aircraft_and_altitude(value):
+        # Leave the trailing KCAS axis free.
+        return np.broadcast_to(value, (len(fleet), len(pressure_altitude)))[
+            ..., np.newaxis
+        ]
+
+    engine_rpm = by_aircraft_and_altitude(engine_rpm)
+    if percent_power is not None:
+        power = (
+            fleet.rated_full_throttle_engine_power[..., 0]
+            * np.asarray(percent_power)
+            / 100
+        )
+
+    conditions = FullThrottleConditions(
+        fleet, gross_aircraft_weight, pressure_altitude, oat_f, mixture, engine_rpm
+    )
+    if power is not None:
+        conditions = PartialThrottleConditions(
+            fleet,
+            gross_aircraft_weight,
+            pressure_altitude,
+            oat_f,
+            mixture,
+            engine_rpm,
+            np.minimum(by_aircraft_and_altitude(power), conditions.power),
+        )
+
+    # Aircraft by altitude by KCAS.
+    tables = _bootstrap_performance_table(fleet, conditions, kcas)
+
+    profiles = []
+    for dataplate, aircraft_tables in zip(fleet.dataplates, tables):
+        rows = []
+
+        for table in aircraft_tables:
+            row = select(table)
+
+            if row is None or not row[ByKCASRowIndex.RATE_OF_CLIMB] >= 0:
+                break
+
+            rows.append(row)
+
+        data = np.empty((len(rows), len(ByAltitudeRowIndex)))
+        data[:, ByAltitudeRowIndex.PRESSURE_ALTITUDE] = pressure_altitude[
+            : len(rows), 0
+        ]
+        if rows:
+            data[:, ByAltitudeRowIndex.KCAS :] = rows
+
+        profiles.append(
+            PerformanceProfile(
+                f"{name}, {gross_aircraft_weight} lbf, ISA{isa_diff:+} ℃",
+                dataplate,
+                gross_aircraft_weight,
+                isa_diff,
+                data,
+            )
+        )
+
+    return profiles
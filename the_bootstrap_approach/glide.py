@@ -0,0 +1,126 @@
+from typing import Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.equations import (
+    G,
+    H,
+    atmospheric_density,
+    best_glide_speed as _best_glide_speed,
+    cas,
+    fts_to_kn,
+    kn_to_fts,
+    minimum_power_speed as _minimum_power_speed,
+    power_required,
+    relative_atmospheric_density,
+    tas,
+)
+
+# Every function in this module broadcasts over its pressure altitude, OAT°F, and
+# gross aircraft weight arguments, so a whole glide table (e.g., weights down one
+# axis and altitudes across the other) takes a single call.
+ArrayLike = Union[float, npt.NDArray[np.floating]]
+
+
+def _g_h(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+) -> Tuple[ArrayLike, ArrayLike]:
+    rho = atmospheric_density(pressure_altitude, oat_f)
+
+    return (
+        G(rho, dataplate.reference_wing_area, dataplate.parasite_drag_coefficient),
+        H(
+            gross_aircraft_weight,
+            rho,
+            dataplate.reference_wing_area,
+            dataplate.airplane_efficiency_factor,
+            dataplate.wing_aspect_ratio,
+        ),
+    )
+
+
+def best_glide_speed(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+) -> ArrayLike:
+    """Best glide (minimum drag) speed in KCAS."""
+    g, h = _g_h(dataplate, gross_aircraft_weight, pressure_altitude, oat_f)
+
+    return cas(
+        fts_to_kn(_best_glide_speed(g, h)),
+        relative_atmospheric_density(pressure_altitude, oat_f),
+    )
+
+
+def minimum_power_speed(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+) -> ArrayLike:
+    """Minimum power required speed in KCAS."""
+    g, h = _g_h(dataplate, gross_aircraft_weight, pressure_altitude, oat_f)
+
+    return cas(
+        fts_to_kn(_minimum_power_speed(g, h)),
+        relative_atmospheric_density(pressure_altitude, oat_f),
+    )
+
+
+def minimum_sink_speed(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+) -> ArrayLike:
+    """Minimum sink speed in KCAS.
+
+    In a power-off glide, the sink rate is power required divided by weight, so
+    minimum sink occurs at the minimum power required speed.
+    """
+    return minimum_power_speed(
+        dataplate, gross_aircraft_weight, pressure_altitude, oat_f
+    )
+
+
+def sink_rate(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+    kcas: ArrayLike,
+) -> ArrayLike:
+    """Power-off sink rate (ft/min) at ``kcas``."""
+    g, h = _g_h(dataplate, gross_aircraft_weight, pressure_altitude, oat_f)
+    vt = kn_to_fts(tas(kcas, relative_atmospheric_density(pressure_altitude, oat_f)))
+
+    return 60 * power_required(g, h, vt) / gross_aircraft_weight
+
+
+def glide_ratio(
+    dataplate: DataPlate,
+    gross_aircraft_weight: ArrayLike,
+    pressure_altitude: ArrayLike,
+    oat_f: ArrayLike,
+    kcas: ArrayLike,
+) -> ArrayLike:
+    """Power-off glide ratio (feet forward per foot down, in still air) at
+    ``kcas``.
+
+    At best glide speed, this is the maximum glide ratio, :math:`W/2\\sqrt{GH}`,
+    which depends on neither altitude nor weight.
+    """
+    vt = kn_to_fts(tas(kcas, relative_atmospheric_density(pressure_altitude, oat_f)))
+
+    return (
+        60
+        * vt
+        / sink_rate(dataplate, gross_aircraft_weight, pressure_altitude, oat_f, kcas)
+    )
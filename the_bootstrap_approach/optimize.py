@@ -0,0 +1,421 @@
+"""Choose power settings by gradient-based optimization.
+
+``optimize_power_setting`` finds the engine RPM and power that maximize (or
+minimize) a cruise quantity at VM, the maximum level flight speed at that
+setting (i.e., where the airplane cruises), e.g., for best range at 8,000'::
+
+    setting = optimize_power_setting(
+        N51SW, 3000, 8000, 30, Mixture.BEST_ECONOMY, ByKCASRowIndex.MPG
+    )
+
+or for the fastest cruise on 10 GPH::
+
+    setting = optimize_power_setting(
+        N51SW, 3000, 8000, 30, Mixture.BEST_POWER, ByKCASRowIndex.KTAS,
+        maximum_gph=10,
+    )
+
+(The least fuel per NM is the most MPG.) The setting stays within RPM limits,
+a maximum percent power, full throttle (which falls off with altitude), and,
+optionally, a fuel flow cap.
+
+Gradients are exact: as in ``sensitivity``, they're taken by complex steps,
+here through the solution for VM itself, since a Newton iteration run in
+complex arithmetic converges to the perturbed root. A projected quasi-Newton
+(BFGS) method then converges in a few dozen evaluations, where enumerating a
+grid of settings takes hundreds to thousands.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    _bootstrap_performance_columns,
+    bootstrap_cruise_performance_table,
+    max_level_flight_speed_row,
+)
+
+# The complex step, relative to each variable's value.
+_STEP = 1e-30
+
+
+@dataclass(frozen=True)
+class PowerSetting:
+    """An optimal power setting, and the cruise performance table row (at VM)
+    it yields."""
+
+    engine_rpm: float
+    power: float
+    row: npt.NDArray[np.float64]
+    # The objective's gradient with respect to RPM and power (ft-lbf/s).
+    gradient: Tuple[float, float]
+    # How many times the objective and its gradient were evaluated.
+    evaluations: int
+    converged: bool
+
+
+class _Problem:
+    # The setting is optimized as x = (RPM, throttle), each scaled to [0, 1],
+    # where throttle runs from the least power allowed to the most allowed at
+    # that RPM. That turns every limit into a bound on x.
+    def __init__(
+        self,
+        dataplate: DataPlate,
+        gross_aircraft_weight: float,
+        pressure_altitude: float,
+        oat_f: float,
+        mixture: Mixture,
+        objective: ByKCASRowIndex,
+        maximize: bool,
+        rpm_limits: Tuple[float, float],
+        power_limits: Tuple[float, float],
+        kcas_range: Tuple[float, float],
+    ):
+        self.dataplate = dataplate
+        self.conditions = (gross_aircraft_weight, pressure_altitude, oat_f, mixture)
+        self.objective = objective
+        self.sign = 1 if maximize else -1
+        self.rpm_limits = rpm_limits
+        self.power_limits = power_limits
+        self.kcas_range = kcas_range
+        self.evaluations = 0
+
+        # Full-throttle power is proportional to RPM.
+        self.full_throttle_power_per_rpm = FullThrottleConditions(
+            dataplate, *self.conditions, 1
+        ).power
+
+    def maximum_power(self, engine_rpm: float) -> float:
+        return min(self.power_limits[1], self.full_throttle_power_per_rpm * engine_rpm)
+
+    def setting(self, x: np.ndarray) -> Tuple[float, float]:
+        """The engine RPM and power at x."""
+        engine_rpm = self.rpm_limits[0] + x[0] * (
+            self.rpm_limits[1] - self.rpm_limits[0]
+        )
+        power = self.power_limits[0] + x[1] * (
+            self.maximum_power(engine_rpm) - self.power_limits[0]
+        )
+
+        return engine_rpm, power
+
+    def jacobian(self, x: np.ndarray) -> np.ndarray:
+        """The derivatives of the engine RPM and power with respect to x."""
+        engine_rpm, _ = self.setting(x)
+        rpm_range = self.rpm_limits[1] - self.rpm_limits[0]
+        # Past the RPM where full throttle reaches the power limit, the most
+        # power allowed stops growing with RPM.
+        full_throttle = self.full_throttle_power_per_rpm * engine_rpm
+        slope = (
+            self.full_throttle_power_per_rpm
+            if full_throttle < self.power_limits[1]
+            else 0
+        )
+
+        return np.array(
+            [
+                [rpm_range, 0],
+                [
+                    x[1] * slope * rpm_range,
+                    self.maximum_power(engine_rpm) - self.power_limits[0],
+                ],
+            ]
+        )
+
+    def _vm(self, engine_rpm, power, kcas: complex) -> Optional[np.ndarray]:
+        # Solve for VM, where excess power falls to zero at the high-speed end,
+        # by Newton's method, at each (complex) setting at once. The slope only
+        # steers the iteration, so a real difference is good enough. The
+        # complex root it converges to carries the derivatives of VM.
+        conditions = PartialThrottleConditions(
+            self.dataplate, *self.conditions, engine_rpm, power
+        )
+        kcas = np.full(len(engine_rpm), kcas, dtype=complex)
+        delta = 1e-3
+
+        for _ in range(50):
+            columns = _bootstrap_performance_columns(
+                self.dataplate, conditions, np.stack([kcas, kcas.real + delta])
+            )
+            excess_power = columns[ByKCASRowIndex.EXCESS_POWER]
+            slope = (excess_power[1].real - excess_power[0].real) / delta
+
+            # Past VM, excess power falls with speed. Elsewhere, we're on the
+            # wrong side of the power curve.
+            if not (slope < 0).all():
+                return None
+
+            step = excess_power[0] / slope
+            kcas = kcas - step
+
+            if not (
+                (self.kcas_range[0] <= kcas.real) & (kcas.real <= self.kcas_range[1])
+            ).all():
+                return None
+
+            # Within a step this small, the columns at the last estimate are as
+            # good as at the next.
+            if (np.abs(step) < 1e-10).all():
+                return np.stack(columns, axis=-1)[0]
+
+        return None
+
+    def coordinates(self, engine_rpm: float, power: float) -> np.ndarray:
+        """The x nearest the engine RPM and power."""
+        rpm_range = self.rpm_limits[1] - self.rpm_limits[0]
+        rpm = (engine_rpm - self.rpm_limits[0]) / rpm_range if rpm_range else 0
+        x = np.clip(np.array([rpm, 0.0]), 0, 1)
+        power_range = self.maximum_power(self.setting(x)[0]) - self.power_limits[0]
+        x[1] = (power - self.power_limits[0]) / power_range if power_range else 1
+
+        return np.clip(x, 0, 1)
+
+    def _cruise_row(self, x: np.ndarray) -> Optional[np.ndarray]:
+        self.evaluations += 1
+
+        return max_level_flight_speed_row(
+            bootstrap_cruise_performance_table(
+                self.dataplate,
+                PartialThrottleConditions(
+                    self.dataplate, *self.conditions, *self.setting(x)
+                ),
+                *self.kcas_range,
+                1,
+            )
+        )
+
+    def start(self, x: Optional[np.ndarray]) -> Optional[Tuple[np.ndarray, float]]:
+        """A setting with VM within kcas_range, and its VM: x, if it is one, or
+        else one found by bisecting the throttle at the middle, top, and bottom
+        of the RPM range, or None."""
+        if x is not None:
+            row = self._cruise_row(x)
+
+            if row is not None and row[ByKCASRowIndex.RATE_OF_CLIMB] <= 0:
+                return x, row[ByKCASRowIndex.KCAS]
+
+        for rpm in (0.5, 1.0, 0.0):
+            low, high = 0.0, 1.0
+            throttle = 1.0
+
+            for _ in range(12):
+                x = np.array([rpm, throttle])
+                row = self._cruise_row(x)
+
+                if row is None:
+                    # No level flight within kcas_range. Add power.
+                    low = throttle
+                elif row[ByKCASRowIndex.RATE_OF_CLIMB] > 0:
+                    # VM lies past kcas_range. Take some away.
+                    high = throttle
+                else:
+                    return x, row[ByKCASRowIndex.KCAS]
+
+                throttle = (low + high) / 2
+
+        return None
+
+    def evaluate(self, x: np.ndarray, kcas: float):
+        """The objective (to maximize), its gradient with respect to RPM and
+        power, and the row at VM (starting the search for it from ``kcas``), or
+        None where there's no level flight within kcas_range."""
+        self.evaluations += 1
+        engine_rpm, power = self.setting(x)
+
+        # Perturb RPM in the first setting, and power in the second.
+        steps = _STEP * np.array([engine_rpm, power])
+        rows = self._vm(
+            engine_rpm + np.array([steps[0] * 1j, 0]),
+            power + np.array([0, steps[1] * 1j]),
+            kcas,
+        )
+
+        if rows is None:
+            return None
+
+        value = self.sign * rows[:, self.objective]
+        row = rows[0].real
+        # By construction, this is level flight. Don't let rounding error say
+        # otherwise.
+        row[ByKCASRowIndex.RATE_OF_CLIMB] = 0
+
+        return value[0].real, value.imag / steps, row
+
+
+def _bfgs_update(hessian: np.ndarray, step: np.ndarray, change: np.ndarray):
+    # The BFGS update of the (negated) objective's approximate Hessian from the
+    # change in its gradient over a step, skipped unless the objective curves
+    # downward along the step.
+    curvature = step @ change
+    if curvature <= 1e-12 * np.linalg.norm(step) * np.linalg.norm(change):
+        return hessian
+
+    product = hessian @ step
+
+    return (
+        hessian
+        + np.outer(change, change) / curvature
+        - np.outer(product, product) / (step @ product)
+    )
+
+
+def optimize_power_setting(
+    dataplate: DataPlate,
+    gross_aircraft_weight: float,
+    pressure_altitude: float,
+    oat_f: float,
+    mixture: Mixture,
+    objective: ByKCASRowIndex = ByKCASRowIndex.MPG,
+    maximize: bool = True,
+    rpm_limits: Tuple[float, float] = (1800, 2400),
+    maximum_percent_power: float = 100,
+    minimum_percent_power: float = 5,
+    maximum_gph: Optional[float] = None,
+    kcas_range: Tuple[float, float] = (40, 200),
+    initial_setting: Optional[Tuple[float, float]] = None,
+    tolerance: float = 1e-4,
+    max_evaluations: int = 100,
+) -> Optional[PowerSetting]:
+    """Find the power setting that maximizes (or minimizes) ``objective`` at VM.
+
+    Args:
+        objective: The column of a cruise performance table to optimize.
+        rpm_limits: The engine's allowed RPM range.
+        maximum_percent_power: The highest allowed power, in percent of rated
+            power. Power is also capped at full throttle.
+        minimum_percent_power: The lowest power considered (the model is
+            unreliable below about 5%).
+        maximum_gph: A fuel flow cap. Fuel flow is proportional to power, so
+            this caps power, too.
+        kcas_range: Where to look for VM.
+        initial_setting: The engine RPM and power to start from (e.g., the
+            optimum at a nearby altitude), if VM lies within ``kcas_range``
+            there. Otherwise, the search starts from full throttle and backs
+            off until it does.
+        tolerance: Stop once a quasi-Newton step would move the setting less
+            than this fraction of the RPM range and of the power range.
+        max_evaluations: Give up after this many evaluations of the objective
+            (including the search for a setting to start from).
+
+    Returns:
+        The optimal setting, or None if the airplane can't sustain level flight
+        at any allowed setting.
+    """
+    rated_power = dataplate.rated_full_throttle_engine_power
+    maximum_power = rated_power * maximum_percent_power / 100
+
+    if maximum_gph is not None:
+        reference = PartialThrottleConditions(
+            dataplate,
+            gross_aircraft_weight,
+            pressure_altitude,
+            oat_f,
+            mixture,
+            rpm_limits[1],
+            rated_power,
+        )
+        gph_per_power = _bootstrap_performance_columns(dataplate, reference, 100.0)[
+            ByKCASRowIndex.GPH
+        ] / float(rated_power)
+        maximum_power = min(maximum_power, maximum_gph / gph_per_power)
+
+    minimum_power = rated_power * minimum_percent_power / 100
+    if maximum_power < minimum_power:
+        raise ValueError("The power limits leave no power setting to choose from.")
+
+    problem = _Problem(
+        dataplate,
+        gross_aircraft_weight,
+        pressure_altitude,
+        oat_f,
+        mixture,
+        objective,
+        maximize,
+        rpm_limits,
+        (minimum_power, maximum_power),
+        kcas_range,
+    )
+
+    start = problem.start(
+        None if initial_setting is None else problem.coordinates(*initial_setting)
+    )
+    if start is None:
+        return None
+
+    x, kcas = start
+    result = problem.evaluate(x, kcas)
+    if result is None:
+        return None
+
+    value, setting_gradient, row = result
+    gradient = setting_gradient @ problem.jacobian(x)
+    # The (negated) objective's Hessian, approximated by BFGS updates from the
+    # gradients. It starts as a short steepest-ascent step.
+    hessian = np.eye(2) * max(np.abs(gradient).max(), np.finfo(float).tiny) / 0.1
+    converged = False
+
+    while problem.evaluations < max_evaluations:
+        # Hold variables at the bounds the gradient pushes against, and take a
+        # quasi-Newton step in the others.
+        free = ~(((x <= 0) & (gradient < 0)) | ((x >= 1) & (gradient > 0)))
+        direction = np.zeros(2)
+        direction[free] = np.linalg.solve(hessian[np.ix_(free, free)], gradient[free])
+        step = np.clip(x + direction, 0, 1) - x
+
+        if np.abs(step).max() < tolerance:
+            converged = True
+            break
+
+        # Backtrack along the projected path until the objective increases
+        # enough (the Armijo rule), to where the slope along the path would
+        # vanish if it changed linearly (the objective often has kinks, where
+        # the propeller chart's curves meet, so it's seldom quadratic).
+        while problem.evaluations < max_evaluations:
+            candidate = problem.evaluate(x + step, row[ByKCASRowIndex.KCAS])
+
+            if candidate is not None and candidate[0] >= value + 1e-4 * (
+                gradient @ step
+            ):
+                break
+
+            fraction = 0.25
+            if candidate is not None:
+                # Even a rejected step tells us about the curvature.
+                trial_gradient = candidate[1] @ problem.jacobian(x + step)
+                hessian = _bfgs_update(hessian, step, gradient - trial_gradient)
+                slope, trial_slope = gradient @ step, trial_gradient @ step
+                if trial_slope < 0:
+                    fraction = min(max(slope / (slope - trial_slope), 0.1), 0.5)
+
+            direction *= fraction
+            step = np.clip(x + direction, 0, 1) - x
+        else:
+            break
+
+        x = x + step
+        value, setting_gradient, row = candidate
+        new_gradient = setting_gradient @ problem.jacobian(x)
+
+        hessian = _bfgs_update(hessian, step, gradient - new_gradient)
+        gradient = new_gradient
+
+    engine_rpm, power = problem.setting(x)
+
+    return PowerSetting(
+        float(engine_rpm),
+        float(power),
+        row,
+        tuple(float(g) for g in setting_gradient * problem.sign),
+        problem.evaluations,
+        converged,
+    )
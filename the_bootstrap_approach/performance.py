@@ -1,7 +1,8 @@
+import functools
 import math
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Sequence, Tuple, Type, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -9,6 +10,8 @@ import numpy.typing as npt
 from the_bootstrap_approach.airspeed_calibration import cas_to_ias
 from the_bootstrap_approach.conditions import (
     Conditions,
+    FullThrottleConditions,
+    PartialThrottleConditions,
 )
 from the_bootstrap_approach.dataplate import DataPlate
 from the_bootstrap_approach.equations import (
@@ -25,6 +28,7 @@ from the_bootstrap_approach.equations import (
     fuel_lbf_to_gal,
     ft_lbfs_to_hp,
 )
+from the_bootstrap_approach.mixture import Mixture
 from the_bootstrap_approach.propeller_chart import propeller_efficiency
 
 
@@ -48,36 +52,58 @@ class ByKCASRowIndex(IntEnum):
     MPG = 16
 
 
-class ByAltitudeRowIndex(IntEnum):
-    PRESSURE_ALTITUDE = 0
-    KCAS = 1
-    KIAS = 2
-    KTAS = 3
-    PROPELLER_EFFICIENCY = 4
-    THRUST = 5
-    DRAG = 6
-    RATE_OF_CLIMB = 7
-    ANGLE_OF_CLIMB = 8
-    FEET_PER_NAUTICAL_MILE = 9
-    POWER_REQUIRED = 10
-    POWER_AVAILABLE = 11
-    EXCESS_POWER = 12
-    RPM = 13
-    PBHP = 14
-    GPH = 15
-    FUEL_FLOW_PER_KNOT = 16
-    MPG = 17
+# A by-altitude profile's rows are a by-KCAS table's rows, with the pressure
+# altitude prepended.
+ByAltitudeRowIndex = IntEnum(
+    "ByAltitudeRowIndex",
+    [("PRESSURE_ALTITUDE", 0)]
+    + [(member.name, member + 1) for member in ByKCASRowIndex],
+    module=__name__,
+)
 
 
-def bootstrap_cruise_performance_table(
+@functools.lru_cache(maxsize=None)
+def _record_dtype(index: Type[IntEnum], dtype: np.dtype) -> np.dtype:
+    return np.dtype([(member.name, dtype) for member in index])
+
+
+def labeled(table: np.ndarray, index: Type[IntEnum] = ByKCASRowIndex) -> np.ndarray:
+    """View a table, profile, or grid as a structured array, with one named
+    field per column, e.g. ``labeled(table)["KTAS"]``.
+
+    The view shares the table's memory, provided its rows are contiguous (as
+    every table here is); otherwise, it's a labeled copy. Labeled tables index,
+    slice, and concatenate like any array, e.g., ``np.concatenate`` stacks
+    profiles along altitude.
+    """
+    table = np.ascontiguousarray(table)
+
+    if table.shape[-1] != len(index):
+        raise ValueError(f"Expected {len(index)} columns, got {table.shape[-1]}.")
+
+    return table.view(_record_dtype(index, table.dtype))[..., 0]
+
+
+def unlabeled(records: np.ndarray) -> np.ndarray:
+    """View a structured array from ``labeled`` as a plain table again, without
+    copying it."""
+    return records[..., np.newaxis].view(records.dtype[0])
+
+
+def _bootstrap_performance_columns(
     dataplate: DataPlate,
     operating_conditions: Conditions,
-    start,
-    stop,
-    step,
+    kcas: npt.NDArray[np.floating],
     headwind=0,
-) -> np.ndarray:
-    kcas = np.arange(start, stop, step)
+    propeller_efficiency_mode: str = "exact",
+) -> List[npt.NDArray[np.floating]]:
+    """Evaluate every column of a bootstrap performance table.
+
+    The operating conditions' attributes (e.g., pressure altitude, weight, or
+    power) may be arrays, as long as they broadcast against ``kcas``. Each
+    returned column has the broadcast shape, in ``ByKCASRowIndex`` order.
+    ``propeller_efficiency_mode`` is passed to ``propeller_efficiency``.
+    """
     kias = cas_to_ias(dataplate, kcas)
     ktas = tas(kcas, operating_conditions.relative_atmospheric_density) + headwind
     vt = kn_to_fts(ktas)
@@ -96,6 +122,8 @@ def bootstrap_cruise_performance_table(
             dataplate.propeller_diameter,
         ),
         power_adjustment_factor_x(dataplate.total_activity_factor),
+        mode=propeller_efficiency_mode,
+        propeller_map=dataplate.propeller_map,
     )
 
     pre = power_required(operating_conditions.g, operating_conditions.h, vt)
@@ -113,9 +141,9 @@ def bootstrap_cruise_performance_table(
     ftnm = roc / (ktas / 60)
 
     # Divide by 550 ft-lbf/s to get brake horsepower (BHP).
-    power = np.full(kcas.size, operating_conditions.power)
+    power = operating_conditions.power
 
-    rpm = np.full(kcas.size, operating_conditions.engine_rpm)
+    rpm = operating_conditions.engine_rpm
     pbhp = (power / dataplate.rated_full_throttle_engine_power) * 100
 
     # The volume of aviation fuel varies with air density [8, p. 9-14].
@@ -129,29 +157,427 @@ def bootstrap_cruise_performance_table(
     fuel_flow_per_knot = thrust / vt
     mpg = ktas / gph
 
-    return np.column_stack(
-        (
+    return np.broadcast_arrays(
+        kcas,
+        kias,
+        ktas,
+        eta,
+        thrust,
+        drag,
+        roc,
+        aoc,
+        ftnm,
+        pre,
+        pav,
+        pxs,
+        rpm,
+        pbhp,
+        gph,
+        fuel_flow_per_knot,
+        mpg,
+    )
+
+
+def _bootstrap_performance_table(
+    dataplate: DataPlate,
+    operating_conditions: Conditions,
+    kcas: npt.NDArray[np.floating],
+    headwind=0,
+    out: Optional[np.ndarray] = None,
+    propeller_efficiency_mode: str = "exact",
+) -> np.ndarray:
+    """Evaluate a bootstrap performance table, whose last axis is indexed by
+    ``ByKCASRowIndex``, into ``out`` (e.g., a slice of a larger table) or a new
+    array."""
+    columns = _bootstrap_performance_columns(
+        dataplate, operating_conditions, kcas, headwind, propeller_efficiency_mode
+    )
+
+    if out is None:
+        out = np.empty(
+            columns[0].shape + (len(columns),), dtype=np.result_type(*columns)
+        )
+
+    for member, column in zip(ByKCASRowIndex, columns):
+        out[..., member] = column
+
+    return out
+
+
+# Columns whose extrema we resolve when refining an adaptive table: VY, VX, and
+# the speed for minimum fuel flow per knot (Carson's speed).
+_ADAPTIVE_TABLE_EXTREMA_COLUMNS = (
+    ByKCASRowIndex.RATE_OF_CLIMB,
+    ByKCASRowIndex.ANGLE_OF_CLIMB,
+    ByKCASRowIndex.FUEL_FLOW_PER_KNOT,
+)
+
+
+def _refine_bootstrap_cruise_performance_table(
+    dataplate: DataPlate,
+    operating_conditions: Conditions,
+    table: np.ndarray,
+    headwind,
+    tolerance,
+    subdivisions: int = 10,
+    propeller_efficiency_mode: str = "exact",
+) -> np.ndarray:
+    while True:
+        kcas = table[:, ByKCASRowIndex.KCAS]
+        width = np.diff(kcas)
+
+        # Refine around zero crossings of the rate of climb (e.g., VM, where
+        # excess power runs out)...
+        roc = table[:, ByKCASRowIndex.RATE_OF_CLIMB]
+        refine = np.signbit(roc[:-1]) != np.signbit(roc[1:])
+
+        # ...and around the extrema of the other columns we care about, where
+        # the slope changes sign on either side of a point.
+        for column in _ADAPTIVE_TABLE_EXTREMA_COLUMNS:
+            slope = np.diff(table[:, column])
+            extremum = np.signbit(slope[:-1]) != np.signbit(slope[1:])
+            refine[:-1] |= extremum
+            refine[1:] |= extremum
+
+        # Allow for floating-point error in the spacing of the refined grid.
+        refine &= width > tolerance * (1 + 1e-6)
+
+        if not refine.any():
+            return table
+
+        new_kcas = (
+            (
+                kcas[:-1][refine, np.newaxis]
+                + width[refine, np.newaxis] * np.arange(1, subdivisions) / subdivisions
+            )
+            .ravel()
+            .astype(table.dtype, copy=False)
+        )
+
+        table = np.concatenate(
+            (
+                table,
+                _bootstrap_performance_table(
+                    dataplate,
+                    operating_conditions,
+                    new_kcas,
+                    headwind,
+                    propeller_efficiency_mode=propeller_efficiency_mode,
+                ),
+            )
+        )
+        table = table[np.argsort(table[:, ByKCASRowIndex.KCAS], kind="stable")]
+
+
+def bootstrap_cruise_performance_table(
+    dataplate: DataPlate,
+    operating_conditions: Conditions,
+    start,
+    stop,
+    step,
+    headwind=0,
+    adaptive: bool = False,
+    tolerance: float = 0.01,
+    dtype: Optional[npt.DTypeLike] = None,
+    propeller_efficiency_mode: str = "exact",
+) -> np.ndarray:
+    """Tabulate performance from ``start`` to ``stop`` KCAS, in ``step`` knots.
+
+    In adaptive mode, ``step`` only sets a coarse grid. The table is then refined
+    tenfold at a time around the zero crossings of the rate of climb and the
+    extrema of the rate of climb, angle of climb, and fuel flow per knot, until
+    the speeds bracketing each are no more than ``tolerance`` knots apart. The
+    resulting KCAS column is irregular, but the column layout is unchanged.
+
+    ``dtype`` sets the precision of the whole computation. ``np.float32`` halves
+    the memory of large sweeps. Against float64, it keeps about six significant
+    digits, e.g., within about 0.01 kn, 0.05 ft/min, and 0.001 GPH.
+
+    ``propeller_efficiency_mode="surface"`` interpolates η from a cached surface
+    rather than evaluating the propeller chart (see ``propeller_efficiency``).
+    """
+    kcas = np.arange(start, stop, step)
+
+    if dtype is not None:
+        operating_conditions = operating_conditions.astype(dtype)
+        kcas = kcas.astype(dtype)
+
+    table = _bootstrap_performance_table(
+        dataplate,
+        operating_conditions,
+        kcas,
+        headwind,
+        propeller_efficiency_mode=propeller_efficiency_mode,
+    )
+
+    if adaptive:
+        table = _refine_bootstrap_cruise_performance_table(
+            dataplate,
+            operating_conditions,
+            table,
+            headwind,
+            tolerance,
+            propeller_efficiency_mode=propeller_efficiency_mode,
+        )
+
+    return table
+
+
+def _scatter_columns(
+    dataplate: DataPlate,
+    mixture: Union[Mixture, npt.ArrayLike],
+    gross_aircraft_weight: np.ndarray,
+    pressure_altitude: np.ndarray,
+    engine_rpm: np.ndarray,
+    kcas: np.ndarray,
+    power: Optional[np.ndarray] = None,
+    oat_f: Optional[np.ndarray] = None,
+    isa_diff: np.ndarray = 0,
+    headwind: np.ndarray = 0,
+    propeller_efficiency_mode: str = "exact",
+) -> List[np.ndarray]:
+    """Evaluate every column at each of a set of points, at ``kcas``'s dtype (see
+    ``bootstrap_scatter_performance_table``)."""
+    dtype = kcas.dtype
+
+    if not isinstance(mixture, Mixture):
+        # Evaluate the points at each mixture together.
+        mixture, *values = np.broadcast_arrays(
+            np.asarray(mixture, dtype=object),
+            gross_aircraft_weight,
+            pressure_altitude,
+            engine_rpm,
             kcas,
-            kias,
-            ktas,
-            eta,
-            thrust,
-            drag,
-            roc,
-            aoc,
-            ftnm,
-            pre,
-            pav,
-            pxs,
-            rpm,
-            pbhp,
-            gph,
-            fuel_flow_per_knot,
-            mpg,
+            np.nan if power is None else power,
+            np.nan if oat_f is None else oat_f,
+            isa_diff,
+            headwind,
+        )
+        if not all(isinstance(member, Mixture) for member in mixture.flat):
+            raise ValueError("Expected a Mixture at every point.")
+
+        columns = [np.empty(mixture.shape, dtype) for _ in ByKCASRowIndex]
+
+        for member in Mixture:
+            where = mixture == member
+            if where.any():
+                for column, values_at_mixture in zip(
+                    columns,
+                    _scatter_columns(
+                        dataplate,
+                        member,
+                        *(value[where] for value in values[:8]),
+                        propeller_efficiency_mode=propeller_efficiency_mode,
+                    ),
+                ):
+                    column[where] = values_at_mixture
+
+        return columns
+
+    # Without an OAT, a point is at its deviation from ISA.
+    isa_oat_f = c_to_f(metric_standard_temperature(pressure_altitude) + isa_diff)
+    oat_f = isa_oat_f if oat_f is None else np.where(np.isnan(oat_f), isa_oat_f, oat_f)
+
+    operating_conditions = FullThrottleConditions(
+        dataplate, gross_aircraft_weight, pressure_altitude, oat_f, mixture, engine_rpm
+    )
+
+    if power is not None:
+        operating_conditions = PartialThrottleConditions(
+            dataplate,
+            gross_aircraft_weight,
+            pressure_altitude,
+            oat_f,
+            mixture,
+            engine_rpm,
+            # Full throttle is the most power there is, and where none is given.
+            np.fmin(power, operating_conditions.power),
         )
+
+    return _bootstrap_performance_columns(
+        dataplate,
+        operating_conditions.astype(dtype),
+        kcas,
+        headwind,
+        propeller_efficiency_mode=propeller_efficiency_mode,
+    )
+
+
+def bootstrap_scatter_performance_table(
+    dataplate: DataPlate,
+    mixture: Union[Mixture, Sequence[Mixture]],
+    gross_aircraft_weight: npt.ArrayLike,
+    pressure_altitude: npt.ArrayLike,
+    engine_rpm: npt.ArrayLike,
+    kcas: npt.ArrayLike,
+    power: Optional[npt.ArrayLike] = None,
+    oat_f: Optional[npt.ArrayLike] = None,
+    isa_diff: npt.ArrayLike = 0,
+    headwind: npt.ArrayLike = 0,
+    dtype: npt.DTypeLike = np.float64,
+    propeller_efficiency_mode: str = "exact",
+) -> np.ndarray:
+    """Tabulate performance at a set of unrelated points (e.g., from a flight
+    log), each with its own conditions, in one vectorized pass.
+
+    Every argument but the dataplate may be an array, one value per point, or a
+    scalar shared by every point; the arrays must broadcast against each other.
+    Row ``i`` of the result (indexed by ``ByKCASRowIndex``) is point ``i``.
+
+    Without ``power``, or where it's NaN, the engine is at full throttle, and
+    power beyond what full throttle can deliver is limited to full throttle.
+    Temperature is ``oat_f`` or, without it (or where it's NaN), ``isa_diff``
+    (℃). ``mixture`` may be given per point, too.
+
+    A point off the propeller map, or with a NaN input (other than ``power`` or
+    ``oat_f``), yields NaN in every column that depends on it, as it would in a
+    cruise performance table, rather than failing the whole call.
+    """
+
+    def array(value):
+        return None if value is None else np.asarray(value, dtype=dtype)
+
+    columns = _scatter_columns(
+        dataplate,
+        mixture,
+        array(gross_aircraft_weight),
+        array(pressure_altitude),
+        array(engine_rpm),
+        array(kcas),
+        array(power),
+        array(oat_f),
+        array(isa_diff),
+        array(headwind),
+        propeller_efficiency_mode,
+    )
+    out = np.empty(columns[0].shape + (len(columns),), dtype=np.result_type(*columns))
+
+    for member, column in zip(ByKCASRowIndex, columns):
+        out[..., member] = column
+
+    return out
+
+
+def interpolate_row(table: np.ndarray, kcas: float) -> npt.NDArray[np.float64]:
+    """Linearly interpolate every column of a table at ``kcas``, which may lie
+    between the table's (possibly irregular) grid points."""
+    i = np.clip(
+        np.searchsorted(table[:, ByKCASRowIndex.KCAS], kcas) - 1, 0, len(table) - 2
+    )
+    x0 = table[i][ByKCASRowIndex.KCAS]
+    x1 = table[i + 1][ByKCASRowIndex.KCAS]
+
+    return table[i] + (kcas - x0) / (x1 - x0) * (table[i + 1] - table[i])
+
+
+def _parabolic_maximum_row(
+    table: np.ndarray, column: ByKCASRowIndex
+) -> Optional[npt.NDArray[np.float64]]:
+    # Rows off the propeller map are NaN, and have no say in the maximum.
+    on_map = ~np.isnan(table[:, column])
+
+    if not on_map.any():
+        return None
+
+    i = np.nanargmax(table[:, column])
+
+    if len(table) < 3:
+        return table[i]
+
+    # Fit a parabola through the maximum and its neighbors (or, at the edge of
+    # the table, the three points nearest the edge).
+    k = min(max(i, 1), len(table) - 2)
+
+    # There's no fitting a parabola through a row off the map.
+    if not on_map[k - 1 : k + 2].all():
+        return table[i]
+
+    x0, x1, x2 = table[k - 1 : k + 2, ByKCASRowIndex.KCAS]
+    y0, y1, y2 = table[k - 1 : k + 2, column]
+
+    # Fit $p(x) = y_0 + d_0(x - x_0) + a(x - x_0)(x - x_1)$ through the three
+    # points, whose vertex is where $p'(x) = 0$.
+    d0 = (y1 - y0) / (x1 - x0)
+    d1 = (y2 - y1) / (x2 - x1)
+    a = (d1 - d0) / (x2 - x0)
+
+    if a >= 0:
+        return table[i]
+
+    x = (x0 + x1) / 2 - d0 / (2 * a)
+
+    # If the vertex lies beyond the edge of the table, the maximum within the
+    # table is the grid point at its edge.
+    if not table[0][ByKCASRowIndex.KCAS] <= x <= table[-1][ByKCASRowIndex.KCAS]:
+        return table[i]
+
+    # Interpolate the whole row at the vertex along the same parabola.
+    return (
+        (x - x1) * (x - x2) / ((x0 - x1) * (x0 - x2)) * table[k - 1]
+        + (x - x0) * (x - x2) / ((x1 - x0) * (x1 - x2)) * table[k]
+        + (x - x0) * (x - x1) / ((x2 - x0) * (x2 - x1)) * table[k + 1]
     )
 
 
+def best_rate_of_climb_row(table: np.ndarray) -> Optional[npt.NDArray[np.float64]]:
+    """Find VY, the speed for best rate of climb, between a table's grid points
+    by parabolic interpolation.
+
+    Rows off the propeller map (NaN) are skipped. Returns ``None`` if every row
+    is off the map.
+    """
+    return _parabolic_maximum_row(table, ByKCASRowIndex.RATE_OF_CLIMB)
+
+
+def best_angle_of_climb_row(table: np.ndarray) -> Optional[npt.NDArray[np.float64]]:
+    """Find VX, the speed for best angle of climb, between a table's grid points
+    by parabolic interpolation.
+
+    Rows off the propeller map (NaN) are skipped. Returns ``None`` if every row
+    is off the map.
+    """
+    return _parabolic_maximum_row(table, ByKCASRowIndex.ANGLE_OF_CLIMB)
+
+
+def max_level_flight_speed_row(table: np.ndarray) -> Optional[npt.NDArray[np.float64]]:
+    """Find VM, the maximum level flight speed, between a table's grid points by
+    linear interpolation.
+
+    VM occurs the second time the excess power curve intersects the X-axis. If
+    the rate of climb doesn't return to zero within the table, we settle for the
+    row with the smallest positive rate of climb after the peak.
+
+    Returns:
+        The interpolated row, or ``None`` if the airplane can't sustain level
+        flight at any speed in the table.
+    """
+    roc = table[:, ByKCASRowIndex.RATE_OF_CLIMB]
+    # Rows off the propeller chart are NaN, and the airplane can't be said to fly
+    # level (or at all) there.
+    on_chart = ~np.isnan(roc)
+    index_of_highest_roc = np.where(on_chart, roc, -np.inf).argmax()
+
+    if not on_chart[index_of_highest_roc] or roc[index_of_highest_roc] <= 0:
+        return None
+
+    roc_after_peak = np.where(on_chart, roc, np.inf)[index_of_highest_roc:]
+    (crossings,) = np.nonzero(roc_after_peak <= 0)
+
+    if len(crossings) == 0:
+        return table[index_of_highest_roc + roc_after_peak.argmin()]
+
+    # The rate of climb crosses zero between these two rows.
+    j = index_of_highest_roc + crossings[0]
+    fraction = roc[j - 1] / (roc[j - 1] - roc[j])
+
+    row = table[j - 1] + fraction * (table[j] - table[j - 1])
+    # By construction, this is level flight. Don't let rounding error say
+    # otherwise.
+    row[ByKCASRowIndex.RATE_OF_CLIMB] = 0
+
+    return row
+
+
 @dataclass(frozen=True)
 class PerformanceProfile:
     name: str
@@ -160,25 +586,308 @@ class PerformanceProfile:
     isa_diff: float
     data: npt.NDArray[npt.NDArray[np.float64]]
 
+    @property
+    def records(self) -> np.ndarray:
+        """The profile's data as a structured array (see ``labeled``)."""
+        return labeled(self.data, ByAltitudeRowIndex)
+
+
+def bootstrap_cruise_performance_search(
+    dataplate: DataPlate,
+    operating_conditions: Conditions,
+    select: Callable[[np.ndarray], Optional[npt.NDArray[np.float64]]],
+    start,
+    stop,
+    step,
+    hint: Optional[float] = None,
+    window: float = 2,
+    headwind=0,
+) -> Optional[npt.NDArray[np.float64]]:
+    """Search a cruise performance table for the row chosen by ``select``.
+
+    Without a hint, this is equivalent to calling ``select`` on the table from
+    ``start`` to ``stop``. With a hint (e.g., the KCAS of the solution at the
+    previous altitude), only the speeds within ``window`` knots of the hint are
+    evaluated first. That result is accepted if it lies strictly inside the
+    window, or on an edge that the window shares with the full range. Otherwise,
+    the optimum may lie outside the window, so we fall back to the full range.
+    """
+    if hint is not None:
+        # Snap the window to the full range's grid, so that a warm-started search
+        # evaluates the same speeds that a cold search would.
+        window_start = start + max(0, math.floor((hint - window - start) / step)) * step
+        window_stop = min(stop, hint + window)
+
+        table = bootstrap_cruise_performance_table(
+            dataplate, operating_conditions, window_start, window_stop, step, headwind
+        )
+
+        if len(table) > 1:
+            row = select(table)
+
+            if row is not None:
+                kcas = row[ByKCASRowIndex.KCAS]
+                at_lower_edge = kcas <= table[0][ByKCASRowIndex.KCAS]
+                at_upper_edge = kcas >= table[-1][ByKCASRowIndex.KCAS]
+
+                if (not at_lower_edge or window_start <= start) and (
+                    not at_upper_edge or window_stop >= stop
+                ):
+                    return row
+
+    return select(
+        bootstrap_cruise_performance_table(
+            dataplate, operating_conditions, start, stop, step, headwind
+        )
+    )
+
 
 def by_altitude_profile(
-    func: Callable[[float, float], Optional[npt.NDArray[np.float64]]],
+    func: Callable[..., Optional[npt.NDArray[np.float64]]],
     isa_diff: float = 0,
+    warm_start: bool = False,
 ) -> npt.NDArray[npt.NDArray[np.float64]]:
-    profile = []
+    """Build a profile by calling ``func`` at every 1,000' of pressure altitude,
+    from sea level up to absolute ceiling.
+
+    ``func`` takes the pressure altitude and OAT°F. If ``warm_start`` is set, it
+    also receives the row it returned for the previous altitude (or ``None`` at
+    sea level) as a hint, since the solution moves only slightly per 1,000'.
+    """
+    pressure_altitudes = []
+    rows = []
     pressure_altitude = 0
+    previous_row = None
 
     while True:
         oat_c = metric_standard_temperature(pressure_altitude) + isa_diff
 
-        row = func(pressure_altitude, c_to_f(oat_c))
+        if warm_start:
+            row = func(pressure_altitude, c_to_f(oat_c), previous_row)
+        else:
+            row = func(pressure_altitude, c_to_f(oat_c))
 
-        if row is not None and row[ByKCASRowIndex.RATE_OF_CLIMB] > 0:
-            profile.append(np.insert(row, 0, pressure_altitude))
+        if row is not None and row[ByKCASRowIndex.RATE_OF_CLIMB] >= 0:
+            pressure_altitudes.append(pressure_altitude)
+            rows.append(row)
             pressure_altitude += 1000
+            previous_row = row
         else:
             # The aircraft isn't sustaining level flight if the rate of climb
             # is negative, so we know we've reached absolute ceiling.
             break
 
-    return np.array(profile)
+    profile = np.empty(
+        (len(rows), len(ByAltitudeRowIndex)), dtype=np.result_type(*rows, np.float64)
+    )
+    profile[:, ByAltitudeRowIndex.PRESSURE_ALTITUDE] = pressure_altitudes
+    if rows:
+        profile[:, ByAltitudeRowIndex.KCAS :] = rows
+
+    return profile
+
+
+def _power_for_rate_of_climb(
+    dataplate: DataPlate,
+    operating_conditions: Conditions,
+    kcas,
+    rate_of_climb,
+    minimum_power,
+    maximum_power,
+    iterations: int = 8,
+):
+    """Solve for the shaft power that yields ``rate_of_climb`` at ``kcas``.
+
+    Power available is :math:`\\eta P`, but :math:`\\eta` itself depends on
+    :math:`P` through :math:`C_P`. Since :math:`\\eta` changes slowly with power,
+    a fixed-point iteration on :math:`P = (P_{re} + W \\dot{h}) / \\eta` converges
+    in a handful of steps. The power is clamped to ``[minimum_power,
+    maximum_power]``, so the target rate may not be achievable everywhere.
+    """
+    vt = kn_to_fts(tas(kcas, operating_conditions.relative_atmospheric_density))
+
+    # The thrust power needed to overcome drag and climb (or descend) at the
+    # target rate, in ft-lbf/s.
+    thrust_power = (
+        power_required(operating_conditions.g, operating_conditions.h, vt)
+        + rate_of_climb * operating_conditions.gross_aircraft_weight / 60
+    )
+
+    power = np.clip(thrust_power / 0.8, minimum_power, maximum_power)
+
+    for _ in range(iterations):
+        eta = propeller_efficiency(
+            sdef_t(dataplate.z_ratio),
+            propeller_advance_ratio(
+                vt,
+                operating_conditions.propeller_rps,
+                dataplate.propeller_diameter,
+            ),
+            propeller_power_coefficient(
+                power,
+                operating_conditions.atmospheric_density,
+                operating_conditions.propeller_rps,
+                dataplate.propeller_diameter,
+            ),
+            power_adjustment_factor_x(dataplate.total_activity_factor),
+            propeller_map=dataplate.propeller_map,
+        )
+        power = np.clip(thrust_power / eta, minimum_power, maximum_power)
+
+    return power
+
+
+def _minimum_propeller_map_power(
+    dataplate: DataPlate, operating_conditions: Conditions
+):
+    """The least shaft power the dataplate's propeller map has data for: its
+    lowest curve's :math:`C_P` (for the chart, :math:`C_{PX} X`), times
+    :math:`\\rho n^3 d^5`. Below it, :math:`\\eta` is NaN."""
+    propeller_map = dataplate.propeller_map
+    power_coefficient = propeller_map.curves[0]
+
+    if propeller_map.table is None:
+        power_coefficient *= power_adjustment_factor_x(dataplate.total_activity_factor)
+
+    # A hair above the curve, so that rounding doesn't put it off the map.
+    return (
+        power_coefficient
+        * (1 + 1e-9)
+        * operating_conditions.atmospheric_density
+        * operating_conditions.propeller_rps**3
+        * dataplate.propeller_diameter**5
+    )
+
+
+def descent_profiles(
+    dataplate: DataPlate,
+    gross_aircraft_weights: Sequence[float],
+    pressure_altitudes: npt.ArrayLike,
+    kcas: float,
+    mixture: Mixture,
+    engine_rpm: float,
+    rate_of_descent: Optional[float] = None,
+    power: Optional[float] = None,
+    isa_diff: float = 0,
+) -> List[PerformanceProfile]:
+    """Build descent profiles for several gross weights at once.
+
+    The descent is flown at a constant calibrated airspeed under partial
+    throttle, with either a target rate of descent (ft/min) or a fixed shaft
+    power (ft-lbf/s). Every (pressure altitude, weight) pair is evaluated in a
+    single vectorized pass.
+
+    When solving for a rate of descent, power is bounded below by 5% of rated
+    power, or the least power on the propeller map if that's more, and above by
+    full throttle. Where the target rate isn't achievable within those bounds,
+    the rate of climb column reports the rate that is (e.g., a shallower
+    descent near sea level at a low RPM).
+
+    Returns:
+        One ``PerformanceProfile`` per gross weight, whose rows are indexed by
+        ``ByAltitudeRowIndex``.
+    """
+    if (rate_of_descent is None) == (power is None):
+        raise ValueError("Specify either a rate of descent or a power, not both.")
+
+    # Altitudes run down the first axis, and weights across the second.
+    pressure_altitude = np.asarray(pressure_altitudes, dtype=float)[:, np.newaxis]
+    gross_aircraft_weight = np.asarray(gross_aircraft_weights, dtype=float)[
+        np.newaxis, :
+    ]
+    oat_f = c_to_f(metric_standard_temperature(pressure_altitude) + isa_diff)
+
+    full_throttle_conditions = FullThrottleConditions(
+        dataplate,
+        gross_aircraft_weight,
+        pressure_altitude,
+        oat_f,
+        mixture,
+        engine_rpm,
+    )
+
+    if power is None:
+        power = _power_for_rate_of_climb(
+            dataplate,
+            full_throttle_conditions,
+            kcas,
+            -rate_of_descent,
+            # A steep enough descent would call for negative power, and near
+            # idle the model has little to go on, so stop at 5% of rated power.
+            # The propeller map may give out well before that (at 2200 RPM, the
+            # Lowry chart's lowest curve is about 40% power at sea level), and
+            # there's no saying what the propeller does below it.
+            np.maximum(
+                dataplate.rated_full_throttle_engine_power * 0.05,
+                _minimum_propeller_map_power(dataplate, full_throttle_conditions),
+            ),
+            full_throttle_conditions.power,
+        )
+    else:
+        power = np.minimum(power, full_throttle_conditions.power)
+
+    partial_throttle_conditions = PartialThrottleConditions(
+        dataplate,
+        gross_aircraft_weight,
+        pressure_altitude,
+        oat_f,
+        mixture,
+        engine_rpm,
+        power,
+    )
+
+    # Lay the profiles out weight by weight, so that each one is contiguous.
+    data = np.empty(
+        (gross_aircraft_weight.size, pressure_altitude.size, len(ByAltitudeRowIndex))
+    )
+    data[..., ByAltitudeRowIndex.PRESSURE_ALTITUDE] = pressure_altitude[:, 0]
+    _bootstrap_performance_table(
+        dataplate,
+        partial_throttle_conditions,
+        np.asarray(kcas, dtype=float),
+        out=data.transpose(1, 0, 2)[..., ByAltitudeRowIndex.KCAS :],
+    )
+
+    profiles = []
+    for i, weight in enumerate(gross_aircraft_weight[0]):
+        profiles.append(
+            PerformanceProfile(
+                f"Descent, {weight:g} lbf, ISA{isa_diff:+} ℃",
+                dataplate,
+                weight,
+                isa_diff,
+                data[i],
+            )
+        )
+
+    return profiles
+
+
+def time_fuel_distance(
+    profile: npt.NDArray[npt.NDArray[np.float64]],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Integrate a by-altitude profile for time, fuel, and distance.
+
+    Works for both climb and descent profiles: each result is the cumulative
+    amount spent between the profile's first (lowest) altitude and each row's
+    altitude, integrated with the trapezoidal rule over :math:`dt = dh / |ROC|`.
+
+    Returns:
+        Cumulative time (minutes), fuel (gallons), and distance (nautical miles)
+        for each row of the profile.
+    """
+    altitude = profile[:, ByAltitudeRowIndex.PRESSURE_ALTITUDE]
+    minutes_per_foot = 1 / np.abs(profile[:, ByAltitudeRowIndex.RATE_OF_CLIMB])
+    gallons_per_minute = profile[:, ByAltitudeRowIndex.GPH] / 60
+    nautical_miles_per_minute = profile[:, ByAltitudeRowIndex.KTAS] / 60
+
+    def trapezoid(y):
+        return np.concatenate(
+            ([0], np.cumsum(np.diff(altitude) * (y[1:] + y[:-1]) / 2))
+        )
+
+    return (
+        trapezoid(minutes_per_foot),
+        trapezoid(minutes_per_foot * gallons_per_minute),
+        trapezoid(minutes_per_foot * nautical_miles_per_minute),
+    )
@@ -1,4 +1,12 @@
+import csv
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
 import numpy as np
+import numpy.typing as npt
 
 # Dr. Lowry states:
 # > Data and measurements for a general aviation constant-speed propeller let us
@@ -81,68 +89,566 @@ propeller_chart = {
 }
 
 
+class PropellerMap:
+    """A propeller's efficiency map, as curves at constant power coefficients,
+    validated and indexed once into contiguous arrays, so that every map is
+    evaluated over many points at once, in the same way.
+
+    A map is one of two kinds:
+
+    * Coefficients, like Dr. Lowry's chart: each curve is a polynomial in
+      :math:`J/C_P{}^\\frac{1}{3}` at a constant :math:`C_{PX}`, and the
+      polynomials' coefficients are interpolated linearly between curves. The
+      curves are generic, so :math:`X` adjusts them to the propeller's activity
+      factor.
+    * A table, like a manufacturer's map: η tabulated at the same advance
+      ratios :math:`J` along every curve of constant :math:`C_P`, and
+      interpolated bilinearly. The map is of the propeller itself, so :math:`X`
+      doesn't apply. η is NaN off the table.
+
+    Neither kind accounts for the fuselage behind the propeller, so η is scaled
+    by :math:`SDEF` either way.
+    """
+
+    def __init__(
+        self,
+        curves: npt.ArrayLike,
+        coefficients: Optional[npt.ArrayLike] = None,
+        advance_ratios: Optional[npt.ArrayLike] = None,
+        table: Optional[npt.ArrayLike] = None,
+        name: str = "",
+    ):
+        if (coefficients is None) == (table is None):
+            raise ValueError("A propeller map needs either coefficients or a table.")
+        if (advance_ratios is None) != (table is None):
+            raise ValueError("A propeller map's table needs its advance ratios.")
+
+        self.name = name
+        self.curves = _contiguous("curves", curves, ndim=1)
+        _check_strictly_increasing("curves", self.curves)
+
+        if coefficients is not None:
+            self.coefficients = _contiguous("coefficients", coefficients, ndim=2)
+            self.advance_ratios = self.table = None
+            values = self.coefficients
+        else:
+            self.coefficients = None
+            self.advance_ratios = _contiguous("advance ratios", advance_ratios, ndim=1)
+            _check_strictly_increasing("advance ratios", self.advance_ratios)
+            self.table = _contiguous("table", table, ndim=2)
+            values = self.table
+
+            if self.table.shape[1] != len(self.advance_ratios):
+                raise ValueError(
+                    "A propeller map's table needs a column per advance ratio."
+                )
+
+        if len(values) != len(self.curves):
+            raise ValueError(f"A propeller map needs a row per curve, for {name!r}.")
+
+        # Arrays derived from the map (e.g., at other precisions, or surfaces),
+        # built on first use.
+        self._cache: Dict[Tuple, Any] = {}
+
+    @property
+    def kind(self) -> str:
+        return "coefficients" if self.coefficients is not None else "table"
+
+    def __getstate__(self):
+        # Don't ship cached surfaces to worker processes.
+        return dict(self.__dict__, _cache={})
+
+    def _cached(self, key: Tuple, build: Callable[[], Any]):
+        if key not in self._cache:
+            self._cache[key] = build()
+
+        return self._cache[key]
+
+    def _arrays(self, dtype: np.dtype):
+        # The map's curves and coefficients (or table) at the precision of the
+        # inputs, so that e.g. float32 power coefficients don't get promoted to
+        # float64.
+        return self._cached(
+            ("arrays", dtype),
+            lambda: (
+                self.curves.astype(dtype),
+                (
+                    self.coefficients if self.coefficients is not None else self.table
+                ).astype(dtype),
+            ),
+        )
+
+    def digest(self) -> str:
+        """A hash of the map's curves and values."""
+        return self._cached(
+            ("digest",),
+            lambda: hashlib.sha256(
+                b"".join(
+                    array.tobytes()
+                    for array in (
+                        self.curves,
+                        self.coefficients,
+                        self.advance_ratios,
+                        self.table,
+                    )
+                    if array is not None
+                )
+                + self.kind.encode()
+            ).hexdigest(),
+        )
+
+
+def _contiguous(name: str, values: npt.ArrayLike, ndim: int) -> np.ndarray:
+    array = np.array(values, dtype=float)
+
+    if array.ndim != ndim or 0 in array.shape or not np.isfinite(array).all():
+        raise ValueError(
+            f"A propeller map's {name} must be a nonempty {ndim}-D array of "
+            "finite numbers."
+        )
+
+    array.flags.writeable = False
+
+    return array
+
+
+def _check_strictly_increasing(name: str, values: np.ndarray) -> None:
+    if len(values) < 2 or not np.all(np.diff(values) > 0):
+        raise ValueError(
+            f"A propeller map's {name} must be at least two strictly increasing "
+            "values."
+        )
+
+
+LOWRY_PROPELLER_MAP = PropellerMap(
+    list(propeller_chart.keys()),
+    coefficients=list(propeller_chart.values()),
+    name="Lowry",
+)
+
+
+def load_propeller_map(path: str, name: Optional[str] = None) -> PropellerMap:
+    """Load a propeller map from a JSON or CSV file.
+
+    A JSON file holds an object with a ``"curves"`` array and either a
+    ``"coefficients"`` array of arrays (a row of polynomial coefficients per
+    curve, from the constant term up), or ``"advance_ratios"`` and a ``"table"``
+    of η (a row per curve, a column per advance ratio), and optionally a
+    ``"name"``.
+
+    A CSV file has a header row, and either a row per curve, with the columns
+    ``curve,c0,c1,...``, or a row per point of a table, with the columns
+    ``curve,advance_ratio,efficiency``, in any order.
+
+    The name defaults to the file's.
+    """
+    default_name = os.path.splitext(os.path.basename(path))[0]
+
+    if path.endswith(".json"):
+        with open(path) as file:
+            data = json.load(file)
+
+        unknown = data.keys() - {
+            "name",
+            "curves",
+            "coefficients",
+            "advance_ratios",
+            "table",
+        }
+        if unknown:
+            raise ValueError(f"Unknown propeller map fields: {sorted(unknown)}.")
+
+        data.setdefault("name", default_name)
+        if name is not None:
+            data["name"] = name
+
+        return PropellerMap(**data)
+    elif path.endswith(".csv"):
+        with open(path, newline="") as file:
+            reader = csv.reader(file)
+            header = [column.strip() for column in next(reader)]
+            rows = np.array([row for row in reader if row], dtype=float)
+
+        if header == ["curve", "advance_ratio", "efficiency"]:
+            curves, i = np.unique(rows[:, 0], return_inverse=True)
+            advance_ratios, k = np.unique(rows[:, 1], return_inverse=True)
+
+            table = np.full((len(curves), len(advance_ratios)), np.nan)
+            table[i, k] = rows[:, 2]
+
+            if len(rows) != table.size:
+                raise ValueError(
+                    "A propeller map's table must have exactly one point per "
+                    "curve and advance ratio."
+                )
+
+            return PropellerMap(
+                curves,
+                advance_ratios=advance_ratios,
+                table=table,
+                name=name or default_name,
+            )
+        elif header[:1] == ["curve"] and header[1:] == [
+            f"c{power}" for power in range(len(header) - 1)
+        ]:
+            return PropellerMap(
+                rows[:, 0], coefficients=rows[:, 1:], name=name or default_name
+            )
+        else:
+            raise ValueError(f"Unrecognized propeller map columns {header}.")
+    else:
+        raise ValueError(f"Can't load a propeller map from {path!r}.")
+
+
+# The J/C_P^(1/3) range that propeller efficiency surfaces cover, and their
+# default resolution along it. With linear interpolation, the default keeps η/SDEF
+# within about 1e-5 of the exact chart (and 1e-6 RMS). The error falls with the
+# square of the resolution.
+SURFACE_X_RANGE = (0.0, 9.0)
+SURFACE_RESOLUTION = 32768
+
+
+def propeller_efficiency_surface(
+    resolution: int = SURFACE_RESOLUTION,
+    dtype: np.dtype = np.dtype(np.float64),
+    propeller_map: PropellerMap = LOWRY_PROPELLER_MAP,
+) -> np.ndarray:
+    """Tabulate a coefficient map's curves at ``resolution`` evenly spaced
+    values of :math:`J/C_P{}^\\frac{1}{3}` over ``SURFACE_X_RANGE``.
+
+    Between curves, the map's coefficients (and so η) vary linearly with
+    :math:`C_{PX}`, so interpolating between the curves' rows is exact there, and
+    only the interpolation along :math:`J/C_P{}^\\frac{1}{3}` approximates the
+    polynomials. :math:`SDEF` and :math:`X` only scale η and :math:`C_{PX}`, so
+    one surface serves every propeller: it's built once per map, resolution, and
+    dtype, and cached.
+
+    Returns:
+        An array of η/SDEF, with a row per curve.
+    """
+    if propeller_map.coefficients is None:
+        raise ValueError(
+            f"Only coefficient maps have surfaces, not {propeller_map.name!r}."
+        )
+
+    def build():
+        x = np.linspace(*SURFACE_X_RANGE, resolution)
+        surface = np.polynomial.polynomial.polyval(x, propeller_map.coefficients.T)
+        surface = surface.astype(dtype)
+        surface.flags.writeable = False
+
+        return surface
+
+    return propeller_map._cached(("surface", resolution, np.dtype(dtype)), build)
+
+
+def _grid_arrays(propeller_map: PropellerMap, grid: np.ndarray, dtype: np.dtype):
+    # A grid of η with a row per curve, and its slope per column, flattened, so
+    # that interpolating takes a couple of one-dimensional lookups per curve.
+    slopes = np.zeros_like(grid)
+    slopes[:, :-1] = np.diff(grid, axis=1)
+
+    curves, _ = propeller_map._arrays(dtype)
+
+    return np.ravel(grid), slopes.ravel(), 1 / np.diff(curves)
+
+
+def _curve_index(curves: np.ndarray, value: np.ndarray) -> np.ndarray:
+    # The index of the pair of curves (or columns) that each value falls
+    # between, clipped, so that points off the map can still be looked up (and
+    # then replaced).
+    i = np.searchsorted(curves, np.real(value), side="right")
+    i -= 1
+    np.clip(i, 0, len(curves) - 2, out=i)
+
+    return i
+
+
+def _interpolate_grid(grid_arrays, curves, value, i, k, u, columns: int):
+    # Interpolate a flattened grid at fraction u of the way from column k to
+    # k + 1, and between curves i and i + 1.
+    values, slopes, inverse_widths = grid_arrays
+
+    index = i * columns + k
+    lower = values.take(index) + u * slopes.take(index)
+    index += columns
+    upper = values.take(index) + u * slopes.take(index)
+
+    return lower + (value - curves.take(i)) * inverse_widths.take(i) * (upper - lower)
+
+
+def _exact_efficiency(
+    propeller_map: PropellerMap, adjusted_propeller_power_coefficient, x, dtype
+):
+    curves, chart_coefficients = propeller_map._arrays(dtype)
+    shape, adjusted_propeller_power_coefficient, x = _flat(
+        adjusted_propeller_power_coefficient, x
+    )
+
+    i = _curve_index(curves, adjusted_propeller_power_coefficient)
+
+    left_interpolation_factor = (
+        curves[i + 1] - adjusted_propeller_power_coefficient
+    ) / (curves[i + 1] - curves[i])
+    right_interpolation_factor = (adjusted_propeller_power_coefficient - curves[i]) / (
+        curves[i + 1] - curves[i]
+    )
+
+    # Interpolate all the coefficients at once, so that each element of an
+    # array of power coefficients gets its own pair of neighboring curves.
+    coefficients = (
+        left_interpolation_factor[..., np.newaxis] * chart_coefficients[i]
+        + right_interpolation_factor[..., np.newaxis] * chart_coefficients[i + 1]
+    )
+
+    eta = coefficients[..., 0]
+    for power in range(1, coefficients.shape[-1]):
+        eta = eta + (coefficients[..., power] * x**power)
+
+    # The chart says nothing about power coefficients off its curves, so don't
+    # extrapolate (as with table maps).
+    real_adjusted_propeller_power_coefficient = np.real(
+        adjusted_propeller_power_coefficient
+    )
+    eta[
+        ~(
+            (curves[0] <= real_adjusted_propeller_power_coefficient)
+            & (real_adjusted_propeller_power_coefficient <= curves[-1])
+        )
+    ] = np.nan
+
+    return eta.reshape(shape)
+
+
+def _flat(*values):
+    # Broadcast values and flatten them (even scalars), so that they can be
+    # indexed in place. Returns their broadcast shape, too.
+    values = np.broadcast_arrays(*values)
+
+    return (values[0].shape,) + tuple(value.ravel() for value in values)
+
+
+def _surface_efficiency(
+    propeller_map: PropellerMap,
+    adjusted_propeller_power_coefficient,
+    x,
+    dtype,
+    resolution,
+):
+    curves, _ = propeller_map._arrays(dtype)
+    grid_arrays = propeller_map._cached(
+        ("surface arrays", resolution, dtype),
+        lambda: _grid_arrays(
+            propeller_map,
+            propeller_efficiency_surface(resolution, dtype, propeller_map),
+            dtype,
+        ),
+    )
+    start, stop = SURFACE_X_RANGE
+    shape, adjusted_propeller_power_coefficient, x = _flat(
+        adjusted_propeller_power_coefficient, x
+    )
+
+    i = _curve_index(curves, adjusted_propeller_power_coefficient)
+
+    position = (x - start) * ((resolution - 1) / (stop - start))
+    # NaN positions cast to any index at all, which is clipped, and the point is
+    # evaluated exactly below.
+    with np.errstate(invalid="ignore"):
+        k = np.real(position).astype(np.intp)
+    np.clip(k, 0, resolution - 2, out=k)
+    u = position - k.astype(position.dtype)
+
+    eta = _interpolate_grid(
+        grid_arrays, curves, adjusted_propeller_power_coefficient, i, k, u, resolution
+    )
+
+    real_adjusted_propeller_power_coefficient = np.real(
+        adjusted_propeller_power_coefficient
+    )
+    real_x = np.real(x)
+    off_surface = ~(
+        (curves[0] <= real_adjusted_propeller_power_coefficient)
+        & (real_adjusted_propeller_power_coefficient < curves[-1])
+        & (start <= real_x)
+        & (real_x <= stop)
+    )
+    if off_surface.any():
+        eta[off_surface] = _exact_efficiency(
+            propeller_map,
+            adjusted_propeller_power_coefficient[off_surface],
+            x[off_surface],
+            dtype,
+        )
+
+    return eta.reshape(shape)
+
+
+def _table_efficiency(
+    propeller_map: PropellerMap, propeller_power_coefficient, advance_ratio, dtype
+):
+    curves, table = propeller_map._arrays(dtype)
+    advance_ratios, inverse_steps, grid_arrays = propeller_map._cached(
+        ("table arrays", dtype),
+        lambda: (
+            propeller_map.advance_ratios.astype(dtype),
+            1 / np.diff(propeller_map.advance_ratios.astype(dtype)),
+            _grid_arrays(propeller_map, table, dtype),
+        ),
+    )
+    shape, propeller_power_coefficient, advance_ratio = _flat(
+        propeller_power_coefficient, advance_ratio
+    )
+
+    i = _curve_index(curves, propeller_power_coefficient)
+    k = _curve_index(advance_ratios, advance_ratio)
+    u = (advance_ratio - advance_ratios.take(k)) * inverse_steps.take(k)
+
+    eta = _interpolate_grid(
+        grid_arrays,
+        curves,
+        propeller_power_coefficient,
+        i,
+        k,
+        u,
+        len(advance_ratios),
+    )
+
+    real_propeller_power_coefficient = np.real(propeller_power_coefficient)
+    real_advance_ratio = np.real(advance_ratio)
+    eta[
+        ~(
+            (curves[0] <= real_propeller_power_coefficient)
+            & (real_propeller_power_coefficient <= curves[-1])
+            & (advance_ratios[0] <= real_advance_ratio)
+            & (real_advance_ratio <= advance_ratios[-1])
+        )
+    ] = np.nan
+
+    return eta.reshape(shape)
+
+
 def propeller_efficiency(
     sdef,
     propeller_advance_ratio,
     propeller_power_coefficient,
     power_adjustment_factor_x,
+    mode: str = "exact",
+    resolution: int = SURFACE_RESOLUTION,
+    propeller_map: PropellerMap = LOWRY_PROPELLER_MAP,
 ):
     """Approximates η, constant-speed propulsive efficiency:
 
-    :math:`\eta = {SDEF(Z)} \\times \eta(J/C_p{}^\\frac{1}{3}{}^2, C_{PX})`
+    :math:`\\eta = {SDEF(Z)} \\times \\eta(J/C_p{}^\\frac{1}{3}{}^2, C_{PX})`
 
     Args:
         sdef: :math:`{SDEF}`, slowdown efficiency factor for the tractor propeller.
         propeller_advance_ratio: :math:`J`, propeller advance ratio.
         propeller_power_coefficient: :math:`C_P`, propeller power coefficient.
         power_adjustment_factor_x: :math:`X`, power adjustment factor.
+        mode: ``"exact"`` evaluates the chart's polynomials. ``"surface"``
+            interpolates a cached ``propeller_efficiency_surface`` of
+            ``resolution`` points instead, which is faster over large grids, at
+            the cost of the error that ``propeller_efficiency_surface_error``
+            reports. Points off the surface are evaluated exactly. A table map
+            is always interpolated. Either way, :math:`\\eta` is NaN off the
+            map (for the chart, where :math:`C_{PX}` lies outside its curves).
+        propeller_map: The propeller's map (by default, Dr. Lowry's chart). For a
+            table map, :math:`\\eta = {SDEF(Z)} \\times \\eta(J, C_P)`.
 
     Returns:
-        :math:`\eta`, propeller efficiency.
+        :math:`\\eta`, propeller efficiency.
     """
-    curves = list(propeller_chart.keys())
+    if mode not in ("exact", "surface"):
+        raise ValueError(f"Unknown propeller efficiency mode {mode!r}.")
+
+    if propeller_map.table is not None:
+        return (
+            sdef
+            * _table_efficiency(
+                propeller_map,
+                propeller_power_coefficient,
+                propeller_advance_ratio,
+                _dtype(propeller_power_coefficient),
+            )[()]
+        )
 
     # $C_{PX} = C_P / X$
     adjusted_propeller_power_coefficient = (
         propeller_power_coefficient / power_adjustment_factor_x
     )
+    dtype = _dtype(adjusted_propeller_power_coefficient)
 
-    i = np.searchsorted(curves, adjusted_propeller_power_coefficient, side="right") - 1
-
-    left_interpolation_factor = (
-        curves[i + 1] - adjusted_propeller_power_coefficient
-    ) / (curves[i + 1] - curves[i])
-    right_interpolation_factor = (adjusted_propeller_power_coefficient - curves[i]) / (
-        curves[i + 1] - curves[i]
-    )
+    # x, in this case, is $J/C_P{}^\frac{1}{3}{}^2$.
+    x = propeller_advance_ratio / propeller_power_coefficient ** (1 / 3)
 
-    def interpolated_coefficient(left_curve_idx, power):
+    # $\eta = \mathit{SDEF(Z)} \times \eta(J/C_p{}^\frac{1}{3}{}^2, C_{PX})$
+    if mode == "exact":
+        return (
+            sdef
+            * _exact_efficiency(
+                propeller_map, adjusted_propeller_power_coefficient, x, dtype
+            )[()]
+        )
+    else:
         return (
-            left_interpolation_factor * propeller_chart[curves[left_curve_idx]][power]
-            + right_interpolation_factor
-            * propeller_chart[curves[left_curve_idx + 1]][power]
+            sdef
+            * _surface_efficiency(
+                propeller_map,
+                adjusted_propeller_power_coefficient,
+                x,
+                dtype,
+                resolution,
+            )[()]
         )
 
-    coefficients = {
-        0: interpolated_coefficient(i, 0),
-        1: interpolated_coefficient(i, 1),
-        2: interpolated_coefficient(i, 2),
-        3: interpolated_coefficient(i, 3),
-        4: interpolated_coefficient(i, 4),
-        5: interpolated_coefficient(i, 5),
-        6: interpolated_coefficient(i, 6),
-    }
 
-    # x, in this case, is $J/C_P{}^\frac{1}{3}{}^2$.
-    x = propeller_advance_ratio / propeller_power_coefficient ** (1 / 3)
+def _dtype(value) -> np.dtype:
+    # The precision to evaluate a map at: the inputs', so that e.g. float32 power
+    # coefficients don't get promoted to float64. Complex inputs (e.g., complex
+    # steps, see ``sensitivity``) use the map at their real precision.
+    dtype = getattr(value, "dtype", None)
 
-    # $\eta = \mathit{SDEF(Z)} \times \eta(J/C_p{}^\frac{1}{3}{}^2, C_{PX})$
-    return sdef * (
-        coefficients[0]
-        + (coefficients[1] * x)
-        + (coefficients[2] * x**2)
-        + (coefficients[3] * x**3)
-        + (coefficients[4] * x**4)
-        + (coefficients[5] * x**5)
-        + (coefficients[6] * x**6)
+    if dtype is None or dtype.kind not in "fc":
+        return np.dtype(np.float64)
+
+    return np.finfo(dtype).dtype
+
+
+@dataclass(frozen=True)
+class SurfaceError:
+    """How far a propeller efficiency surface strays from the exact chart (in
+    η/SDEF), over its whole domain."""
+
+    resolution: int
+    max_abs_error: float
+    rms_error: float
+
+
+def propeller_efficiency_surface_error(
+    resolution: int = SURFACE_RESOLUTION,
+    samples: int = 1000,
+    propeller_map: PropellerMap = LOWRY_PROPELLER_MAP,
+) -> SurfaceError:
+    """Compare a surface against the exact chart at ``samples`` × ``samples``
+    points spread over the surface's domain, offset from its grid."""
+    dtype = np.dtype(np.float64)
+    curves, _ = propeller_map._arrays(dtype)
+    start, stop = SURFACE_X_RANGE
+
+    # Midway between sample points, which (mostly) falls between grid points.
+    fraction = (np.arange(samples) + 0.5) / samples
+    x = (start + (stop - start) * fraction)[np.newaxis, :]
+    adjusted_propeller_power_coefficient = (
+        curves[0] + (curves[-1] - curves[0]) * fraction
+    )[:, np.newaxis]
+
+    error = _surface_efficiency(
+        propeller_map, adjusted_propeller_power_coefficient, x, dtype, resolution
+    ) - _exact_efficiency(propeller_map, adjusted_propeller_power_coefficient, x, dtype)
+
+    return SurfaceError(
+        resolution,
+        float(np.abs(error).max()),
+        float(np.sqrt(np.mean(error**2))),
     )
@@ -0,0 +1,202 @@
+"""Sensitivities of by-altitude profiles to dataplate parameters.
+
+``profile_sensitivities`` answers questions like "how far does VY move per 1%
+of :math:`C_{D0}`?" at every altitude of a profile at once, e.g.::
+
+    sensitivities = profile_sensitivities(
+        N51SW,
+        ("parasite_drag_coefficient", "airplane_efficiency_factor"),
+        3000,
+        np.arange(0, 20000, 1000),
+        np.arange(60, 120, 0.5),
+        Mixture.BEST_POWER,
+        2400,
+        best_rate_of_climb_row,
+    )
+    sensitivities.per_percent()[0, :, ByAltitudeRowIndex.KCAS]
+
+Derivatives are taken by complex steps: each parameter is offset by a tiny
+imaginary step :math:`ih`, and the imaginary part of every output, divided by
+:math:`h`, is its derivative (forward-mode, through the same bootstrap
+equations). Unlike finite differences, nothing is subtracted, so there's no
+cancellation error and the step can be as small as we like: derivatives are as
+accurate as the outputs themselves. Each parameter's perturbed dataplate is one
+aircraft of a ``Fleet``, so every parameter and altitude is evaluated in one
+batched pass.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.conditions import (
+    FullThrottleConditions,
+    PartialThrottleConditions,
+)
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.equations import c_to_f, metric_standard_temperature
+from the_bootstrap_approach.fleet import Fleet
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    _bootstrap_performance_table,
+)
+
+# The complex step, relative to each parameter's value. Anything small enough
+# that its square vanishes next to 1 will do.
+_STEP = 1e-30
+
+
+@dataclass(frozen=True)
+class ProfileSensitivities:
+    """A by-altitude profile and its derivatives with respect to dataplate
+    parameters.
+
+    ``derivatives[i, j, k]`` is the derivative of column ``k`` (a
+    ``ByAltitudeRowIndex``) at the profile's ``j``-th altitude with respect to
+    the ``i``-th parameter. The ceilings are where the profile's rate of climb
+    falls to 0 and 100 ft/min (NaN if the altitudes don't bracket them), which
+    is meaningful for a best rate of climb profile.
+    """
+
+    parameters: Tuple[str, ...]
+    values: npt.NDArray[np.float64]
+    data: npt.NDArray[np.float64]
+    derivatives: npt.NDArray[np.float64]
+    absolute_ceiling: float
+    absolute_ceiling_derivatives: npt.NDArray[np.float64]
+    service_ceiling: float
+    service_ceiling_derivatives: npt.NDArray[np.float64]
+
+    def per_percent(self) -> npt.NDArray[np.float64]:
+        """How far each output moves per 1% change in each parameter, in the
+        shape of ``derivatives``."""
+        return self.derivatives * (self.values / 100)[:, np.newaxis, np.newaxis]
+
+
+def _ceiling(pressure_altitude: np.ndarray, rate_of_climb: np.ndarray, level):
+    # Where each profile's rate of climb (along the last axis, complex) falls to
+    # level, interpolated linearly between the altitudes that bracket it.
+    below = ~(np.real(rate_of_climb[0]) >= level)
+
+    if not below.any():
+        return np.full(len(rate_of_climb), np.nan, dtype=complex)
+
+    j = int(np.argmax(below))
+    if j == 0 or np.isnan(rate_of_climb[0, j]):
+        return np.full(len(rate_of_climb), np.nan, dtype=complex)
+
+    roc0 = rate_of_climb[:, j - 1]
+    roc1 = rate_of_climb[:, j]
+    h0 = pressure_altitude[j - 1]
+    h1 = pressure_altitude[j]
+
+    return h0 + (roc0 - level) / (roc0 - roc1) * (h1 - h0)
+
+
+def profile_sensitivities(
+    dataplate: DataPlate,
+    parameters: Sequence[str],
+    gross_aircraft_weight: float,
+    pressure_altitudes: npt.ArrayLike,
+    kcas: npt.ArrayLike,
+    mixture: Mixture,
+    engine_rpm: float,
+    select: Callable[[np.ndarray], Optional[npt.NDArray[np.float64]]],
+    power: Optional[float] = None,
+    isa_diff: float = 0,
+) -> ProfileSensitivities:
+    """Differentiate a by-altitude profile with respect to dataplate
+    parameters.
+
+    The profile is built as by ``fleet_profiles``: a table over ``kcas`` at
+    every pressure altitude, at full throttle or, if given, at ``power`` (capped
+    at full throttle), from which ``select`` picks a row (e.g.,
+    ``best_rate_of_climb_row``, or ``max_level_flight_speed_row`` for cruise
+    speed and MPG at a power setting). The profile ends below the first altitude
+    where there's no row, or where the airplane can't sustain level flight.
+
+    Args:
+        parameters: Names of ``DataPlate.replace``'s parameters, e.g.
+            ``"parasite_drag_coefficient"``, ``"airplane_efficiency_factor"``,
+            ``"blade_activity_factor"``, or
+            ``"engine_power_altitude_dropoff_parameter"``. Derived parameters
+            (e.g., the aspect ratio from the wing span) follow along.
+    """
+    parameters = tuple(parameters)
+    if not parameters:
+        raise ValueError("Expected at least one parameter.")
+
+    values = np.array([getattr(dataplate, name) for name in parameters], dtype=float)
+    steps = _STEP * np.where(values == 0, 1, np.abs(values))
+
+    fleet = Fleet(
+        [
+            dataplate.replace(**{name: value + step * 1j})
+            for name, value, step in zip(parameters, values, steps)
+        ],
+        axes=2,
+    )
+
+    pressure_altitude = np.asarray(pressure_altitudes, dtype=float)
+    oat_f = c_to_f(metric_standard_temperature(pressure_altitude) + isa_diff)
+    kcas = np.asarray(kcas, dtype=float)
+
+    conditions = FullThrottleConditions(
+        fleet,
+        gross_aircraft_weight,
+        pressure_altitude[:, np.newaxis],
+        oat_f[:, np.newaxis],
+        mixture,
+        engine_rpm,
+    )
+    if power is not None:
+        conditions = PartialThrottleConditions(
+            fleet,
+            gross_aircraft_weight,
+            pressure_altitude[:, np.newaxis],
+            oat_f[:, np.newaxis],
+            mixture,
+            engine_rpm,
+            np.minimum(power, conditions.power),
+        )
+
+    # Parameters by altitude by KCAS.
+    tables = _bootstrap_performance_table(fleet, conditions, kcas)
+
+    # The row selectors order complex values by their real parts first, so they
+    # pick the same rows as they would for the unperturbed dataplate.
+    rows = np.full(tables.shape[:2] + (len(ByKCASRowIndex),), np.nan, dtype=complex)
+    for i, parameter_tables in enumerate(tables):
+        for j, table in enumerate(parameter_tables):
+            row = select(table)
+
+            if row is not None:
+                rows[i, j] = row
+
+    rate_of_climb = rows[..., ByKCASRowIndex.RATE_OF_CLIMB]
+
+    # The real parts are the unperturbed profile, whichever parameter's.
+    climbs = np.real(rate_of_climb[0]) >= 0
+    length = len(climbs) if climbs.all() else int(np.argmin(climbs))
+
+    data = np.empty((len(parameters), length, len(ByAltitudeRowIndex)), dtype=complex)
+    data[..., ByAltitudeRowIndex.PRESSURE_ALTITUDE] = pressure_altitude[:length]
+    data[..., ByAltitudeRowIndex.KCAS :] = rows[:, :length]
+
+    absolute_ceiling = _ceiling(pressure_altitude, rate_of_climb, 0)
+    service_ceiling = _ceiling(pressure_altitude, rate_of_climb, 100)
+
+    return ProfileSensitivities(
+        parameters,
+        values,
+        data[0].real,
+        data.imag / steps[:, np.newaxis, np.newaxis],
+        float(absolute_ceiling[0].real),
+        absolute_ceiling.imag / steps,
+        float(service_ceiling[0].real),
+        service_ceiling.imag / steps,
+    )
@@ -0,0 +1,450 @@
+"""A local HTTP service answering performance queries.
+
+The service speaks just enough HTTP/1.1 (on top of asyncio's streams, with no
+dependencies) to accept JSON ``POST`` requests at three endpoints:
+
+- ``/point``: one row of a performance table, e.g. ``{"dataplate": "N51SW",
+  "mixture": "BEST_POWER", "gross_aircraft_weight": 2800, "pressure_altitude":
+  8000, "isa_diff": 0, "engine_rpm": 2500, "kcas": 110}``, plus an optional
+  ``"power"`` (ft-lbf/s; full throttle without it, and at most). Concurrent
+  point queries are coalesced into vectorized batches, though a bad query only
+  fails itself.
+- ``/profile``: a ``PerformanceProfile``, built by one of the service's profile
+  builders, e.g. ``{"dataplate": "N51SW", "kind": "descent", ...}``, where the
+  other parameters are the builder's keyword arguments. Profiles are built in a
+  process pool, off the event loop, and cached.
+- ``/trip``: time, fuel, and distance for a climb, cruise, and descent.
+
+Every response is a JSON object; errors are ``{"error": message}``.
+"""
+
+import asyncio
+import functools
+import json
+import math
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByAltitudeRowIndex,
+    ByKCASRowIndex,
+    PerformanceProfile,
+    bootstrap_scatter_performance_table,
+    descent_profiles,
+    time_fuel_distance,
+)
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+def descent_profile(
+    dataplate: DataPlate,
+    gross_aircraft_weight: float,
+    pressure_altitudes: List[float],
+    kcas: float,
+    mixture: Mixture,
+    engine_rpm: float,
+    rate_of_descent: Optional[float] = None,
+    power: Optional[float] = None,
+    isa_diff: float = 0,
+) -> PerformanceProfile:
+    """The ``descent`` profile builder (see ``descent_profiles``)."""
+    (profile,) = descent_profiles(
+        dataplate,
+        (gross_aircraft_weight,),
+        pressure_altitudes,
+        kcas,
+        mixture,
+        engine_rpm,
+        rate_of_descent=rate_of_descent,
+        power=power,
+        isa_diff=isa_diff,
+    )
+
+    return profile
+
+
+def _json_column(column: np.ndarray) -> List[Optional[float]]:
+    # JSON has no NaN.
+    return [None if math.isnan(value) else value for value in column.tolist()]
+
+
+def _mixture(query: Mapping[str, Any]) -> Mixture:
+    # In-process queries may give a Mixture, too.
+    if isinstance(query.get("mixture"), Mixture):
+        return query["mixture"]
+
+    try:
+        return Mixture[query["mixture"]]
+    except KeyError:
+        raise ValueError(f"Unknown mixture {query.get('mixture')!r}.") from None
+
+
+def _number(query: Mapping[str, Any], name: str) -> float:
+    try:
+        return float(query[name])
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, not {query[name]!r}.") from None
+
+
+def _json_default(value: Any) -> Any:
+    # In-process callers may pass parameters that JSON can't encode. Encode them
+    # as the equivalent HTTP query would, so that both share a cache key.
+    if isinstance(value, Mixture):
+        return value.name
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+
+    raise TypeError(f"Can't use {value!r} as a parameter.")
+
+
+class PerformanceService:
+    """Answer performance queries about a set of dataplates, in-process (by
+    awaiting ``point``, ``profile``, or ``trip``) or over HTTP (see ``start``).
+
+    Args:
+        dataplates: The dataplates to answer queries about, by name.
+        profiles: Profile builders, by kind, in addition to ``descent``. Each is
+            called with a dataplate and the query's other parameters (with
+            ``mixture`` converted to a ``Mixture``), and must be importable so
+            that it can run in a worker process.
+        cache_size: How many profiles to keep.
+        batch_size: The most point queries to evaluate at once.
+        batch_delay: How long (s) to wait for more point queries to batch with
+            the first.
+        executor: Where to build profiles. By default, a process pool.
+    """
+
+    def __init__(
+        self,
+        dataplates: Mapping[str, DataPlate],
+        profiles: Optional[Mapping[str, Callable[..., PerformanceProfile]]] = None,
+        cache_size: int = 128,
+        batch_size: int = 4096,
+        batch_delay: float = 0.001,
+        executor: Optional[Executor] = None,
+    ):
+        self.dataplates = dict(dataplates)
+        self.profiles = {"descent": descent_profile, **(profiles or {})}
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._digests = {
+            name: dataplate.digest() for name, dataplate in self.dataplates.items()
+        }
+        self._cache: "OrderedDict[Tuple, PerformanceProfile]" = OrderedDict()
+        self._building: Dict[Tuple, asyncio.Future] = {}
+        self._batch: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush: Optional[asyncio.Handle] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def _dataplate(self, query: Mapping[str, Any]) -> DataPlate:
+        try:
+            return self.dataplates[query["dataplate"]]
+        except KeyError:
+            raise ValueError(f"Unknown dataplate {query.get('dataplate')!r}.") from None
+
+    async def point(self, query: Mapping[str, Any]) -> Dict[str, Optional[float]]:
+        """Evaluate one row of a performance table, by column name."""
+        query = dict(query)
+        self._dataplate(query)
+        query["mixture"] = _mixture(query).name
+        for name in (
+            "gross_aircraft_weight",
+            "pressure_altitude",
+            "engine_rpm",
+            "kcas",
+        ):
+            query[name] = _number(query, name)
+        # Optional, and null means absent.
+        for name in ("power", "oat_f", "isa_diff"):
+            if query.get(name) is not None:
+                query[name] = _number(query, name)
+
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append((query, future))
+
+        if len(self._batch) >= self.batch_size:
+            self._evaluate_batch()
+        elif self._flush is None:
+            self._flush = asyncio.get_running_loop().call_later(
+                self.batch_delay, self._evaluate_batch
+            )
+
+        return await future
+
+    def _evaluate_batch(self) -> None:
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+        batch, self._batch = self._batch, []
+        groups: Dict[Tuple[str, str], List] = {}
+        for query, future in batch:
+            groups.setdefault((query["dataplate"], query["mixture"]), []).append(
+                (query, future)
+            )
+
+        for (name, mixture), group in groups.items():
+            self._evaluate_group(self.dataplates[name], Mixture[mixture], group)
+
+    def _evaluate_group(
+        self,
+        dataplate: DataPlate,
+        mixture: Mixture,
+        group: List[Tuple[Dict[str, Any], asyncio.Future]],
+    ) -> None:
+        try:
+            table = self._evaluate_points(
+                dataplate, mixture, [query for query, _ in group]
+            )
+        except Exception as e:
+            if len(group) > 1:
+                # Don't fail every query in the batch for one bad one: evaluate
+                # them one at a time, so that each gets only its own error.
+                for item in group:
+                    self._evaluate_group(dataplate, mixture, [item])
+                return
+
+            ((_, future),) = group
+            if not future.done():
+                # It's the query that's at fault, so make it a bad request.
+                error = ValueError(f"Can't evaluate the point: {e}")
+                error.__cause__ = e
+                future.set_exception(error)
+            return
+
+        for (_, future), row in zip(group, table):
+            if not future.done():
+                future.set_result(
+                    dict(zip(ByKCASRowIndex.__members__, _json_column(row)))
+                )
+
+    @staticmethod
+    def _evaluate_points(
+        dataplate: DataPlate, mixture: Mixture, queries: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        def column(name, default=np.nan):
+            return np.array([query.get(name, default) for query in queries], float)
+
+        return bootstrap_scatter_performance_table(
+            dataplate,
+            mixture,
+            column("gross_aircraft_weight"),
+            column("pressure_altitude"),
+            column("engine_rpm"),
+            column("kcas"),
+            power=column("power"),
+            oat_f=column("oat_f"),
+            isa_diff=column("isa_diff", 0),
+        )
+
+    async def profile(self, query: Mapping[str, Any]) -> PerformanceProfile:
+        """Build (or recall) a profile."""
+        parameters = dict(query)
+        dataplate = self._dataplate(parameters)
+        name = parameters.pop("dataplate")
+        kind = parameters.pop("kind", None)
+        if kind not in self.profiles:
+            raise ValueError(f"Unknown profile kind {kind!r}.")
+
+        key = (
+            self._digests[name],
+            kind,
+            json.dumps(parameters, sort_keys=True, default=_json_default),
+        )
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Concurrent queries for the same profile wait on a single build.
+        if key not in self._building:
+            if "mixture" in parameters:
+                parameters["mixture"] = _mixture(parameters)
+
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor()
+
+            self._building[key] = asyncio.ensure_future(
+                asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    functools.partial(self.profiles[kind], dataplate, **parameters),
+                )
+            )
+
+        building = self._building[key]
+        try:
+            profile = await asyncio.shield(building)
+        finally:
+            if building.done():
+                self._building.pop(key, None)
+
+        self._cache[key] = profile
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return profile
+
+    async def trip(self, query: Mapping[str, Any]) -> Dict[str, Dict[str, float]]:
+        """Estimate time (minutes), fuel (gallons), and distance (NM) for a trip.
+
+        The query gives the ``dataplate``, trip ``distance`` (NM), and
+        ``cruise_altitude`` (ft), and optionally the ``departure_altitude`` and
+        ``destination_altitude`` (ft, by default sea level). Then, ``climb`` and
+        ``descent`` are profile queries, and ``cruise`` is a point query (less
+        the dataplate and pressure altitude).
+        """
+        dataplate = query["dataplate"]
+        cruise_altitude = float(query["cruise_altitude"])
+
+        climb, descent = await asyncio.gather(
+            self.profile({**query["climb"], "dataplate": dataplate}),
+            self.profile({**query["descent"], "dataplate": dataplate}),
+        )
+        cruise = await self.point(
+            {
+                **query["cruise"],
+                "dataplate": dataplate,
+                "pressure_altitude": cruise_altitude,
+            }
+        )
+
+        def segment(profile, bottom):
+            data = profile.data
+            altitude = data[:, ByAltitudeRowIndex.PRESSURE_ALTITUDE]
+            if not altitude[0] <= bottom <= cruise_altitude <= altitude[-1]:
+                raise ValueError(
+                    f"{profile.name} doesn't span {bottom:g}' to {cruise_altitude:g}'."
+                )
+
+            cumulative = time_fuel_distance(data)
+            return [
+                float(
+                    np.interp(cruise_altitude, altitude, y)
+                    - np.interp(bottom, altitude, y)
+                )
+                for y in cumulative
+            ]
+
+        legs = {
+            "climb": segment(climb, float(query.get("departure_altitude", 0))),
+            "descent": segment(descent, float(query.get("destination_altitude", 0))),
+        }
+
+        cruise_distance = (
+            float(query["distance"]) - legs["climb"][2] - legs["descent"][2]
+        )
+        if cruise_distance < 0:
+            raise ValueError("The trip is too short to reach the cruise altitude.")
+
+        cruise_minutes = cruise_distance / cruise["KTAS"] * 60
+        legs["cruise"] = [
+            cruise_minutes,
+            cruise["GPH"] * cruise_minutes / 60,
+            cruise_distance,
+        ]
+        legs["total"] = [sum(leg[i] for leg in legs.values()) for i in range(3)]
+
+        return {
+            name: dict(zip(("minutes", "gallons", "nautical_miles"), leg))
+            for name, leg in legs.items()
+        }
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        endpoints = {"/point": self.point, "/profile": self.profile, "/trip": self.trip}
+
+        if path not in endpoints:
+            return 404, {"error": f"No such endpoint {path!r}."}
+        if method != "POST":
+            return 405, {"error": "Use POST."}
+
+        try:
+            result = await endpoints[path](json.loads(body or b"{}"))
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": str(e)}
+
+        if isinstance(result, PerformanceProfile):
+            result = {
+                "name": result.name,
+                "gross_aircraft_weight": result.gross_aircraft_weight,
+                "isa_diff": result.isa_diff,
+                "data": {
+                    member.name: _json_column(result.data[:, member])
+                    for member in ByAltitudeRowIndex
+                },
+            }
+
+        return 200, result
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            status, payload = await self._dispatch(method, path, body)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+
+        content = json.dumps(payload).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(content)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + content
+        )
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving HTTP on ``host`` and ``port`` (by default, any free
+        port).
+
+        Returns:
+            The port.
+        """
+        self.server = await asyncio.start_server(self._handle, host, port)
+
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
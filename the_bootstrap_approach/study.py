@@ -0,0 +1,269 @@
+"""Resumable parameter studies.
+
+A study calls a function once per work unit (e.g., one ``PerformanceProfile`` per
+combination of dataplate variant, ISA deviation, and weight) and checkpoints
+each result to a directory as soon as it's computed. Restarting a study after a
+crash or preemption skips every finished unit.
+
+The checkpoint directory doubles as a work queue: a process claims a unit by
+creating its lock file exclusively, so any number of processes, on one machine
+or on several sharing a filesystem, can work through the same study at once.
+"""
+
+import contextlib
+import os
+import pickle
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+_RESULT_SUFFIX = ".pickle"
+_LOCK_SUFFIX = ".lock"
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    # Write to a temporary file in the same directory, then rename it into place,
+    # so that readers see either no file or the whole file.
+    directory = os.path.dirname(path)
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory, prefix=".", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+class Study:
+    """Run ``func(**unit)`` for every unit, checkpointing results to
+    ``directory``.
+
+    Args:
+        directory: The checkpoint directory (created if necessary).
+        func: A function of the units' keyword arguments. To run a study across
+            processes, it must be importable (i.e., defined at module level).
+        units: The keyword arguments for each call. Their values should be
+            simple (e.g., strings and numbers), since their reprs name the
+            checkpoint files, e.g. ``{"dataplate": "N51SW", "isa_diff": -30,
+            "gross_aircraft_weight": 2250}``.
+        lock_timeout: Seconds after which a claimed, unfinished unit whose lock
+            hasn't been touched is presumed abandoned (e.g., its process was
+            killed) and may be claimed again. A running unit touches its lock
+            every quarter of this, so units may take longer than it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        func: Callable[..., Any],
+        units: Sequence[Dict[str, Any]],
+        lock_timeout: float = 60 * 60,
+    ):
+        self.directory = directory
+        self.func = func
+        self.units = list(units)
+        self.lock_timeout = lock_timeout
+
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(unit: Dict[str, Any]) -> str:
+        """The file name (without extension) under which a unit is checkpointed."""
+        return quote(
+            ",".join(f"{name}={value!r}" for name, value in sorted(unit.items())),
+            safe="=,+-.",
+        )
+
+    def _path(self, unit: Dict[str, Any], suffix: str) -> str:
+        return os.path.join(self.directory, self.key(unit) + suffix)
+
+    def done(self, unit: Dict[str, Any]) -> bool:
+        return os.path.exists(self._path(unit, _RESULT_SUFFIX))
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """The units that haven't finished (including ones claimed by another
+        process)."""
+        return [unit for unit in self.units if not self.done(unit)]
+
+    def _claim(self, unit: Dict[str, Any]) -> bool:
+        path = self._path(unit, _LOCK_SUFFIX)
+
+        try:
+            descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                age = time.time() - os.stat(path).st_mtime
+            except FileNotFoundError:
+                # Released in the meantime; try again.
+                return self._claim(unit)
+
+            if age < self.lock_timeout:
+                return False
+
+            # Break the stale lock. Renaming it first means that, of several
+            # processes racing to break it, only one succeeds.
+            broken_path = f"{path}.{uuid.uuid4().hex}.stale"
+            try:
+                os.rename(path, broken_path)
+            except FileNotFoundError:
+                return False
+
+            # Between our stat and rename, another process may have broken the
+            # lock itself and claimed the unit afresh, in which case we've just
+            # renamed its fresh lock away. Put it back (unless yet another
+            # process has claimed the unit in the meantime).
+            if time.time() - os.stat(broken_path).st_mtime < self.lock_timeout:
+                try:
+                    os.link(broken_path, path)
+                except FileExistsError:
+                    pass
+                os.unlink(broken_path)
+                return False
+
+            os.unlink(broken_path)
+            return self._claim(unit)
+
+        with os.fdopen(descriptor, "w") as file:
+            file.write(f"{socket.gethostname()} {os.getpid()}\n")
+
+        return True
+
+    @contextlib.contextmanager
+    def _keep_claimed(self, unit: Dict[str, Any]) -> Iterator[None]:
+        # Touch the unit's lock every so often while it runs, so that a unit
+        # that outlasts lock_timeout isn't taken for abandoned.
+        path = self._path(unit, _LOCK_SUFFIX)
+        stop = threading.Event()
+
+        def touch():
+            while not stop.wait(self.lock_timeout / 4):
+                try:
+                    os.utime(path)
+                except FileNotFoundError:
+                    pass
+
+        thread = threading.Thread(target=touch, daemon=True)
+        thread.start()
+
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _release(self, unit: Dict[str, Any]) -> None:
+        try:
+            os.unlink(self._path(unit, _LOCK_SUFFIX))
+        except FileNotFoundError:
+            pass
+
+    def run(self, max_units: Optional[int] = None) -> int:
+        """Work through the study's pending units in this process.
+
+        Units that another process has claimed are skipped. If ``func`` raises,
+        the unit is released, so that it's retried later, and the exception
+        propagates.
+
+        Returns:
+            The number of units this call finished.
+        """
+        finished = 0
+
+        for unit in self.units:
+            if max_units is not None and finished >= max_units:
+                break
+            if self.done(unit) or not self._claim(unit):
+                continue
+
+            try:
+                # Another process may have finished the unit (and released its
+                # lock) between our checking and claiming it.
+                if self.done(unit):
+                    continue
+
+                with self._keep_claimed(unit):
+                    result = self.func(**unit)
+                _atomic_write(
+                    self._path(unit, _RESULT_SUFFIX),
+                    pickle.dumps(
+                        {"unit": unit, "result": result},
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    ),
+                )
+                finished += 1
+            finally:
+                self._release(unit)
+
+        return finished
+
+    def run_parallel(self, processes: Optional[int] = None) -> int:
+        """Work through the study's pending units in ``processes`` local worker
+        processes (by default, one per CPU).
+
+        Returns:
+            The number of units the workers finished.
+        """
+        processes = processes or os.cpu_count() or 1
+
+        with ProcessPoolExecutor(processes) as executor:
+            return sum(
+                future.result()
+                for future in [executor.submit(self.run) for _ in range(processes)]
+            )
+
+    def results(self) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """Yield each finished ``(unit, result)`` in the checkpoint directory,
+        including units merged in from other studies."""
+        for name in sorted(os.listdir(self.directory)):
+            if name.startswith(".") or not name.endswith(_RESULT_SUFFIX):
+                continue
+
+            with open(os.path.join(self.directory, name), "rb") as file:
+                checkpoint = pickle.load(file)
+
+            yield checkpoint["unit"], checkpoint["result"]
+
+
+def merge(directory: str, *sources: str) -> int:
+    """Merge the finished units of other checkpoint directories (e.g., partial
+    outputs from several machines) into ``directory``.
+
+    Units already in ``directory`` are kept as they are.
+
+    Returns:
+        The number of units merged in.
+    """
+    os.makedirs(directory, exist_ok=True)
+    merged = 0
+
+    for source in sources:
+        for name in sorted(os.listdir(source)):
+            if name.startswith(".") or not name.endswith(_RESULT_SUFFIX):
+                continue
+
+            destination = os.path.join(directory, name)
+            if os.path.exists(destination):
+                continue
+
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=directory, prefix=".", suffix=".tmp"
+            )
+            os.close(descriptor)
+            shutil.copyfile(os.path.join(source, name), temporary_path)
+            os.replace(temporary_path, destination)
+            merged += 1
+
+    return merged
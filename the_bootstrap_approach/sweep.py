@@ -0,0 +1,525 @@
+"""Memory-budgeted sweeps over grids of operating conditions.
+
+A grid of, say, altitude × ISA deviation × weight × RPM × power × KCAS easily has
+billions of points, far too many to hold every column of every point in memory
+at once. ``sweep`` instead evaluates the grid in chunks that fit a memory budget
+and hands each chunk to a set of reducers (e.g., best MPG per altitude, VY per
+weight, or ceiling per ISA deviation), which keep only what they need.
+
+When every point of (a few columns of) a grid is needed, ``parallel_grid``
+evaluates it across worker processes that write straight into shared memory.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.performance import (
+    ByKCASRowIndex,
+    _scatter_columns,
+)
+
+# The axes a grid may have, in the order they're laid out (KCAS varies fastest).
+# Temperature is given either as OAT°F or as a deviation from ISA (℃). Without
+# a power axis, the engine is at full throttle; otherwise, power settings beyond
+# what full throttle can deliver at a grid point are limited to full throttle.
+GRID_AXES = (
+    "gross_aircraft_weight",
+    "pressure_altitude",
+    "oat_f",
+    "isa_diff",
+    "engine_rpm",
+    "power",
+    "kcas",
+)
+_REQUIRED_GRID_AXES = (
+    "gross_aircraft_weight",
+    "pressure_altitude",
+    "engine_rpm",
+    "kcas",
+)
+
+# Bytes allocated per grid point while evaluating and reducing a chunk. In units
+# of the dtype's item size: the 17 columns, the temporaries the equations and the
+# propeller chart (which interpolates seven coefficients per point) allocate, and
+# the chunk's grid values peak at about 40. In units of np.intp's, whatever the
+# dtype: the chunk's flat and per-axis grid indices, and the reducers' group
+# indices and temporaries, at about 8.
+_ITEMS_PER_POINT = 48
+_INDICES_PER_POINT = 16
+
+
+def _grid_axes(grid: Dict[str, npt.ArrayLike], dtype) -> Dict[str, np.ndarray]:
+    for name in grid:
+        if name not in GRID_AXES:
+            raise ValueError(f"Unknown grid axis {name!r}.")
+    for name in _REQUIRED_GRID_AXES:
+        if name not in grid:
+            raise ValueError(f"The grid is missing the {name!r} axis.")
+    if "oat_f" in grid and "isa_diff" in grid:
+        raise ValueError("Give temperature as either 'oat_f' or 'isa_diff'.")
+
+    return {
+        name: np.atleast_1d(np.asarray(grid[name], dtype=dtype))
+        for name in GRID_AXES
+        if name in grid
+    }
+
+
+class Reducer(ABC):
+    """Reduces a sweep's chunks as they're evaluated.
+
+    Args:
+        by: Grid axes to keep, e.g. ``("pressure_altitude",)``. The reduction is
+            over every other axis.
+    """
+
+    def __init__(self, by: Sequence[str] = ()):
+        self.by = tuple(by)
+
+    def _start(self, axes: Dict[str, np.ndarray]) -> None:
+        for name in self.by:
+            if name not in axes:
+                raise ValueError(f"Can't reduce by {name!r}, which isn't in the grid.")
+
+        self._axes = axes
+        self._shape = tuple(len(axes[name]) for name in self.by)
+        self._size = int(np.prod(self._shape, dtype=np.int64))
+
+    def _group(self, indices: Dict[str, np.ndarray]) -> np.ndarray:
+        """Flat index into the kept axes of each point in a chunk."""
+        if not self.by:
+            return np.zeros_like(indices["kcas"])
+
+        return np.ravel_multi_index(
+            tuple(indices[name] for name in self.by), self._shape
+        )
+
+    @abstractmethod
+    def _update(
+        self, indices: Dict[str, np.ndarray], columns: List[np.ndarray]
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def _result(self):
+        pass
+
+
+@dataclass(frozen=True)
+class Extremum:
+    # The row (in ByKCASRowIndex order) at the extremum for each combination of
+    # the kept axes, or NaN if no point qualified.
+    rows: np.ndarray
+    # The value of every grid axis at each extremum (NaN if no point qualified).
+    coordinates: Dict[str, np.ndarray]
+
+
+class ArgMax(Reducer):
+    """Find the row where ``column`` is greatest, e.g. best MPG per altitude or
+    VY per weight.
+
+    Args:
+        column: The column to maximize.
+        by: Grid axes to keep.
+        where: Optionally, a function of the chunk's columns returning which
+            points qualify, e.g. ``lambda c: c[ByKCASRowIndex.RATE_OF_CLIMB] >= 0``
+            for speeds at which the airplane can hold altitude.
+    """
+
+    _sign = 1
+
+    def __init__(
+        self,
+        column: ByKCASRowIndex,
+        by: Sequence[str] = (),
+        where: Optional[Callable[[List[np.ndarray]], np.ndarray]] = None,
+    ):
+        super().__init__(by)
+        self.column = column
+        self.where = where
+
+    def _start(self, axes: Dict[str, np.ndarray]) -> None:
+        super()._start(axes)
+
+        dtype = next(iter(axes.values())).dtype
+        self._best = np.full(self._size, -np.inf, dtype=dtype)
+        self._rows = np.full((self._size, len(ByKCASRowIndex)), np.nan, dtype=dtype)
+        self._indices = {name: np.full(self._size, -1) for name in axes}
+
+    def _update(
+        self, indices: Dict[str, np.ndarray], columns: List[np.ndarray]
+    ) -> None:
+        values = self._sign * columns[self.column]
+        qualifies = ~np.isnan(values)
+        if self.where is not None:
+            qualifies &= self.where(columns)
+        values = np.where(qualifies, values, -np.inf)
+
+        group = self._group(indices)
+        chunk_best = np.full_like(self._best, -np.inf)
+        np.maximum.at(chunk_best, group, values)
+
+        # The first point in each group that attains the group's best value, if
+        # it beats the best from previous chunks.
+        (candidates,) = np.nonzero(
+            (chunk_best > self._best)[group] & (values == chunk_best[group])
+        )
+        groups, first = np.unique(group[candidates], return_index=True)
+        winners = candidates[first]
+
+        self._best[groups] = values[winners]
+        self._rows[groups] = np.stack([column[winners] for column in columns], -1)
+        for name, index in indices.items():
+            self._indices[name][groups] = index[winners]
+
+    def _result(self) -> Extremum:
+        found = self._best > -np.inf
+        coordinates = {}
+
+        for name, index in self._indices.items():
+            coordinate = np.full(self._size, np.nan, dtype=self._rows.dtype)
+            coordinate[found] = self._axes[name][index[found]]
+            coordinates[name] = coordinate.reshape(self._shape)
+
+        return Extremum(
+            self._rows.reshape(self._shape + (len(ByKCASRowIndex),)), coordinates
+        )
+
+
+class ArgMin(ArgMax):
+    """Find the row where ``column`` is least, e.g. minimum fuel flow per knot
+    per weight. See ``ArgMax``."""
+
+    _sign = -1
+
+
+class Ceiling(Reducer):
+    """Find the pressure altitude at which the best rate of climb (over every
+    reduced axis, e.g. KCAS and RPM) falls to ``rate_of_climb``, e.g. the service
+    ceiling per ISA deviation.
+
+    The ceiling is interpolated linearly between the grid's altitudes, and is
+    NaN where the grid's altitudes don't bracket it.
+
+    Args:
+        by: Grid axes to keep, besides pressure altitude.
+        rate_of_climb: 100 ft/min for the service ceiling, or 0 for the absolute
+            ceiling.
+    """
+
+    def __init__(self, by: Sequence[str] = (), rate_of_climb: float = 100):
+        if "pressure_altitude" in by:
+            raise ValueError("A ceiling is already reduced by pressure altitude.")
+
+        super().__init__(tuple(by) + ("pressure_altitude",))
+        self.rate_of_climb = rate_of_climb
+
+    def _start(self, axes: Dict[str, np.ndarray]) -> None:
+        super()._start(axes)
+
+        self._best = np.full(self._size, -np.inf, dtype=axes["kcas"].dtype)
+
+    def _update(
+        self, indices: Dict[str, np.ndarray], columns: List[np.ndarray]
+    ) -> None:
+        roc = columns[ByKCASRowIndex.RATE_OF_CLIMB]
+        np.maximum.at(
+            self._best, self._group(indices), np.where(np.isnan(roc), -np.inf, roc)
+        )
+
+    def _result(self) -> np.ndarray:
+        pressure_altitudes = self._axes["pressure_altitude"]
+        order = np.argsort(pressure_altitudes)
+        altitudes = pressure_altitudes[order]
+        best = self._best.reshape(self._shape)[..., order]
+
+        climbs = best >= self.rate_of_climb
+        # The last altitude at which the airplane still climbs, before the first
+        # at which it doesn't.
+        stops = np.argmin(climbs, axis=-1)
+        bracketed = climbs[..., 0] & ~climbs.all(axis=-1)
+        i = np.maximum(stops - 1, 0)[..., np.newaxis]
+
+        roc0 = np.take_along_axis(best, i, -1)[..., 0]
+        roc1 = np.take_along_axis(best, i + 1, -1)[..., 0]
+        h0 = altitudes[i[..., 0]]
+        h1 = altitudes[np.minimum(i[..., 0] + 1, len(altitudes) - 1)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ceiling = h0 + (roc0 - self.rate_of_climb) / (roc0 - roc1) * (h1 - h0)
+
+        return np.where(bracketed, ceiling, np.nan)
+
+
+def sweep(
+    dataplate: DataPlate,
+    mixture: Mixture,
+    grid: Dict[str, npt.ArrayLike],
+    reducers: Sequence[Reducer],
+    memory_budget: int = 256 * 2**20,
+    dtype: npt.DTypeLike = np.float64,
+    propeller_efficiency_mode: str = "exact",
+) -> List:
+    """Evaluate every point of a grid of operating conditions, in chunks that fit
+    ``memory_budget`` bytes, and reduce the results.
+
+    Args:
+        dataplate: The airplane.
+        mixture: The mixture setting, at every point of the grid.
+        grid: The values of each axis (see ``GRID_AXES``), e.g.
+            ``{"gross_aircraft_weight": [2500, 3000], "pressure_altitude":
+            np.arange(0, 20000, 500), "engine_rpm": [2300, 2500, 2700], "kcas":
+            np.arange(60, 180, 0.5)}``.
+        reducers: What to compute over the grid.
+        memory_budget: Roughly how many bytes evaluating a chunk may allocate.
+        dtype: The precision to evaluate the grid at (e.g., ``np.float32``).
+        propeller_efficiency_mode: ``"surface"`` interpolates η from a cached
+            surface, which is faster over large grids (see
+            ``propeller_efficiency``).
+
+    Returns:
+        Each reducer's result, in order.
+    """
+    axes = _grid_axes(grid, np.dtype(dtype))
+
+    for reducer in reducers:
+        reducer._start(axes)
+
+    for indices, columns in _chunks(
+        dataplate, mixture, axes, memory_budget, propeller_efficiency_mode
+    ):
+        for reducer in reducers:
+            reducer._update(indices, columns)
+        # Let go of this chunk before the next one is evaluated, so that only one
+        # is ever held at a time.
+        del indices, columns
+
+    return [reducer._result() for reducer in reducers]
+
+
+def _chunks(
+    dataplate: DataPlate,
+    mixture: Mixture,
+    axes: Dict[str, np.ndarray],
+    memory_budget: int,
+    propeller_efficiency_mode: str = "exact",
+) -> Iterator[Tuple[Dict[str, np.ndarray], List[np.ndarray]]]:
+    """Evaluate a grid in chunks of at most ``memory_budget`` bytes, yielding
+    each chunk's grid indices and columns."""
+    shape = tuple(len(axis) for axis in axes.values())
+    size = int(np.prod(shape, dtype=np.int64))
+    bytes_per_point = (
+        _ITEMS_PER_POINT * axes["kcas"].dtype.itemsize
+        + _INDICES_PER_POINT * np.dtype(np.intp).itemsize
+    )
+    chunk_size = max(1, memory_budget // bytes_per_point)
+
+    for start in range(0, size, chunk_size):
+        indices = dict(
+            zip(
+                axes,
+                np.unravel_index(
+                    np.arange(start, min(start + chunk_size, size)), shape
+                ),
+            )
+        )
+
+        yield indices, _evaluate(
+            dataplate,
+            mixture,
+            {name: axes[name][index] for name, index in indices.items()},
+            propeller_efficiency_mode,
+        )
+
+
+def _evaluate(
+    dataplate: DataPlate,
+    mixture: Mixture,
+    values: Dict[str, np.ndarray],
+    propeller_efficiency_mode: str = "exact",
+) -> List[np.ndarray]:
+    return _scatter_columns(
+        dataplate,
+        mixture,
+        values["gross_aircraft_weight"],
+        values["pressure_altitude"],
+        values["engine_rpm"],
+        values["kcas"],
+        power=values.get("power"),
+        oat_f=values.get("oat_f"),
+        isa_diff=values.get("isa_diff", 0),
+        propeller_efficiency_mode=propeller_efficiency_mode,
+    )
+
+
+class SharedGrid:
+    """Columns of every point of a grid of operating conditions, in shared memory.
+
+    ``data`` has one axis per grid axis, in ``GRID_AXES`` order, and a last axis
+    of ``columns``. It's a view of a shared memory block that's freed when the
+    grid is closed (or its ``with`` block exits), so copy anything needed after
+    that.
+    """
+
+    def __init__(self, axes: Dict[str, np.ndarray], columns: Sequence[ByKCASRowIndex]):
+        self.axes = axes
+        self.columns = tuple(columns)
+
+        dtype = axes["kcas"].dtype
+        shape = tuple(len(axis) for axis in axes.values()) + (len(self.columns),)
+        self._shared_memory = shared_memory.SharedMemory(
+            create=True,
+            size=max(1, int(np.prod(shape, dtype=np.int64)) * dtype.itemsize),
+        )
+        self.data = np.ndarray(shape, dtype, buffer=self._shared_memory.buf)
+
+    def close(self) -> None:
+        if self._shared_memory is None:
+            return
+
+        # The block can't be closed while an array still refers to it.
+        self.data = None
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+        self._shared_memory = None
+
+    def __enter__(self) -> "SharedGrid":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _evaluate_partition(
+    dataplate: DataPlate,
+    mixture: Mixture,
+    axes: Dict[str, np.ndarray],
+    columns: Tuple[ByKCASRowIndex, ...],
+    partition: str,
+    start: int,
+    stop: int,
+    name: str,
+    shape: Tuple[int, ...],
+    memory_budget: int,
+    propeller_efficiency_mode: str = "exact",
+) -> None:
+    """Evaluate the ``start:stop`` slice of a grid along its ``partition`` axis,
+    writing the result into the shared memory block ``name``."""
+    block = shared_memory.SharedMemory(name=name)
+
+    try:
+        data = np.ndarray(shape, axes["kcas"].dtype, buffer=block.buf)
+        partition_axes = dict(axes, **{partition: axes[partition][start:stop]})
+
+        for indices, chunk in _chunks(
+            dataplate,
+            mixture,
+            partition_axes,
+            memory_budget,
+            propeller_efficiency_mode,
+        ):
+            indices[partition] = indices[partition] + start
+            data[tuple(indices.values())] = np.stack(
+                [chunk[column] for column in columns], -1
+            )
+            del indices, chunk
+
+        del data
+    finally:
+        block.close()
+
+
+def parallel_grid(
+    dataplate: DataPlate,
+    mixture: Mixture,
+    grid: Dict[str, npt.ArrayLike],
+    columns: Sequence[ByKCASRowIndex] = tuple(ByKCASRowIndex),
+    partition: str = "pressure_altitude",
+    processes: Optional[int] = None,
+    memory_budget: int = 256 * 2**20,
+    dtype: npt.DTypeLike = np.float64,
+    propeller_efficiency_mode: str = "exact",
+) -> SharedGrid:
+    """Evaluate every point of a grid of operating conditions across worker
+    processes.
+
+    The grid is split into contiguous slices along the ``partition`` axis (e.g.,
+    pressure altitude or gross aircraft weight), and each worker writes its
+    slices straight into a shared memory block owned by the caller, so results
+    are never pickled back. Use the result as a context manager::
+
+        with parallel_grid(N51SW, Mixture.BEST_POWER, grid) as result:
+            vy = result.data[..., 0].argmax(axis=-1)
+
+    Args:
+        dataplate: The airplane.
+        mixture: The mixture setting, at every point of the grid.
+        grid: The values of each axis (see ``sweep``).
+        columns: The columns to keep, e.g. only rate of climb and GPH.
+        partition: The grid axis to split the work along.
+        processes: The number of worker processes (by default, one per CPU). With
+            one, the grid is evaluated in this process.
+        memory_budget: Roughly how many bytes each worker may allocate at once,
+            besides the result.
+        dtype: The precision to evaluate the grid at (e.g., ``np.float32``).
+        propeller_efficiency_mode: As for ``sweep``.
+    """
+    axes = _grid_axes(grid, np.dtype(dtype))
+    if partition not in axes:
+        raise ValueError(
+            f"Can't partition along {partition!r}, which isn't in the grid."
+        )
+
+    processes = processes or os.cpu_count() or 1
+    result = SharedGrid(axes, columns)
+
+    try:
+        # A few slices per process keeps every process busy to the end, even
+        # when some slices (e.g., at high altitude) are cheaper than others.
+        slices = [
+            (indices[0], indices[-1] + 1)
+            for indices in np.array_split(
+                np.arange(len(axes[partition])),
+                min(len(axes[partition]), processes * 4),
+            )
+        ]
+        arguments = (
+            dataplate,
+            mixture,
+            axes,
+            result.columns,
+            partition,
+        )
+        location = (
+            result._shared_memory.name,
+            result.data.shape,
+            memory_budget,
+            propeller_efficiency_mode,
+        )
+
+        if processes == 1:
+            for start, stop in slices:
+                _evaluate_partition(*arguments, start, stop, *location)
+        else:
+            with ProcessPoolExecutor(processes) as executor:
+                for future in [
+                    executor.submit(
+                        _evaluate_partition, *arguments, start, stop, *location
+                    )
+                    for start, stop in slices
+                ]:
+                    future.result()
+    except BaseException:
+        result.close()
+        raise
+
+    return result
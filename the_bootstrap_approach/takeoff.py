@@ -0,0 +1,344 @@
+"""Takeoff and landing distances.
+
+Every function here broadcasts over its pressure altitude, OAT°F, gross aircraft
+weight, headwind, and runway slope arguments, so a whole takeoff chart (e.g.,
+thousands of cases) takes a single call. Each equation of motion is integrated
+with a fixed number of steps, in airspeed on the ground and in energy height in
+the air, so that every case advances in lockstep as one array.
+
+Thrust comes from the bootstrap propeller model and drag from :math:`G` and
+:math:`H`, as in ``performance``. On the ground, lift (and so induced drag) is
+that of the wing at its ground attitude, set by ``ground_lift_coefficient``,
+and the rest of the weight rests on the wheels. The propeller chart doesn't
+extend down to static conditions, where its thrust falls off spuriously, so
+below ``minimum_thrust_ktas`` thrust is held at its value there. Real static
+thrust is a little higher, so this errs on the long side.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from the_bootstrap_approach.conditions import Conditions, FullThrottleConditions
+from the_bootstrap_approach.dataplate import DataPlate
+from the_bootstrap_approach.equations import (
+    kn_to_fts,
+    power_adjustment_factor_x,
+    power_available,
+    power_required,
+    propeller_advance_ratio,
+    propeller_power_coefficient,
+    sdef_t,
+    tas,
+)
+from the_bootstrap_approach.mixture import Mixture
+from the_bootstrap_approach.propeller_chart import propeller_efficiency
+
+# Standard acceleration of gravity (ft/s^2).
+_GRAVITY = 32.174
+
+
+@dataclass(frozen=True)
+class TakeoffDistances:
+    """Takeoff distances in feet, NaN where the airplane can't accelerate or
+    climb."""
+
+    # From brake release to lift-off, including rotation.
+    ground_roll: npt.NDArray[np.float64]
+    # From lift-off to 50 ft above the runway.
+    air_distance: npt.NDArray[np.float64]
+    # From brake release to 50 ft above the runway.
+    total: npt.NDArray[np.float64]
+    # KTAS at lift-off.
+    lift_off_ktas: npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class LandingDistances:
+    """Landing distances in feet."""
+
+    # From 50 ft above the runway to touchdown.
+    air_distance: npt.NDArray[np.float64]
+    # From touchdown to a stop.
+    ground_roll: npt.NDArray[np.float64]
+    # From 50 ft above the runway to a stop.
+    total: npt.NDArray[np.float64]
+
+
+def _thrust(dataplate: DataPlate, conditions: Conditions, vt, minimum_vt):
+    vt = np.maximum(vt, minimum_vt)
+    eta = propeller_efficiency(
+        sdef_t(dataplate.z_ratio),
+        propeller_advance_ratio(
+            vt, conditions.propeller_rps, dataplate.propeller_diameter
+        ),
+        propeller_power_coefficient(
+            conditions.power,
+            conditions.atmospheric_density,
+            conditions.propeller_rps,
+            dataplate.propeller_diameter,
+        ),
+        power_adjustment_factor_x(dataplate.total_activity_factor),
+        propeller_map=dataplate.propeller_map,
+    )
+
+    return power_available(eta, conditions.power) / vt
+
+
+def _ground_acceleration(
+    dataplate: DataPlate,
+    conditions: Conditions,
+    vt,
+    thrust,
+    friction_coefficient,
+    runway_slope,
+    ground_lift_coefficient,
+):
+    # Signed dynamic pressure, so that a tailwind's negative airspeed at brake
+    # release pushes the airplane along rather than holding it back.
+    q = 0.5 * conditions.atmospheric_density * vt * np.abs(vt)
+    lift = ground_lift_coefficient * q * dataplate.reference_wing_area
+    weight = conditions.gross_aircraft_weight
+
+    # Induced drag scales with the square of lift, which H assumes equals weight.
+    drag = conditions.g * vt * np.abs(vt) + conditions.h * (lift / weight) ** 2 / (
+        vt**2 + np.finfo(float).tiny
+    )
+    grade = runway_slope / np.sqrt(1 + runway_slope**2)
+
+    return (
+        _GRAVITY
+        * (
+            thrust
+            - drag
+            - friction_coefficient * np.maximum(weight - lift, 0)
+            - weight * grade
+        )
+        / weight
+    )
+
+
+def _cases(*values: npt.ArrayLike):
+    return np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+
+
+def _fractions(steps: int, ndim: int) -> np.ndarray:
+    # Fractions of the way through a segment, along a new first (step) axis.
+    return np.linspace(0, 1, steps + 1).reshape((-1,) + (1,) * ndim)
+
+
+def _results(*values):
+    # Like the equations, return scalars rather than 0-d arrays for one case.
+    return (np.asarray(value)[()] for value in values)
+
+
+def _integrate(y, dx):
+    # The trapezoidal rule along the first (step) axis.
+    return dx * (y[0] / 2 + y[1:-1].sum(axis=0) + y[-1] / 2)
+
+
+def takeoff_distances(
+    dataplate: DataPlate,
+    pressure_altitude: npt.ArrayLike,
+    oat_f: npt.ArrayLike,
+    gross_aircraft_weight: npt.ArrayLike,
+    rotation_kcas: npt.ArrayLike,
+    obstacle_kcas: npt.ArrayLike,
+    headwind: npt.ArrayLike = 0,
+    runway_slope: npt.ArrayLike = 0,
+    mixture: Mixture = Mixture.FULL_RICH,
+    engine_rpm: float = 2400,
+    rotation_time: float = 2,
+    rolling_friction_coefficient: float = 0.04,
+    ground_lift_coefficient: float = 0.3,
+    minimum_thrust_ktas: float = 20,
+    steps: int = 64,
+) -> TakeoffDistances:
+    """Integrate a full-throttle takeoff to 50 ft above the runway.
+
+    The airplane accelerates on the ground to ``rotation_kcas``, keeps
+    accelerating for ``rotation_time`` seconds as it rotates, lifts off, and
+    then climbs to 50 ft while its speed changes steadily to ``obstacle_kcas``.
+
+    Args:
+        headwind: Headwind component (kn); negative for a tailwind.
+        runway_slope: Runway gradient, rise over run; positive uphill.
+        rolling_friction_coefficient: About 0.04 on dry pavement, 0.05 on short
+            grass, and 0.10 on long grass.
+        ground_lift_coefficient: :math:`C_L` at ground attitude.
+        steps: Integration steps per segment. The default resolves distances to
+            better than 1 ft.
+    """
+    (
+        pressure_altitude,
+        oat_f,
+        gross_aircraft_weight,
+        rotation_kcas,
+        obstacle_kcas,
+        headwind,
+        runway_slope,
+    ) = _cases(
+        pressure_altitude,
+        oat_f,
+        gross_aircraft_weight,
+        rotation_kcas,
+        obstacle_kcas,
+        headwind,
+        runway_slope,
+    )
+    conditions = FullThrottleConditions(
+        dataplate, gross_aircraft_weight, pressure_altitude, oat_f, mixture, engine_rpm
+    )
+    sigma = conditions.relative_atmospheric_density
+
+    wind_vt = kn_to_fts(headwind)
+    rotation_vt = kn_to_fts(tas(rotation_kcas, sigma))
+    obstacle_vt = kn_to_fts(tas(obstacle_kcas, sigma))
+    minimum_vt = kn_to_fts(minimum_thrust_ktas)
+
+    def acceleration(vt):
+        return _ground_acceleration(
+            dataplate,
+            conditions,
+            vt,
+            _thrust(dataplate, conditions, vt, minimum_vt),
+            rolling_friction_coefficient,
+            runway_slope,
+            ground_lift_coefficient,
+        )
+
+    # The ground roll, in steps of airspeed from the wind's (the airplane is at
+    # rest) to rotation speed: ds = (V - V_w) dV / a.
+    fraction = _fractions(steps, sigma.ndim)
+    vt = wind_vt + (rotation_vt - wind_vt) * fraction
+    a = acceleration(vt)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ground_roll = np.where(
+            (a > 0).all(axis=0),
+            _integrate((vt - wind_vt) / a, (rotation_vt - wind_vt) / steps),
+            np.nan,
+        )
+
+    # Rotation, at the acceleration at rotation speed.
+    a = acceleration(rotation_vt)
+    ground_roll = (
+        ground_roll + (rotation_vt - wind_vt) * rotation_time + a * rotation_time**2 / 2
+    )
+    lift_off_vt = rotation_vt + a * rotation_time
+
+    # The climb to 50 ft, in steps of energy height E = h + V^2/2g, which rises at
+    # the specific excess power P_s = (T - D)V/W: dx = (V - V_w) dE / P_s.
+    start = lift_off_vt**2 / (2 * _GRAVITY)
+    stop = 50 + obstacle_vt**2 / (2 * _GRAVITY)
+    vt = lift_off_vt + (obstacle_vt - lift_off_vt) * fraction
+    excess_power = (
+        _thrust(dataplate, conditions, vt, minimum_vt) * vt
+        - power_required(conditions.g, conditions.h, vt)
+    ) / gross_aircraft_weight
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        air_distance = np.where(
+            (excess_power > 0).all(axis=0) & (stop > start),
+            _integrate((vt - wind_vt) / excess_power, (stop - start) / steps),
+            np.nan,
+        )
+
+    return TakeoffDistances(
+        *_results(
+            ground_roll,
+            air_distance,
+            ground_roll + air_distance,
+            lift_off_vt / kn_to_fts(1),
+        )
+    )
+
+
+def landing_distances(
+    dataplate: DataPlate,
+    pressure_altitude: npt.ArrayLike,
+    oat_f: npt.ArrayLike,
+    gross_aircraft_weight: npt.ArrayLike,
+    touchdown_kcas: npt.ArrayLike,
+    headwind: npt.ArrayLike = 0,
+    runway_slope: npt.ArrayLike = 0,
+    approach_angle: float = 3,
+    braking_friction_coefficient: float = 0.3,
+    ground_lift_coefficient: float = 0.3,
+    steps: int = 64,
+) -> LandingDistances:
+    """Integrate a landing from 50 ft above the runway to a stop.
+
+    The airplane descends along an ``approach_angle``° (air-mass) glide path to
+    touch down at ``touchdown_kcas``, then brakes to a stop at idle, whose
+    thrust is neglected.
+
+    Args:
+        headwind: Headwind component (kn); negative for a tailwind.
+        runway_slope: Runway gradient, rise over run; positive uphill.
+        braking_friction_coefficient: About 0.3 with moderate braking on dry
+            pavement.
+    """
+    (
+        pressure_altitude,
+        oat_f,
+        gross_aircraft_weight,
+        touchdown_kcas,
+        headwind,
+        runway_slope,
+    ) = _cases(
+        pressure_altitude,
+        oat_f,
+        gross_aircraft_weight,
+        touchdown_kcas,
+        headwind,
+        runway_slope,
+    )
+    # The engine's conditions don't matter at idle, but G and H do.
+    conditions = FullThrottleConditions(
+        dataplate,
+        gross_aircraft_weight,
+        pressure_altitude,
+        oat_f,
+        Mixture.FULL_RICH,
+        dataplate.rated_full_throttle_engine_rpm,
+    )
+
+    wind_vt = kn_to_fts(headwind)
+    touchdown_vt = kn_to_fts(
+        tas(touchdown_kcas, conditions.relative_atmospheric_density)
+    )
+
+    # The wind stretches or shrinks the glide path over the ground.
+    air_distance = (
+        50
+        / math.tan(math.radians(approach_angle))
+        * (touchdown_vt - wind_vt)
+        / touchdown_vt
+    )
+
+    # The ground roll, in steps of airspeed from touchdown down to the wind's.
+    fraction = _fractions(steps, touchdown_vt.ndim)
+    vt = touchdown_vt + (wind_vt - touchdown_vt) * fraction
+    a = _ground_acceleration(
+        dataplate,
+        conditions,
+        vt,
+        0,
+        braking_friction_coefficient,
+        runway_slope,
+        ground_lift_coefficient,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ground_roll = np.where(
+            (a < 0).all(axis=0),
+            _integrate((vt - wind_vt) / a, (wind_vt - touchdown_vt) / steps),
+            np.nan,
+        )
+
+    return LandingDistances(
+        *_results(air_distance, ground_roll, air_distance + ground_roll)
+    )